@@ -15,7 +15,7 @@ from .mixer import (
     MixerSendConfig,
     MixerSubgroup,
 )
-from .metrics import integrated_lufs, rms_dbfs, rms_per_channel
+from .metrics import bucketed_loudness, integrated_lufs, loudness_snapshot, rms_dbfs, rms_per_channel
 from .modules import AmplitudeEnvelope, ClipSampler, OnePoleLowPass, SineOscillator
 from .tracker_bridge import (
     MixerPlaybackSnapshot,
@@ -44,7 +44,9 @@ __all__ = [
     "SineOscillator",
     "SoftKneeCompressorInsert",
     "ThreeBandEqInsert",
+    "bucketed_loudness",
     "integrated_lufs",
+    "loudness_snapshot",
     "rms_dbfs",
     "rms_per_channel",
 ]
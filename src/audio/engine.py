@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import heapq
-from typing import Dict, Iterable, Iterator, List, MutableMapping, Optional
+from typing import Dict, Iterable, Iterator, List, MutableMapping, Optional, Sequence
 
 import numpy as np
 
@@ -79,6 +79,14 @@ class AutomationTimeline:
     def schedule(self, event: AutomationEvent) -> None:
         heapq.heappush(self._events, event)
 
+    def schedule_many(self, events: Iterable[AutomationEvent]) -> None:
+        """Schedule *events* in order, as if :meth:`schedule` were called for each."""
+
+        queue = self._events
+        push = heapq.heappush
+        for event in events:
+            push(queue, event)
+
     def schedule_in_beats(
         self,
         *,
@@ -128,6 +136,11 @@ class BaseAudioModule:
             raise KeyError(f"Unknown parameter '{name}' for module {self.name}")
         return self._values[name]
 
+    def get_parameter_spec(self, name: str) -> ParameterSpec | None:
+        """Return the spec registered for *name*, or ``None`` if unknown."""
+
+        return self._specs.get(name)
+
     def describe_parameters(self) -> List[ParameterSpec]:
         return list(self._specs.values())
 
@@ -198,6 +211,44 @@ class OfflineAudioEngine:
             )
         )
 
+    def schedule_parameter_changes(
+        self,
+        modules: Sequence[str],
+        parameters: Sequence[str],
+        *,
+        beats: Sequence[float],
+        values: Sequence[float | None],
+        sources: Sequence[str],
+    ) -> None:
+        """Schedule parallel columns of beat-timed changes in one submission.
+
+        Equivalent to calling :meth:`schedule_parameter_change` with ``beats``
+        for each row in order, but every module is validated once and all
+        beat positions are converted to seconds in a single NumPy pass.
+        """
+
+        count = len(beats)
+        if not len(modules) == len(parameters) == len(values) == len(sources) == count:
+            raise ValueError("Parameter change columns must have the same length")
+        for module in dict.fromkeys(modules):
+            if module not in self._modules:
+                raise KeyError(f"Unknown module '{module}'")
+        # Same product as ``TempoMap.beats_to_seconds``, applied to the whole column.
+        seconds_per_beat = 60.0 / self.tempo.tempo_bpm
+        seconds = (seconds_per_beat * np.asarray(beats, dtype=np.float64)).tolist()
+        self.timeline.schedule_many(
+            AutomationEvent(
+                time_seconds=time_seconds,
+                module=module,
+                parameter=parameter,
+                value=value,
+                source=source or f"beats@{beat}",
+            )
+            for time_seconds, module, parameter, beat, value, source in zip(
+                seconds, modules, parameters, beats, values, sources, strict=True
+            )
+        )
+
     def render(self, duration_seconds: float) -> np.ndarray:
         if self._output_module is None:
             raise RuntimeError("No output module configured")
@@ -26,7 +26,10 @@ def rms_per_channel(buffer: np.ndarray) -> np.ndarray:
 def rms_dbfs(buffer: np.ndarray, *, reference: float = 1.0) -> np.ndarray:
     """Convert channel RMS values to dBFS relative to *reference* amplitude."""
 
-    rms = rms_per_channel(buffer)
+    return _rms_to_dbfs(rms_per_channel(buffer), reference)
+
+
+def _rms_to_dbfs(rms: np.ndarray, reference: float) -> np.ndarray:
     reference = max(reference, 1e-9)
     with np.errstate(divide="ignore"):
         db = 20.0 * np.log10(np.maximum(rms, 1e-9) / reference)
@@ -47,7 +50,94 @@ def integrated_lufs(buffer: np.ndarray, *, sample_rate: int) -> float:
         return float("-inf")
     if buffer.ndim == 1:
         buffer = buffer[:, None]
+    return _lufs_from_frames(buffer, sample_rate)
+
+
+def loudness_snapshot(
+    buffer: np.ndarray,
+    *,
+    sample_rate: int,
+    reference: float = 1.0,
+) -> tuple[np.ndarray, float]:
+    """Return ``(rms_dbfs, integrated_lufs)`` for *buffer* in one call.
+
+    Dashboards that bucket a render by beat need both readings for every
+    slice. Sharing the channel layout and power reductions keeps each slice
+    to a single walk over the samples before the K-weighting pass.
+    """
+
+    if buffer.size == 0:
+        return rms_dbfs(buffer, reference=reference), float("-inf")
+    if buffer.ndim == 1:
+        buffer = buffer[:, None]
+    squared = np.square(buffer, dtype=np.float32)
+    rms = np.sqrt(np.mean(squared, axis=0), dtype=np.float32)
+    return _rms_to_dbfs(rms, reference), _lufs_from_frames(buffer, sample_rate)
+
+
+def bucketed_loudness(
+    buffer: np.ndarray,
+    *,
+    sample_rate: int,
+    frames_per_bucket: int,
+    reference: float = 1.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return per-bucket ``(rms_dbfs, integrated_lufs)`` for *buffer*.
+
+    Each bucket of ``frames_per_bucket`` frames is measured exactly as
+    :func:`loudness_snapshot` would measure the slice on its own, including
+    a fresh K-weighting state, but whole buckets are stacked and filtered
+    together so the biquads walk one bucket's worth of frames rather than
+    the full render. A shorter tail bucket is measured separately. The
+    results have shapes ``(buckets, channels)`` and ``(buckets,)``.
+    """
 
+    if frames_per_bucket <= 0:
+        raise ValueError("frames_per_bucket must be positive")
+    if buffer.ndim == 1:
+        buffer = buffer[:, None]
+    total_frames, channels = buffer.shape
+    full_buckets = total_frames // frames_per_bucket
+    tail_frames = total_frames - full_buckets * frames_per_bucket
+    bucket_count = full_buckets + (1 if tail_frames else 0)
+    rms_db = np.empty((bucket_count, channels), dtype=np.float32)
+    lufs = np.empty(bucket_count, dtype=np.float64)
+
+    if full_buckets:
+        # (frames, buckets, channels) so the filters iterate over frames while
+        # every bucket keeps its own state.
+        stacked = buffer[: full_buckets * frames_per_bucket].reshape(
+            full_buckets, frames_per_bucket, channels
+        )
+        squared = np.square(stacked, dtype=np.float32)
+        rms = np.sqrt(np.mean(squared, axis=1), dtype=np.float32)
+        rms_db[:full_buckets] = _rms_to_dbfs(rms, reference)
+        # Digital silence stays silent through the filters, so only buckets
+        # with any signal pay for the K-weighting pass.
+        lufs[:full_buckets] = float("-inf")
+        audible = np.any(stacked, axis=(1, 2))
+        if audible.any():
+            weighted = _apply_k_weighting(stacked[audible].transpose(1, 0, 2), sample_rate)
+            mean_power = np.mean(np.mean(np.square(weighted), axis=0), axis=1)
+            with np.errstate(divide="ignore"):
+                levels = -0.691 + 10.0 * np.log10(mean_power.astype(np.float64))
+            lufs[:full_buckets][audible] = np.where(mean_power > 0.0, levels, float("-inf"))
+
+    if tail_frames:
+        tail_db, tail_lufs = loudness_snapshot(
+            buffer[full_buckets * frames_per_bucket :],
+            sample_rate=sample_rate,
+            reference=reference,
+        )
+        rms_db[full_buckets] = tail_db
+        lufs[full_buckets] = tail_lufs
+    return rms_db, lufs
+
+
+def _lufs_from_frames(buffer: np.ndarray, sample_rate: int) -> float:
+    if not np.any(buffer):
+        # All-zero input filters to all zeros; skip the biquad passes.
+        return float("-inf")
     weighted = _apply_k_weighting(buffer, sample_rate)
     power = np.mean(np.square(weighted), axis=0)
     mean_power = float(np.mean(power))
@@ -86,18 +176,31 @@ def _biquad_filter(
     a1: float,
     a2: float,
 ) -> np.ndarray:
-    """Lightweight biquad implementation for offline analysis."""
+    """Lightweight biquad implementation for offline analysis.
+
+    Filters along the first axis; any trailing axes are independent signals
+    with their own state.
+    """
 
+    # Normalise the coefficients once instead of on every frame.
+    b0, b1, b2 = b0 / a0, b1 / a0, b2 / a0
+    a1, a2 = a1 / a0, a2 / a0
     output = np.zeros_like(buffer)
-    z1 = np.zeros(buffer.shape[1], dtype=np.float32)
-    z2 = np.zeros(buffer.shape[1], dtype=np.float32)
+    z1 = np.zeros(buffer.shape[1:], dtype=np.float32)
+    z2 = np.zeros(buffer.shape[1:], dtype=np.float32)
     for idx, frame in enumerate(buffer):
-        y = (b0 / a0) * frame + z1
-        z1_new = (b1 / a0) * frame + z2 - (a1 / a0) * y
-        z2 = (b2 / a0) * frame - (a2 / a0) * y
+        y = b0 * frame + z1
+        z1_new = b1 * frame + z2 - a1 * y
+        z2 = b2 * frame - a2 * y
         output[idx] = y
         z1 = z1_new
     return output
 
 
-__all__ = ["integrated_lufs", "rms_dbfs", "rms_per_channel"]
+__all__ = [
+    "bucketed_loudness",
+    "integrated_lufs",
+    "loudness_snapshot",
+    "rms_dbfs",
+    "rms_per_channel",
+]
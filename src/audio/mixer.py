@@ -610,15 +610,25 @@ class MixerGraph:
         self._automation_events.append(event)
         self._timeline.schedule(event)
 
+    def schedule_parameter_changes(self, events: Iterable[AutomationEvent]) -> None:
+        """Schedule a batch of prepared automation events in one call.
+
+        Events keep the order they are given in, matching repeated
+        :meth:`schedule_parameter_change` calls.
+        """
+
+        batch = list(events)
+        self._automation_events.extend(batch)
+        self._timeline.schedule_many(batch)
+
     def _apply_automation_event(self, event: AutomationEvent) -> None:
         module = event.module
         if not module.startswith("mixer:"):
             return
-        parts = module.split(":", 2)
-        if len(parts) < 3:
+        _, _, address = module.partition(":")
+        scope, separator, target = address.partition(":")
+        if not separator:
             return
-        scope = parts[1]
-        target = parts[2]
         value = event.value
         if scope == "channel":
             channel = self._channels.get(target)
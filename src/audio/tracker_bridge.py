@@ -1,14 +1,27 @@
 """Helpers that translate tracker patterns into offline engine renders."""
 from __future__ import annotations
 
+import hashlib
 import math
+import os
+import re
+import sys
 from contextlib import contextmanager
-from dataclasses import dataclass
+from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from typing import Callable, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Sequence
 
 import numpy as np
 
-from domain.models import AutomationPoint, InstrumentDefinition, Pattern, PatternStep
+from domain.models import (
+    AutomationPoint,
+    InstrumentDefinition,
+    InstrumentModule,
+    Pattern,
+    PatternStep,
+)
 
 from .engine import (
     AutomationEvent,
@@ -19,7 +32,7 @@ from .engine import (
     TempoMap,
 )
 from .mixer import MeterReading, MixerGraph
-from .metrics import integrated_lufs, rms_dbfs
+from .metrics import bucketed_loudness
 from .modules import (
     AmplitudeEnvelope,
     ClipSampler,
@@ -28,6 +41,18 @@ from .modules import (
     SineOscillator,
 )
 
+# Parameter names written for every triggered step. Literal names are
+# already interned by the compiler; keeping them in one place means log
+# entries and engine events share the same string objects as module ids.
+_PARAM_GATE = "gate"
+_PARAM_VELOCITY = "velocity"
+_PARAM_TRANSPOSE = "transpose_semitones"
+_PARAM_RETRIGGER = "retrigger"
+
+# Engine event sources for step changes when ``debug_sources`` is off.
+_STEP_GATE_SOURCES = ("pattern_step_on", "pattern_step_off")
+_STEP_SAMPLER_SOURCES = ("pattern_step_velocity", "pattern_step_transpose", "pattern_step_trigger")
+
 _SAMPLER_FAMILY_PROFILES: list[tuple[set[str], dict[str, float]]] = [
     (
         {"string", "strings", "pad", "pads", "string_section"},
@@ -52,7 +77,475 @@ _SAMPLER_FAMILY_PROFILES: list[tuple[set[str], dict[str, float]]] = [
 ]
 
 
-@dataclass
+def _smoothing_ramp(
+    start_beat: float,
+    window_beats: float,
+    previous_value: float,
+    target_value: float,
+    segments: int,
+) -> tuple[List[float], List[float]]:
+    """Return beat positions and values for a linear smoothing ramp.
+
+    The ramp is evaluated as one array expression rather than a Python loop
+    per segment; results are handed back as plain floats for scheduling.
+    """
+
+    steps = np.arange(segments, dtype=np.float64)
+    beats = start_beat + (window_beats / (segments - 1)) * steps
+    values = previous_value + (target_value - previous_value) * (steps / (segments - 1))
+    return beats.tolist(), values.tolist()
+
+
+# One ``key`` or ``key=payload`` option per ``|``-separated lane token. The
+# lookbehind pins matches to token starts so stray words inside a token are
+# ignored rather than read as options.
+_LANE_TOKEN_RE = re.compile(r"(?:^|(?<=\|))\s*([a-z_]+)(?:=([^|]*)|\s*)(?=\||$)")
+
+
+_LANE_MODE_ALIASES: dict[str, str] = {
+    "normalized": "normalized",
+    "normalised": "normalized",
+    "raw": "raw",
+    "absolute": "raw",
+    "percent": "percent",
+    "percentage": "percent",
+}
+
+
+def _parse_float(value: object, *, minimum: float | None = None) -> float | None:
+    """Return *value* as a float, raised to *minimum* if given, or ``None`` if invalid."""
+
+    if value is None:
+        return None
+    try:
+        number = float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+    if minimum is not None:
+        return max(minimum, number)
+    return number
+
+
+# Smoothing window suffixes in match order, with the metadata key they set
+# and the divisor that converts the number into that key's unit.
+_SMOOTH_UNITS: tuple[tuple[str, str, float], ...] = (
+    ("ms", "smooth_seconds", 1_000.0),
+    ("s", "smooth_seconds", 1.0),
+    ("beats", "smooth_beats", 1.0),
+    ("beat", "smooth_beats", 1.0),
+)
+
+
+def _lane_option_range(payload: str, metadata: dict[str, object]) -> None:
+    if ":" not in payload:
+        return
+    min_str, _, max_str = payload.partition(":")
+    minimum = _parse_float(min_str)
+    maximum = _parse_float(max_str)
+    if minimum is not None and maximum is not None:
+        metadata["range"] = (minimum, maximum)
+
+
+def _lane_option_curve(payload: str, metadata: dict[str, object]) -> None:
+    if not payload:
+        return
+    curve_name, _, intensity_str = payload.partition(":")
+    curve_name = curve_name.strip().lower()
+    if curve_name:
+        metadata["curve"] = sys.intern(curve_name)
+    intensity = _parse_float(intensity_str)
+    if intensity is not None:
+        metadata["curve_intensity"] = intensity
+
+
+def _lane_option_smooth(payload: str, metadata: dict[str, object]) -> None:
+    payload = payload.strip()
+    if not payload:
+        return
+    segment_override: float | None = None
+    if ":" in payload:
+        payload, _, segment_payload = payload.partition(":")
+        segment_override = _parse_float(segment_payload)
+    key, number, divisor = "smooth_beats", payload, 1.0
+    for suffix, unit_key, unit_divisor in _SMOOTH_UNITS:
+        if payload.endswith(suffix):
+            key, number, divisor = unit_key, payload[: -len(suffix)], unit_divisor
+            break
+    window = _parse_float(number, minimum=0.0)
+    if window is None:
+        return
+    metadata[key] = window / divisor
+    if segment_override is not None:
+        metadata["smooth_segments"] = max(3, int(round(segment_override)))
+
+
+def _lane_option_segments(payload: str, metadata: dict[str, object]) -> None:
+    try:
+        metadata["smooth_segments"] = max(3, int(round(float(payload))))
+    except ValueError:
+        pass
+
+
+_LANE_OPTION_HANDLERS: dict[str, Callable[[str, dict[str, object]], None]] = {
+    "range": _lane_option_range,
+    "curve": _lane_option_curve,
+    "smooth": _lane_option_smooth,
+    "smoothing": _lane_option_smooth,
+    "segments": _lane_option_segments,
+    "smooth_segments": _lane_option_segments,
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_lane(lane: str) -> tuple[str | None, str | None, tuple[tuple[str, object], ...]]:
+    """Split an automation lane name into module, parameter, and metadata.
+
+    Lane names are reused for every render of a pattern, so the parse is
+    memoised. Metadata comes back as an item tuple to keep cached entries
+    immutable; callers build their own dict from it.
+    """
+
+    if "." not in lane:
+        return None, None, ()
+    head, _, parameter_part = lane.partition(".")
+    parameter, _, options = parameter_part.partition("|")
+    metadata: dict[str, object] = {}
+    for match in _LANE_TOKEN_RE.finditer(options.lower()):
+        key, payload = match.group(1), match.group(2)
+        if payload is None:
+            mode = _LANE_MODE_ALIASES.get(key)
+            if mode is not None:
+                metadata["mode"] = mode
+            continue
+        handler = _LANE_OPTION_HANDLERS.get(key)
+        if handler is not None:
+            handler(payload, metadata)
+    # Module and parameter names key the pending-event and last-value tables
+    # for every point on the lane, so intern the sliced strings once here.
+    return sys.intern(head), sys.intern(parameter), tuple(metadata.items())
+
+
+# Curve aliases accepted by the ``curve=`` lane option. Names arrive lowered
+# and interned from ``_lane_option_curve``.
+_EXP_CURVES = frozenset({"exponential", "exp", "ease_in"})
+_LOG_CURVES = frozenset({"logarithmic", "log", "ease_out"})
+_S_CURVES = frozenset({"s_curve", "s-curve", "smooth"})
+
+
+def _linear_curve(normalized: np.ndarray) -> np.ndarray:
+    return normalized
+
+
+def _smoothstep_curve(normalized: np.ndarray) -> np.ndarray:
+    curved = np.multiply(normalized, normalized)
+    slope = np.multiply(normalized, -2.0)
+    slope += 3.0
+    curved *= slope
+    return curved
+
+
+def _weighted_smoothstep_curve(normalized: np.ndarray, power: float) -> np.ndarray:
+    # Work in place on the smoothstep buffer; ``base`` doubles as the output
+    # so entries with a zero denominator keep their clipped value.
+    base = _smoothstep_curve(normalized)
+    np.clip(base, 1e-6, 1.0 - 1e-6, out=base)
+    denominator = np.subtract(1.0, base)
+    np.power(denominator, power, out=denominator)
+    numerator = np.power(base, power)
+    denominator += numerator
+    return np.divide(numerator, denominator, out=base, where=denominator != 0.0)
+
+
+def _resolve_curve(
+    curve_name: str,
+    curve_intensity: object,
+) -> Callable[[np.ndarray], np.ndarray]:
+    """Pick the curve for an automation lane with its constants pre-resolved.
+
+    Inputs to the returned callable are expected to be clipped to ``0..1``.
+    """
+
+    if curve_name in _EXP_CURVES:
+        exponent = max(1e-3, float(curve_intensity) if curve_intensity is not None else 2.0)
+        return lambda normalized: np.power(normalized, exponent)
+    if curve_name in _LOG_CURVES:
+        exponent = max(1e-3, float(curve_intensity) if curve_intensity is not None else 2.0)
+        inverse = 1.0 / exponent
+        return lambda normalized: np.power(normalized, inverse)
+    if curve_name in _S_CURVES:
+        strength = float(curve_intensity) if curve_intensity is not None else 1.0
+        if strength <= 0.0:
+            return _linear_curve
+        if math.isclose(strength, 1.0, rel_tol=1e-6, abs_tol=1e-6):
+            return _smoothstep_curve
+        power = max(1e-3, strength)
+        return lambda normalized: _weighted_smoothstep_curve(normalized, power)
+    return _linear_curve
+
+
+@lru_cache(maxsize=128)
+def _transpose_table(root_midi_note: int) -> tuple[float, ...]:
+    """Return semitone offsets from *root_midi_note* for every MIDI note."""
+
+    return tuple(float(note - root_midi_note) for note in range(128))
+
+
+def _build_mixer_spec(scope: str, name: str, parameter: str) -> ParameterSpec | None:
+    """Describe an automatable mixer parameter for ``mixer:<scope>:<name>``.
+
+    Each call returns a fresh copy of a memoised template, so callers may
+    adjust the spec without affecting later lookups.
+    """
+
+    template = _mixer_spec_template(scope, name, parameter)
+    return replace(template) if template is not None else None
+
+
+@lru_cache(maxsize=512)
+def _mixer_spec_template(scope: str, name: str, parameter: str) -> ParameterSpec | None:
+    """Build the shared spec for :func:`_build_mixer_spec`; never hand it out directly."""
+
+    if scope == "channel":
+        if parameter == "fader_db":
+            return ParameterSpec(
+                name="fader_db",
+                display_name=f"Channel {name} Fader",
+                default=0.0,
+                minimum=-60.0,
+                maximum=12.0,
+                unit="dB",
+                description="Main strip fader level in decibels.",
+                musical_context="mix",
+            )
+        if parameter == "pan":
+            return ParameterSpec(
+                name="pan",
+                display_name=f"Channel {name} Pan",
+                default=0.0,
+                minimum=-1.0,
+                maximum=1.0,
+                unit="",
+                description="Stereo pan position (-1 = left, 1 = right).",
+                musical_context="mix",
+            )
+        if parameter == "mute":
+            return ParameterSpec(
+                name="mute",
+                display_name=f"Channel {name} Mute",
+                default=0.0,
+                minimum=0.0,
+                maximum=1.0,
+                unit="",
+                description="Channel mute toggle (0 = off, 1 = on).",
+                musical_context="mix",
+            )
+        if parameter.startswith("send:"):
+            _, _, bus = parameter.partition(":")
+            return ParameterSpec(
+                name=parameter,
+                display_name=f"Send to {bus or 'bus'}",
+                default=-12.0,
+                minimum=-60.0,
+                maximum=12.0,
+                unit="dB",
+                description="Auxiliary send level in decibels.",
+                musical_context="mix",
+            )
+    elif scope == "subgroup":
+        if parameter == "fader_db":
+            return ParameterSpec(
+                name="fader_db",
+                display_name=f"Subgroup {name} Fader",
+                default=0.0,
+                minimum=-60.0,
+                maximum=12.0,
+                unit="dB",
+                description="Subgroup fader level in decibels.",
+                musical_context="mix",
+            )
+        if parameter == "mute":
+            return ParameterSpec(
+                name="mute",
+                display_name=f"Subgroup {name} Mute",
+                default=0.0,
+                minimum=0.0,
+                maximum=1.0,
+                unit="",
+                description="Subgroup mute toggle (0 = off, 1 = on).",
+                musical_context="mix",
+            )
+    elif scope == "return":
+        if parameter == "level_db":
+            return ParameterSpec(
+                name="level_db",
+                display_name=f"Return {name} Level",
+                default=0.0,
+                minimum=-60.0,
+                maximum=12.0,
+                unit="dB",
+                description="Return bus level in decibels.",
+                musical_context="mix",
+            )
+    return None
+
+
+_BridgeModule = SineOscillator | ClipSampler | AmplitudeEnvelope | OnePoleLowPass
+_ModuleBuilder = Callable[
+    ["PatternPerformanceBridge", str, InstrumentModule, Mapping[str, _BridgeModule], str],
+    _BridgeModule,
+]
+
+
+def _build_sine(
+    bridge: PatternPerformanceBridge,
+    module_id: str,
+    module_def: InstrumentModule,
+    modules: Mapping[str, _BridgeModule],
+    type_suffix: str,
+) -> SineOscillator:
+    module = SineOscillator(module_id, bridge.config)
+    if "frequency_hz" in module_def.parameters:
+        module.set_parameter(
+            "frequency_hz",
+            float(module_def.parameters["frequency_hz"]),
+        )
+    if "amplitude" in module_def.parameters:
+        module.set_parameter(
+            "amplitude",
+            float(module_def.parameters["amplitude"]),
+        )
+    return module
+
+
+def _build_sampler(
+    bridge: PatternPerformanceBridge,
+    module_id: str,
+    module_def: InstrumentModule,
+    modules: Mapping[str, _BridgeModule],
+    type_suffix: str,
+) -> ClipSampler:
+    sample_library = bridge.sample_library
+    sample_key: str | None = None
+    if type_suffix:
+        sample_key = type_suffix
+    elif "sample_name" in module_def.parameters:
+        sample_key = str(module_def.parameters["sample_name"])
+    layers_param = module_def.parameters.get("layers", [])
+    layer_objects: list[ClipSampleLayer] = []
+    if isinstance(layers_param, list):
+        for layer in layers_param:
+            if not isinstance(layer, Mapping):
+                continue
+            layer_name = str(layer.get("sample_name", sample_key or module_def.id))
+            if layer_name not in sample_library:
+                raise KeyError(f"Sample '{layer_name}' not found in library")
+            layer_objects.append(
+                ClipSampleLayer(
+                    sample=sample_library[layer_name],
+                    min_velocity=int(layer.get("min_velocity", 0)),
+                    max_velocity=int(layer.get("max_velocity", 127)),
+                    amplitude_scale=float(layer.get("amplitude_scale", 1.0)),
+                    start_offset_percent=float(layer.get("start_offset_percent", 0.0)),
+                )
+            )
+    sample: np.ndarray | None = None
+    if sample_key is None and not layer_objects:
+        sample_key = module_def.id
+    if sample_key is not None:
+        if sample_key not in sample_library and not layer_objects:
+            raise KeyError(f"Sample '{sample_key}' not found in library")
+    if sample_key in sample_library:
+        sample = sample_library[sample_key]
+    module = ClipSampler(
+        module_id,
+        bridge.config,
+        sample=sample,
+        layers=layer_objects,
+        root_midi_note=int(module_def.parameters.get("root_midi_note", 60)),
+        amplitude=float(module_def.parameters.get("amplitude", 1.0)),
+        start_percent=float(module_def.parameters.get("start_percent", 0.0)),
+        length_percent=float(module_def.parameters.get("length_percent", 1.0)),
+        playback_rate=float(module_def.parameters.get("playback_rate", 1.0)),
+        loop=bool(module_def.parameters.get("loop", False)),
+    )
+    bridge._apply_sampler_defaults(module, module_def.parameters)
+    return module
+
+
+def _build_envelope(
+    bridge: PatternPerformanceBridge,
+    module_id: str,
+    module_def: InstrumentModule,
+    modules: Mapping[str, _BridgeModule],
+    type_suffix: str,
+) -> AmplitudeEnvelope:
+    if not module_def.inputs:
+        raise ValueError("Envelope module requires an input reference")
+    source_id = module_def.inputs[0]
+    if source_id not in modules:
+        raise KeyError(f"Envelope references unknown module '{source_id}'")
+    return AmplitudeEnvelope(
+        module_id,
+        bridge.config,
+        source=modules[source_id],
+        attack_ms=float(module_def.parameters.get("attack_ms", 10.0)),
+        release_ms=float(module_def.parameters.get("release_ms", 120.0)),
+    )
+
+
+def _build_low_pass(
+    bridge: PatternPerformanceBridge,
+    module_id: str,
+    module_def: InstrumentModule,
+    modules: Mapping[str, _BridgeModule],
+    type_suffix: str,
+) -> OnePoleLowPass:
+    if not module_def.inputs:
+        raise ValueError("Low-pass filter requires an input reference")
+    source_id = module_def.inputs[0]
+    if source_id not in modules:
+        raise KeyError(f"Low-pass filter references unknown module '{source_id}'")
+    return OnePoleLowPass(
+        module_id,
+        bridge.config,
+        source=modules[source_id],
+        cutoff_hz=float(module_def.parameters.get("cutoff_hz", 4_000.0)),
+        mix=float(module_def.parameters.get("mix", 1.0)),
+    )
+
+
+# Lower-cased ``InstrumentModule.type`` prefixes (before any ``:suffix``).
+_MODULE_BUILDERS: dict[str, _ModuleBuilder] = {
+    "sine": _build_sine,
+    "sine_oscillator": _build_sine,
+    "oscillator": _build_sine,
+    "clip_sampler": _build_sampler,
+    "sampler": _build_sampler,
+    "amplitude_envelope": _build_envelope,
+    "envelope": _build_envelope,
+    "one_pole_low_pass": _build_low_pass,
+    "low_pass": _build_low_pass,
+    "lp": _build_low_pass,
+}
+
+
+@dataclass(slots=True)
+class _LaneEvent:
+    """One resolved automation point waiting to be merged with its beat."""
+
+    value: float | None
+    source_value: float
+    lane_metadata: dict[str, object]
+    lane_name: str
+    lane_index: int
+
+
+_AUTOMATION_TABLE_DTYPE = np.dtype(
+    [("module", object), ("parameter", object), ("beats", np.float64), ("value", np.float64)]
+)
+
+
+@dataclass(slots=True)
 class PatternPlayback:
     """Rendered audio plus metadata useful for tracker previews."""
 
@@ -62,6 +555,53 @@ class PatternPlayback:
     module_parameters: Dict[str, Dict[str, float | None]]
     automation_log: List[dict[str, object]]
     mixer_snapshot: "MixerPlaybackSnapshot | None" = None
+    # Bucketed loudness keyed by ``(sample_rate, frames_per_bucket)``. Entries
+    # remember the buffer they were measured from so swapping ``buffer``
+    # invalidates them; in-place edits to the samples are not tracked.
+    _loudness_cache: Dict[tuple[int, int], tuple[np.ndarray, np.ndarray, np.ndarray]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _automation_table: tuple[List[dict[str, object]], np.ndarray] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def bucketed_loudness(
+        self, *, sample_rate: int, frames_per_bucket: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return cached :func:`~audio.metrics.bucketed_loudness` readings."""
+
+        key = (sample_rate, frames_per_bucket)
+        cached = self._loudness_cache.get(key)
+        if cached is not None and cached[0] is self.buffer:
+            return cached[1], cached[2]
+        rms_values, lufs_values = bucketed_loudness(
+            self.buffer, sample_rate=sample_rate, frames_per_bucket=frames_per_bucket
+        )
+        self._loudness_cache[key] = (self.buffer, rms_values, lufs_values)
+        return rms_values, lufs_values
+
+    def automation_table(self) -> np.ndarray:
+        """Return the core log columns as a NumPy structured array.
+
+        Rows follow ``automation_log`` with fields ``module``, ``parameter``,
+        ``beats`` and ``value`` (``NaN`` for silenced values), so dashboards
+        can filter with boolean masks instead of walking the dicts. The
+        table is built once per log length and reused.
+        """
+
+        log = self.automation_log
+        cached = self._automation_table
+        if cached is not None and cached[0] is log and len(cached[1]) == len(log):
+            return cached[1]
+        table = np.empty(len(log), dtype=_AUTOMATION_TABLE_DTYPE)
+        table["module"] = [entry.get("module") for entry in log]
+        table["parameter"] = [entry.get("parameter") for entry in log]
+        table["beats"] = [entry.get("beats", 0.0) for entry in log]
+        table["value"] = [
+            np.nan if (value := entry.get("value")) is None else value for entry in log
+        ]
+        self._automation_table = (log, table)
+        return table
 
 
 @dataclass
@@ -85,12 +625,27 @@ class PatternPerformanceBridge:
         *,
         sample_library: Mapping[str, np.ndarray] | None = None,
         mixer: MixerGraph | None = None,
+        log_event_ids: bool = True,
+        render_cache_size: int = 0,
+        debug_sources: bool = False,
     ) -> None:
         self.config = config
         self.tempo = tempo
-        self.sample_library = sample_library or {}
+        # Convert samples to contiguous float32 once so instrument builds can
+        # hand the arrays straight to ClipSampler on every render.
+        self.sample_library: dict[str, np.ndarray] = {
+            name: np.ascontiguousarray(sample, dtype=np.float32)
+            for name, sample in (sample_library or {}).items()
+        }
         self._log_counter = 0
+        self._log_event_ids_enabled = log_event_ids
+        self.debug_sources = debug_sources
         self._mixer = mixer
+        self._mixer_batch: List[AutomationEvent] | None = None
+        self._seconds_per_beat_cache: tuple[float, float] | None = None
+        self._frames_per_beat_cache: tuple[float, int, int] | None = None
+        self._render_cache_size = max(0, int(render_cache_size))
+        self._render_cache: "OrderedDict[tuple[str, str], PatternPlayback]" = OrderedDict()
 
     # ------------------------------------------------------------------
     # Public API
@@ -99,6 +654,107 @@ class PatternPerformanceBridge:
         self,
         pattern: Pattern,
         instrument: InstrumentDefinition,
+    ) -> PatternPlayback:
+        """Render *pattern* through *instrument*.
+
+        When the bridge was created with ``render_cache_size`` and no mixer,
+        renders are memoised by pattern and instrument content. Cached
+        playbacks share a read-only buffer and repeat the original log,
+        event ids included; logs and parameters are copied per call.
+        """
+
+        cache_key = self._render_cache_key(pattern, instrument)
+        if cache_key is None:
+            return self._render_pattern_uncached(pattern, instrument)
+        cached = self._render_cache.get(cache_key)
+        if cached is None:
+            cached = self._render_pattern_uncached(pattern, instrument)
+            cached.buffer.flags.writeable = False
+            self._render_cache[cache_key] = cached
+            while len(self._render_cache) > self._render_cache_size:
+                self._render_cache.popitem(last=False)
+        else:
+            self._render_cache.move_to_end(cache_key)
+        return PatternPlayback(
+            buffer=cached.buffer,
+            duration_seconds=cached.duration_seconds,
+            beat_frames=list(cached.beat_frames),
+            module_parameters={name: dict(values) for name, values in cached.module_parameters.items()},
+            automation_log=[dict(entry) for entry in cached.automation_log],
+        )
+
+    def render_patterns(
+        self,
+        patterns: Iterable[Pattern],
+        instrument: InstrumentDefinition,
+        *,
+        max_workers: int | None = None,
+    ) -> List[PatternPlayback]:
+        """Render several patterns, in parallel worker processes when possible.
+
+        Results follow the order of *patterns*. Each worker builds its own
+        bridge from this bridge's settings, so event ids restart per pattern.
+        Bridges that drive a mixer render sequentially because the mixer
+        graph is shared state, as do single patterns or ``max_workers=1``.
+        """
+
+        pattern_list = list(patterns)
+        workers = min(len(pattern_list), max_workers or os.cpu_count() or 1)
+        if self._mixer is not None or workers <= 1:
+            return [self.render_pattern(pattern, instrument) for pattern in pattern_list]
+        options = {
+            "sample_library": self.sample_library,
+            "log_event_ids": self._log_event_ids_enabled,
+            "debug_sources": self.debug_sources,
+        }
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _render_pattern_in_worker,
+                    self.config,
+                    self.tempo,
+                    options,
+                    pattern.model_dump_json(),
+                    instrument.model_dump_json(),
+                )
+                for pattern in pattern_list
+            ]
+            return [future.result() for future in futures]
+
+    def invalidate(self, pattern_id: str | None = None) -> None:
+        """Drop memoised renders for *pattern_id*, or all of them when ``None``."""
+
+        if pattern_id is None:
+            self._render_cache.clear()
+            return
+        for key in [key for key in self._render_cache if key[0] == pattern_id]:
+            del self._render_cache[key]
+
+    def _render_cache_key(
+        self,
+        pattern: Pattern,
+        instrument: InstrumentDefinition,
+    ) -> tuple[str, str] | None:
+        # Mixer renders mutate and snapshot shared graph state, so only plain
+        # renders are memoised.
+        if not self._render_cache_size or self._mixer is not None:
+            return None
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(pattern.model_dump_json().encode())
+        hasher.update(instrument.model_dump_json().encode())
+        hasher.update(repr((self.config, self.tempo, self._log_event_ids_enabled)).encode())
+        # ``sample_library`` is a public dict whose arrays may be swapped or
+        # edited in place, so samples are keyed by content rather than object.
+        for name, sample in self.sample_library.items():
+            data = np.ascontiguousarray(sample)
+            hasher.update(f"{name}:{data.dtype.str}:{data.shape}".encode())
+            hasher.update(data.data)
+        return pattern.id, hasher.hexdigest()
+
+    def _render_pattern_uncached(
+        self,
+        pattern: Pattern,
+        instrument: InstrumentDefinition,
     ) -> PatternPlayback:
         engine = OfflineAudioEngine(self.config, tempo=self.tempo)
         modules = self._instantiate_instrument(engine, instrument)
@@ -106,10 +762,11 @@ class PatternPerformanceBridge:
         automation_log: List[dict[str, object]] = []
         if self._mixer is not None:
             self._mixer.reset_automation_state(clear_events=True)
-        self._schedule_steps(engine, pattern, instrument, modules, automation_log)
-        self._schedule_automation_lanes(engine, pattern, modules, automation_log)
+        with self._batched_mixer_changes():
+            self._schedule_steps(engine, pattern, instrument, modules, automation_log)
+            self._schedule_automation_lanes(engine, pattern, modules, automation_log)
 
-        duration_seconds = self.tempo.beats_to_seconds(pattern.duration_beats)
+        duration_seconds = pattern.duration_beats * self._seconds_per_beat()
         with self._prepare_mixer_render(engine, instrument, modules):
             buffer = engine.render(duration_seconds)
 
@@ -141,25 +798,28 @@ class PatternPerformanceBridge:
         if beats_per_bucket <= 0.0:
             raise ValueError("beats_per_bucket must be positive")
 
-        beat_span_seconds = self.tempo.beats_to_seconds(beats_per_bucket)
+        beat_span_seconds = beats_per_bucket * self._seconds_per_beat()
         frames_per_bucket = max(1, int(round(beat_span_seconds * self.config.sample_rate)))
-        buffer = playback.buffer
-        total_frames = buffer.shape[0]
+        rms_values, lufs_values = playback.bucketed_loudness(
+            sample_rate=self.config.sample_rate,
+            frames_per_bucket=frames_per_bucket,
+        )
         summaries: List[dict[str, object]] = []
-        for bucket_index, start in enumerate(range(0, total_frames, frames_per_bucket)):
-            end = min(total_frames, start + frames_per_bucket)
-            segment = buffer[start:end]
-            if segment.size == 0:
-                continue
-            rms_values = rms_dbfs(segment)
-            lufs_value = integrated_lufs(segment, sample_rate=self.config.sample_rate)
+        for bucket_index, (rms_left, rms_right, lufs_value) in enumerate(
+            zip(
+                rms_values[:, 0].tolist(),
+                rms_values[:, -1].tolist(),
+                lufs_values.tolist(),
+                strict=True,
+            )
+        ):
             summaries.append(
                 {
                     "start_beat": bucket_index * beats_per_bucket,
                     "end_beat": (bucket_index + 1) * beats_per_bucket,
-                    "rms_left_dbfs": float(rms_values[0]),
-                    "rms_right_dbfs": float(rms_values[-1]),
-                    "integrated_lufs": float(lufs_value),
+                    "rms_left_dbfs": rms_left,
+                    "rms_right_dbfs": rms_right,
+                    "integrated_lufs": lufs_value,
                 }
             )
         return summaries
@@ -290,97 +950,15 @@ class PatternPerformanceBridge:
         modules: MutableMapping[str, SineOscillator | ClipSampler | AmplitudeEnvelope | OnePoleLowPass] = {}
 
         for module_def in instrument.modules:
-            raw_type = module_def.type
-            module_type, _, type_suffix = raw_type.partition(":")
-            module_type = module_type.lower()
-            if module_type in {"sine", "sine_oscillator", "oscillator"}:
-                module = SineOscillator(module_def.id, self.config)
-                if "frequency_hz" in module_def.parameters:
-                    module.set_parameter(
-                        "frequency_hz",
-                        float(module_def.parameters["frequency_hz"]),
-                    )
-                if "amplitude" in module_def.parameters:
-                    module.set_parameter(
-                        "amplitude",
-                        float(module_def.parameters["amplitude"]),
-                    )
-            elif module_type in {"clip_sampler", "sampler"}:
-                sample_key: str | None = None
-                if type_suffix:
-                    sample_key = type_suffix
-                elif "sample_name" in module_def.parameters:
-                    sample_key = str(module_def.parameters["sample_name"])
-                layers_param = module_def.parameters.get("layers", [])
-                layer_objects: list[ClipSampleLayer] = []
-                if isinstance(layers_param, list):
-                    for layer in layers_param:
-                        if not isinstance(layer, Mapping):
-                            continue
-                        layer_name = str(layer.get("sample_name", sample_key or module_def.id))
-                        if layer_name not in self.sample_library:
-                            raise KeyError(f"Sample '{layer_name}' not found in library")
-                        layer_buffer = np.asarray(self.sample_library[layer_name], dtype=np.float32)
-                        layer_objects.append(
-                            ClipSampleLayer(
-                                sample=layer_buffer,
-                                min_velocity=int(layer.get("min_velocity", 0)),
-                                max_velocity=int(layer.get("max_velocity", 127)),
-                                amplitude_scale=float(layer.get("amplitude_scale", 1.0)),
-                                start_offset_percent=float(layer.get("start_offset_percent", 0.0)),
-                            )
-                        )
-                sample: np.ndarray | None = None
-                if sample_key is None and not layer_objects:
-                    sample_key = module_def.id
-                if sample_key is not None:
-                    if sample_key not in self.sample_library and not layer_objects:
-                        raise KeyError(f"Sample '{sample_key}' not found in library")
-                if sample_key in self.sample_library:
-                    sample = np.asarray(self.sample_library[sample_key], dtype=np.float32)
-                module = ClipSampler(
-                    module_def.id,
-                    self.config,
-                    sample=sample,
-                    layers=layer_objects,
-                    root_midi_note=int(module_def.parameters.get("root_midi_note", 60)),
-                    amplitude=float(module_def.parameters.get("amplitude", 1.0)),
-                    start_percent=float(module_def.parameters.get("start_percent", 0.0)),
-                    length_percent=float(module_def.parameters.get("length_percent", 1.0)),
-                    playback_rate=float(module_def.parameters.get("playback_rate", 1.0)),
-                    loop=bool(module_def.parameters.get("loop", False)),
-                )
-                self._apply_sampler_defaults(module, module_def.parameters)
-            elif module_type in {"amplitude_envelope", "envelope"}:
-                if not module_def.inputs:
-                    raise ValueError("Envelope module requires an input reference")
-                source_id = module_def.inputs[0]
-                if source_id not in modules:
-                    raise KeyError(f"Envelope references unknown module '{source_id}'")
-                module = AmplitudeEnvelope(
-                    module_def.id,
-                    self.config,
-                    source=modules[source_id],
-                    attack_ms=float(module_def.parameters.get("attack_ms", 10.0)),
-                    release_ms=float(module_def.parameters.get("release_ms", 120.0)),
-                )
-            elif module_type in {"one_pole_low_pass", "low_pass", "lp"}:
-                if not module_def.inputs:
-                    raise ValueError("Low-pass filter requires an input reference")
-                source_id = module_def.inputs[0]
-                if source_id not in modules:
-                    raise KeyError(f"Low-pass filter references unknown module '{source_id}'")
-                module = OnePoleLowPass(
-                    module_def.id,
-                    self.config,
-                    source=modules[source_id],
-                    cutoff_hz=float(module_def.parameters.get("cutoff_hz", 4_000.0)),
-                    mix=float(module_def.parameters.get("mix", 1.0)),
-                )
-            else:
+            # Module ids key the automation log and pending-event tables, so
+            # intern them once here rather than hashing fresh copies later.
+            module_id = sys.intern(module_def.id)
+            module_type, _, type_suffix = module_def.type.partition(":")
+            builder = _MODULE_BUILDERS.get(module_type.lower())
+            if builder is None:
                 raise ValueError(f"Unsupported module type '{module_def.type}'")
-
-            modules[module_def.id] = module
+            module = builder(self, module_id, module_def, modules, type_suffix)
+            modules[module_id] = module
             engine.add_module(module, as_output=module_def is instrument.modules[-1])
 
         return modules
@@ -434,106 +1012,88 @@ class PatternPerformanceBridge:
         automation_log: List[dict[str, object]],
     ) -> None:
         step_duration_beats = 1.0 / 4.0
-        envelope_modules = [mid for mid, mod in modules.items() if isinstance(mod, AmplitudeEnvelope)]
-        sampler_modules = [mid for mid, mod in modules.items() if isinstance(mod, ClipSampler)]
-
-        for index, step in enumerate(self._iter_steps(pattern)):
-            if step.note is None or step.instrument_id not in {None, instrument.id}:
+        # Categorise modules in one pass. Root notes are fixed for the lifetime
+        # of a render, so each sampler gets a shared note -> semitone table and
+        # the per-step transpose is an index lookup. Steps edited through
+        # ``model_copy`` skip validation, so notes outside the MIDI range fall
+        # back to the direct subtraction.
+        envelope_modules: List[str] = []
+        sampler_modules: List[str] = []
+        sampler_roots: dict[str, int] = {}
+        sampler_transpose: dict[str, tuple[float, ...]] = {}
+        for mid, mod in modules.items():
+            if isinstance(mod, AmplitudeEnvelope):
+                envelope_modules.append(mid)
+            elif isinstance(mod, ClipSampler):
+                sampler_modules.append(mid)
+                root = self._sampler_root_note(mod)
+                sampler_roots[mid] = root
+                sampler_transpose[mid] = _transpose_table(root)
+
+        # Step events are gathered column-wise and submitted to the engine in
+        # one call; row order matches the old per-call order so events that
+        # share a timestamp still resolve the same way.
+        event_modules: List[str] = []
+        event_parameters: List[str] = []
+        event_beats: List[float] = []
+        event_values: List[float] = []
+        event_sources: List[str] = []
+        # Per-step source labels are only for debugging engine timelines; by
+        # default every step shares the constant labels.
+        debug_sources = self.debug_sources
+        gate_sources = _STEP_GATE_SOURCES
+        sampler_sources = _STEP_SAMPLER_SOURCES
+        for index, step in self._active_steps(pattern, instrument):
+            note = step.note
+            if note is None:  # pragma: no cover - rests are filtered by _active_steps
                 continue
             start_beat = index * step_duration_beats
             length_beats = float(step.step_effects.get("length_beats", step_duration_beats))
             end_beat = start_beat + max(length_beats, step_duration_beats / 2.0)
             velocity = step.velocity if step.velocity is not None else 100
             gate_value = velocity / 127.0
-            sampler_velocity = max(1, min(127, velocity))
+            sampler_velocity = float(max(1, min(127, velocity)))
+            if debug_sources:
+                gate_sources = (f"pattern_step_{index}_on", f"pattern_step_{index}_off")
+                sampler_sources = (
+                    f"pattern_step_{index}_velocity",
+                    f"pattern_step_{index}_transpose",
+                    f"pattern_step_{index}_trigger",
+                )
 
             for module_id in envelope_modules:
-                engine.schedule_parameter_change(
-                    module_id,
-                    "gate",
-                    beats=start_beat,
-                    value=gate_value,
-                    source=f"pattern_step_{index}_on",
-                )
-                self._append_log(
-                    automation_log,
-                    {
-                        "module": module_id,
-                        "parameter": "gate",
-                        "beats": start_beat,
-                        "value": gate_value,
-                    },
-                )
-                engine.schedule_parameter_change(
-                    module_id,
-                    "gate",
-                    beats=end_beat,
-                    value=0.0,
-                    source=f"pattern_step_{index}_off",
-                )
-                self._append_log(
-                    automation_log,
-                    {
-                        "module": module_id,
-                        "parameter": "gate",
-                        "beats": end_beat,
-                        "value": 0.0,
-                    },
-                )
+                event_modules += (module_id, module_id)
+                event_parameters += (_PARAM_GATE, _PARAM_GATE)
+                event_beats += (start_beat, end_beat)
+                event_values += (gate_value, 0.0)
+                event_sources += gate_sources
 
+            in_midi_range = 0 <= note < 128
             for module_id in sampler_modules:
-                transpose = self._transpose_for_note(
-                    modules[module_id],
-                    step.note,
-                )
-                engine.schedule_parameter_change(
-                    module_id,
-                    "velocity",
-                    beats=start_beat,
-                    value=float(sampler_velocity),
-                    source=f"pattern_step_{index}_velocity",
-                )
-                self._append_log(
-                    automation_log,
-                    {
-                        "module": module_id,
-                        "parameter": "velocity",
-                        "beats": start_beat,
-                        "value": float(sampler_velocity),
-                    },
-                )
-                engine.schedule_parameter_change(
-                    module_id,
-                    "transpose_semitones",
-                    beats=start_beat,
-                    value=transpose,
-                    source=f"pattern_step_{index}_transpose",
-                )
-                self._append_log(
-                    automation_log,
-                    {
-                        "module": module_id,
-                        "parameter": "transpose_semitones",
-                        "beats": start_beat,
-                        "value": transpose,
-                    },
-                )
-                engine.schedule_parameter_change(
-                    module_id,
-                    "retrigger",
-                    beats=start_beat,
-                    value=1.0,
-                    source=f"pattern_step_{index}_trigger",
-                )
-                self._append_log(
-                    automation_log,
-                    {
-                        "module": module_id,
-                        "parameter": "retrigger",
-                        "beats": start_beat,
-                        "value": 1.0,
-                    },
-                )
+                if in_midi_range:
+                    transpose = sampler_transpose[module_id][note]
+                else:
+                    transpose = float(note - sampler_roots[module_id])
+                event_modules += (module_id, module_id, module_id)
+                event_parameters += (_PARAM_VELOCITY, _PARAM_TRANSPOSE, _PARAM_RETRIGGER)
+                event_beats += (start_beat, start_beat, start_beat)
+                event_values += (sampler_velocity, transpose, 1.0)
+                event_sources += sampler_sources
+
+        engine.schedule_parameter_changes(
+            event_modules,
+            event_parameters,
+            beats=event_beats,
+            values=event_values,
+            sources=event_sources,
+        )
+        pending_log: List[dict[str, object]] = [
+            {"module": module_id, "parameter": parameter, "beats": beat, "value": value}
+            for module_id, parameter, beat, value in zip(
+                event_modules, event_parameters, event_beats, event_values, strict=True
+            )
+        ]
+        self._flush_log(automation_log, pending_log)
 
     def _schedule_automation_lanes(
         self,
@@ -542,8 +1102,14 @@ class PatternPerformanceBridge:
         modules: Mapping[str, SineOscillator | ClipSampler | AmplitudeEnvelope | OnePoleLowPass],
         automation_log: List[dict[str, object]],
     ) -> None:
-        pending: dict[tuple[str, str, str, float], list[dict[str, object]]] = {}
+        pending: dict[tuple[str, str, str, float], list[_LaneEvent]] = {}
+        pending_log: List[dict[str, object]] = []
         last_values: dict[tuple[str, str, str], float | None] = {}
+        # The engine configuration is fixed for the whole render; read it once
+        # instead of per automation group when sizing smoothing ramps.
+        sample_rate = self.config.sample_rate
+        block_size = max(self.config.block_size, 1)
+        seconds_per_beat = self._seconds_per_beat()
         for lane_index, (lane, points) in enumerate(pattern.automation.items()):
             module_name, parameter_name, metadata = self._parse_lane_metadata(lane)
             if module_name is None or parameter_name is None:
@@ -568,40 +1134,37 @@ class PatternPerformanceBridge:
                         f"Automation lane '{lane}' references unsupported mixer parameter '{parameter_name}'"
                     )
             value_mapper = self._automation_value_mapper(spec, metadata)
-            for point in points:
-                if not isinstance(point, AutomationPoint):
-                    continue
-                resolved_value = value_mapper(point.value)
+            lane_points = [point for point in points if isinstance(point, AutomationPoint)]
+            raw_values = np.fromiter(
+                (point.value for point in lane_points),
+                dtype=np.float64,
+                count=len(lane_points),
+            )
+            resolved_values = value_mapper(raw_values).tolist()
+            for point, resolved_value in zip(lane_points, resolved_values, strict=True):
                 key = (target_type, module_name, parameter_name, float(point.position_beats))
                 bucket = pending.setdefault(key, [])
-                bucket.append(
-                    {
-                        "module": module_name,
-                        "parameter": parameter_name,
-                        "beats": float(point.position_beats),
-                        "value": resolved_value,
-                        "source_value": point.value,
-                        "lane_metadata": metadata,
-                        "lane_name": lane,
-                        "lane_index": lane_index,
-                        "target_type": target_type,
-                    }
-                )
+                bucket.append(_LaneEvent(resolved_value, point.value, metadata, lane, lane_index))
 
         for (target_type, module_name, parameter_name, beat), events in sorted(
             pending.items(), key=lambda item: (item[0][3], item[0][1], item[0][2])
         ):
-            values = [event["value"] for event in events]
-            has_none = any(value is None for value in values)
-            numeric_values = [float(value) for value in values if value is not None]
-            if has_none and not numeric_values:
-                aggregated_value: float | None = None
-            elif has_none:
-                aggregated_value = None
-            elif not numeric_values:
-                aggregated_value = None
+            # Most beats carry a single lane event; keep that case free of the
+            # list building needed to average colliding lanes.
+            single_event = events[0] if len(events) == 1 else None
+            if single_event is not None:
+                single_value = single_event.value
+                aggregated_value: float | None = (
+                    None if single_value is None else float(single_value)
+                )
             else:
-                aggregated_value = sum(numeric_values) / len(numeric_values)
+                values = [event.value for event in events]
+                has_none = any(value is None for value in values)
+                numeric_values = [float(value) for value in values if value is not None]
+                if has_none or not numeric_values:
+                    aggregated_value = None
+                else:
+                    aggregated_value = sum(numeric_values) / len(numeric_values)
 
             key = (target_type, module_name, parameter_name)
             if key not in last_values:
@@ -614,17 +1177,24 @@ class PatternPerformanceBridge:
                     last_values[key] = self._get_mixer_parameter(module_name, parameter_name)
             previous_value = last_values.get(key)
 
-            smoothing_beats_candidates = [
-                self._metadata_smoothing_beats(event.get("lane_metadata", {}))
-                for event in events
-            ]
-            smoothing_beats = max(smoothing_beats_candidates) if smoothing_beats_candidates else 0.0
-            segments_override_candidates = [
-                self._metadata_smoothing_segments(event.get("lane_metadata", {}))
-                for event in events
-            ]
-            candidate_values = [value for value in segments_override_candidates if value is not None]
-            segments_override = max(candidate_values) if candidate_values else None
+            if single_event is not None:
+                single_metadata = single_event.lane_metadata
+                smoothing_beats = self._metadata_smoothing_beats(single_metadata)
+                segments_override = self._metadata_smoothing_segments(single_metadata)
+            else:
+                smoothing_beats = max(
+                    self._metadata_smoothing_beats(event.lane_metadata)
+                    for event in events
+                )
+                candidate_values = [
+                    value
+                    for value in (
+                        self._metadata_smoothing_segments(event.lane_metadata)
+                        for event in events
+                    )
+                    if value is not None
+                ]
+                segments_override = max(candidate_values) if candidate_values else None
             smoothing_applied = False
             smoothing_info: dict[str, object] | None = None
 
@@ -654,26 +1224,29 @@ class PatternPerformanceBridge:
                 start_beat = max(0.0, beat - smoothing_beats)
                 window_beats = max(0.0, beat - start_beat)
                 if window_beats > 0.0:
-                    window_seconds = self.tempo.beats_to_seconds(window_beats)
+                    window_seconds = window_beats * seconds_per_beat
                     default_segments = max(
                         3,
                         int(
                             math.ceil(
                                 window_seconds
-                                * self.config.sample_rate
-                                / max(self.config.block_size, 1)
+                                * sample_rate
+                                / block_size
                             )
                         )
                         + 1,
                     )
                     segments = segments_override or default_segments
-                    step_beats = window_beats / (segments - 1)
-                    for idx in range(segments):
-                        ratio = idx / (segments - 1)
-                        event_beat = start_beat + step_beats * idx
-                        value = previous_value + (aggregated_value - previous_value) * ratio
-                        source = "pattern_automation" if idx == segments - 1 else "pattern_automation_smooth"
-                        schedule_change(event_beat, value, source)
+                    ramp_beats, ramp_values = _smoothing_ramp(
+                        start_beat,
+                        window_beats,
+                        float(previous_value),
+                        float(aggregated_value),
+                        segments,
+                    )
+                    for event_beat, value in zip(ramp_beats[:-1], ramp_values[:-1], strict=True):
+                        schedule_change(event_beat, value, "pattern_automation_smooth")
+                    schedule_change(ramp_beats[-1], ramp_values[-1], "pattern_automation")
                     smoothing_applied = True
                     smoothing_info = {
                         "window_beats": window_beats,
@@ -689,11 +1262,10 @@ class PatternPerformanceBridge:
                     "pattern_automation",
                 )
                 if smoothing_beats > 0.0:
+                    requested_window = min(smoothing_beats, beat if beat > 0 else smoothing_beats)
                     smoothing_info = {
-                        "window_beats": min(smoothing_beats, beat if beat > 0 else smoothing_beats),
-                        "window_seconds": self.tempo.beats_to_seconds(
-                            min(smoothing_beats, beat if beat > 0 else smoothing_beats)
-                        ),
+                        "window_beats": requested_window,
+                        "window_seconds": requested_window * seconds_per_beat,
                         "previous_value": previous_value,
                         "strategy": "none",
                         "segments": segments_override or 0,
@@ -701,142 +1273,85 @@ class PatternPerformanceBridge:
 
             last_values[key] = aggregated_value
 
-            events.sort(key=lambda event: (event["lane_index"], event["lane_name"]))
             log_entry: dict[str, object] = {
                 "module": module_name,
                 "parameter": parameter_name,
                 "beats": beat,
                 "value": aggregated_value,
             }
-            metadata_payloads = [event["lane_metadata"] for event in events if event["lane_metadata"]]
-            if metadata_payloads:
+            if single_event is not None:
+                if single_event.lane_metadata:
+                    log_entry["lane_metadata"] = single_event.lane_metadata
+                log_entry["smoothing_sources"] = [single_event.lane_name]
+                log_entry["source_value"] = single_event.source_value
+            else:
+                events.sort(key=lambda event: (event.lane_index, event.lane_name))
+                metadata_payloads = [event.lane_metadata for event in events if event.lane_metadata]
                 if len(metadata_payloads) == 1:
                     log_entry["lane_metadata"] = metadata_payloads[0]
-                else:
+                elif metadata_payloads:
                     log_entry["lane_metadata"] = metadata_payloads
-            source_values = [event["source_value"] for event in events]
-            source_names = [event["lane_name"] for event in events]
-            log_entry["smoothing_sources"] = source_names
-            if len(source_values) == 1:
-                log_entry["source_value"] = source_values[0]
-            else:
-                log_entry["source_value"] = source_values
+                log_entry["smoothing_sources"] = [event.lane_name for event in events]
+                log_entry["source_value"] = [event.source_value for event in events]
                 log_entry["smoothed_values"] = values
                 log_entry["smoothing_mode"] = "average"
             if smoothing_info is not None:
                 smoothing_info["applied"] = smoothing_applied
                 log_entry["smoothing"] = smoothing_info
-            self._append_log(automation_log, log_entry)
+            pending_log.append(log_entry)
+        self._flush_log(automation_log, pending_log)
 
-    def _append_log(
+    def _flush_log(
         self,
         automation_log: List[dict[str, object]],
-        payload: Mapping[str, object],
+        entries: List[dict[str, object]],
     ) -> None:
-        entry = dict(payload)
-        try:
-            beats = float(entry.get("beats", 0.0) or 0.0)
-        except (TypeError, ValueError):
-            beats = 0.0
-            entry["beats"] = beats
-        if "event_index" not in entry:
-            entry["event_index"] = len(automation_log)
-        if "event_id" not in entry:
-            self._log_counter += 1
-            module_name = str(entry.get("module", "module"))
-            parameter_name = str(entry.get("parameter", "parameter"))
-            entry["event_id"] = f"{module_name}.{parameter_name}@{beats:.4f}#{self._log_counter}"
-        automation_log.append(entry)
+        """Normalise buffered log entries and append them to *automation_log*.
+
+        Scheduling passes collect their entries locally and flush once, so the
+        log is extended in a single call per pass rather than per event. The
+        entries are completed in place; callers hand over ownership and must
+        not reuse them afterwards. ``event_id`` strings are only formatted
+        when the bridge was created with ``log_event_ids=True``.
+        """
+
+        next_index = len(automation_log)
+        with_ids = self._log_event_ids_enabled
+        for entry in entries:
+            try:
+                beats = float(entry.get("beats", 0.0) or 0.0)
+            except (TypeError, ValueError):
+                beats = 0.0
+                entry["beats"] = beats
+            if "event_index" not in entry:
+                entry["event_index"] = next_index
+            if with_ids and "event_id" not in entry:
+                self._log_counter += 1
+                module_name = str(entry.get("module", "module"))
+                parameter_name = str(entry.get("parameter", "parameter"))
+                entry["event_id"] = f"{module_name}.{parameter_name}@{beats:.4f}#{self._log_counter}"
+            next_index += 1
+        automation_log.extend(entries)
 
     def _parse_lane_metadata(self, lane: str) -> tuple[str | None, str | None, dict[str, object]]:
-        if "." not in lane:
-            return None, None, {}
-        head, parameter_part = lane.split(".", 1)
-        parts = parameter_part.split("|")
-        parameter = parts[0]
-        metadata: dict[str, object] = {}
-        for token in parts[1:]:
-            token = token.strip().lower()
-            if token in {"normalized", "normalised"}:
-                metadata["mode"] = "normalized"
-            elif token in {"raw", "absolute"}:
-                metadata["mode"] = "raw"
-            elif token in {"percent", "percentage"}:
-                metadata["mode"] = "percent"
-            elif token.startswith("range="):
-                _, _, payload = token.partition("=")
-                if ":" in payload:
-                    min_str, _, max_str = payload.partition(":")
-                    try:
-                        metadata["range"] = (float(min_str), float(max_str))
-                    except ValueError:
-                        continue
-            elif token.startswith("curve="):
-                _, _, payload = token.partition("=")
-                if payload:
-                    curve_name, _, intensity_str = payload.partition(":")
-                    curve_name = curve_name.strip().lower()
-                    if curve_name:
-                        metadata["curve"] = curve_name
-                    if intensity_str:
-                        try:
-                            metadata["curve_intensity"] = float(intensity_str)
-                        except ValueError:
-                            continue
-            elif token.startswith("smooth=") or token.startswith("smoothing="):
-                _, _, payload = token.partition("=")
-                payload = payload.strip().lower()
-                if not payload:
-                    continue
-                segment_override: float | None = None
-                if ":" in payload:
-                    payload, _, segment_payload = payload.partition(":")
-                    segment_payload = segment_payload.strip()
-                    if segment_payload:
-                        try:
-                            segment_override = float(segment_payload)
-                        except ValueError:
-                            segment_override = None
-                try:
-                    if payload.endswith("ms"):
-                        metadata["smooth_seconds"] = max(0.0, float(payload[:-2]) / 1_000.0)
-                    elif payload.endswith("s"):
-                        metadata["smooth_seconds"] = max(0.0, float(payload[:-1]))
-                    elif payload.endswith("beats"):
-                        metadata["smooth_beats"] = max(0.0, float(payload[:-5]))
-                    elif payload.endswith("beat"):
-                        metadata["smooth_beats"] = max(0.0, float(payload[:-4]))
-                    else:
-                        metadata["smooth_beats"] = max(0.0, float(payload))
-                except ValueError:
-                    continue
-                if segment_override is not None:
-                    metadata["smooth_segments"] = max(3, int(round(segment_override)))
-            elif token.startswith("segments=") or token.startswith("smooth_segments="):
-                _, _, payload = token.partition("=")
-                try:
-                    metadata["smooth_segments"] = max(3, int(round(float(payload))))
-                except ValueError:
-                    continue
-        return head, parameter, metadata
+        head, parameter, metadata_items = _parse_lane(lane)
+        return head, parameter, dict(metadata_items)
 
     def _resolve_parameter_spec(
         self,
         module: SineOscillator | ClipSampler | AmplitudeEnvelope | OnePoleLowPass,
         parameter: str,
     ) -> ParameterSpec | None:
-        for spec in module.describe_parameters():
-            if spec.name == parameter:
-                return spec
-        return None
+        return module.get_parameter_spec(parameter)
 
     def _parse_mixer_target(self, module_name: str) -> tuple[str, str] | None:
         if not module_name.startswith("mixer:"):
             return None
-        parts = module_name.split(":", 2)
-        if len(parts) != 3:
+        _, _, address = module_name.partition(":")
+        scope, separator, name = address.partition(":")
+        if not separator:
             return None
-        return parts[1], parts[2]
+        return scope, name
 
     def _resolve_mixer_parameter_spec(
         self,
@@ -847,88 +1362,7 @@ class PatternPerformanceBridge:
         if target is None:
             return None
         scope, name = target
-        if scope == "channel":
-            if parameter == "fader_db":
-                return ParameterSpec(
-                    name="fader_db",
-                    display_name=f"Channel {name} Fader",
-                    default=0.0,
-                    minimum=-60.0,
-                    maximum=12.0,
-                    unit="dB",
-                    description="Main strip fader level in decibels.",
-                    musical_context="mix",
-                )
-            if parameter == "pan":
-                return ParameterSpec(
-                    name="pan",
-                    display_name=f"Channel {name} Pan",
-                    default=0.0,
-                    minimum=-1.0,
-                    maximum=1.0,
-                    unit="",
-                    description="Stereo pan position (-1 = left, 1 = right).",
-                    musical_context="mix",
-                )
-            if parameter == "mute":
-                return ParameterSpec(
-                    name="mute",
-                    display_name=f"Channel {name} Mute",
-                    default=0.0,
-                    minimum=0.0,
-                    maximum=1.0,
-                    unit="",
-                    description="Channel mute toggle (0 = off, 1 = on).",
-                    musical_context="mix",
-                )
-            if parameter.startswith("send:"):
-                _, _, bus = parameter.partition(":")
-                return ParameterSpec(
-                    name=parameter,
-                    display_name=f"Send to {bus or 'bus'}",
-                    default=-12.0,
-                    minimum=-60.0,
-                    maximum=12.0,
-                    unit="dB",
-                    description="Auxiliary send level in decibels.",
-                    musical_context="mix",
-                )
-        elif scope == "subgroup":
-            if parameter == "fader_db":
-                return ParameterSpec(
-                    name="fader_db",
-                    display_name=f"Subgroup {name} Fader",
-                    default=0.0,
-                    minimum=-60.0,
-                    maximum=12.0,
-                    unit="dB",
-                    description="Subgroup fader level in decibels.",
-                    musical_context="mix",
-                )
-            if parameter == "mute":
-                return ParameterSpec(
-                    name="mute",
-                    display_name=f"Subgroup {name} Mute",
-                    default=0.0,
-                    minimum=0.0,
-                    maximum=1.0,
-                    unit="",
-                    description="Subgroup mute toggle (0 = off, 1 = on).",
-                    musical_context="mix",
-                )
-        elif scope == "return":
-            if parameter == "level_db":
-                return ParameterSpec(
-                    name="level_db",
-                    display_name=f"Return {name} Level",
-                    default=0.0,
-                    minimum=-60.0,
-                    maximum=12.0,
-                    unit="dB",
-                    description="Return bus level in decibels.",
-                    musical_context="mix",
-                )
-        return None
+        return _build_mixer_spec(scope, name, parameter)
 
     def _resolve_mixer_channels(self, instrument: InstrumentDefinition) -> List[str]:
         if not instrument.macros:
@@ -1012,7 +1446,18 @@ class PatternPerformanceBridge:
     ) -> None:
         if self._mixer is None:
             return
-        time_seconds = self.tempo.beats_to_seconds(beats)
+        time_seconds = beats * self._seconds_per_beat()
+        if self._mixer_batch is not None:
+            self._mixer_batch.append(
+                AutomationEvent(
+                    time_seconds=float(time_seconds),
+                    module=module_name,
+                    parameter=parameter,
+                    value=value,
+                    source=source,
+                )
+            )
+            return
         self._mixer.schedule_parameter_change(
             module_name,
             parameter,
@@ -1021,6 +1466,21 @@ class PatternPerformanceBridge:
             source=source,
         )
 
+    @contextmanager
+    def _batched_mixer_changes(self) -> Iterator[None]:
+        """Buffer mixer automation and hand it to the mixer in one batch on exit."""
+
+        if self._mixer is None or self._mixer_batch is not None:
+            yield
+            return
+        self._mixer_batch = []
+        try:
+            yield
+        finally:
+            batch, self._mixer_batch = self._mixer_batch, None
+            if batch:
+                self._mixer.schedule_parameter_changes(batch)
+
     def _get_mixer_parameter(self, module_name: str, parameter: str) -> float | None:
         if self._mixer is None:
             return None
@@ -1061,7 +1521,13 @@ class PatternPerformanceBridge:
         self,
         spec: ParameterSpec,
         metadata: Mapping[str, object],
-    ) -> Callable[[float], float | None]:
+    ) -> Callable[[np.ndarray], np.ndarray]:
+        """Return a function mapping an array of raw lane values to parameter values.
+
+        Every point on a lane shares the same spec and metadata, so the whole
+        lane is mapped with NumPy in one call instead of point by point.
+        """
+
         mode = str(metadata.get("mode", "normalized"))
         range_override = metadata.get("range")
         if isinstance(range_override, tuple) and len(range_override) == 2:
@@ -1078,76 +1544,39 @@ class PatternPerformanceBridge:
         min_value = min(min_override, max_override)
         max_value = max(min_override, max_override)
 
-        def clamp_from_spec(value: float | None) -> float | None:
-            return spec.clamp(value)
-
-        curve_name = str(metadata.get("curve", "linear")).lower()
-        curve_intensity = metadata.get("curve_intensity")
-
-        def apply_curve(normalized: float) -> float:
-            normalized = max(0.0, min(1.0, normalized))
-            if curve_name in {"exponential", "exp", "ease_in"}:
-                exponent = float(curve_intensity) if curve_intensity is not None else 2.0
-                exponent = max(1e-3, exponent)
-                return normalized**exponent
-            if curve_name in {"logarithmic", "log", "ease_out"}:
-                exponent = float(curve_intensity) if curve_intensity is not None else 2.0
-                exponent = max(1e-3, exponent)
-                return normalized ** (1.0 / exponent)
-            if curve_name in {"s_curve", "s-curve", "smooth"}:
-                strength = float(curve_intensity) if curve_intensity is not None else 1.0
-                if strength <= 0.0:
-                    return normalized
-                base = normalized * normalized * (3.0 - 2.0 * normalized)
-                if math.isclose(strength, 1.0, rel_tol=1e-6, abs_tol=1e-6):
-                    return base
-                base = min(max(base, 1e-6), 1.0 - 1e-6)
-                power = max(1e-3, strength)
-                numerator = base**power
-                denominator = numerator + (1.0 - base) ** power
-                if denominator == 0.0:
-                    return base
-                return numerator / denominator
-            return normalized
+        apply_curve = _resolve_curve(
+            str(metadata.get("curve", "linear")).lower(),
+            metadata.get("curve_intensity"),
+        )
+        scale = max_value - min_value
+        spec_minimum = spec.minimum
+        spec_maximum = spec.maximum
 
         if mode == "raw":
-            return lambda raw: clamp_from_spec(float(raw))
+            return lambda raw: np.clip(np.asarray(raw, dtype=np.float64), spec_minimum, spec_maximum)
         if mode == "percent":
-            def mapper_percent(raw: float) -> float | None:
-                percent = max(0.0, min(100.0, float(raw))) / 100.0
-                curved = apply_curve(percent)
-                scaled = min_value + (max_value - min_value) * curved
-                return clamp_from_spec(scaled)
+            def mapper_percent(raw: np.ndarray) -> np.ndarray:
+                percent = np.clip(np.asarray(raw, dtype=np.float64), 0.0, 100.0) / 100.0
+                scaled = min_value + scale * apply_curve(percent)
+                return np.clip(scaled, spec_minimum, spec_maximum)
 
             return mapper_percent
 
         # Default to normalized mapping.
-        def mapper_normalized(raw: float) -> float | None:
-            normalized = max(0.0, min(1.0, float(raw)))
-            curved = apply_curve(normalized)
-            scaled = min_value + (max_value - min_value) * curved
-            return clamp_from_spec(scaled)
+        def mapper_normalized(raw: np.ndarray) -> np.ndarray:
+            normalized = np.clip(np.asarray(raw, dtype=np.float64), 0.0, 1.0)
+            scaled = min_value + scale * apply_curve(normalized)
+            return np.clip(scaled, spec_minimum, spec_maximum)
 
         return mapper_normalized
 
     def _metadata_smoothing_beats(self, metadata: Mapping[str, object] | None) -> float:
         if not metadata:
             return 0.0
-        beats = 0.0
-        smooth_beats = metadata.get("smooth_beats")
-        if smooth_beats is not None:
-            try:
-                beats = max(beats, float(smooth_beats))
-            except (TypeError, ValueError):
-                pass
-        smooth_seconds = metadata.get("smooth_seconds")
-        if smooth_seconds is not None:
-            try:
-                seconds = float(smooth_seconds)
-                seconds_per_beat = max(self.tempo.beats_to_seconds(1.0), 1e-6)
-                beats = max(beats, seconds / seconds_per_beat)
-            except (TypeError, ValueError):
-                pass
+        beats = _parse_float(metadata.get("smooth_beats"), minimum=0.0) or 0.0
+        seconds = _parse_float(metadata.get("smooth_seconds"), minimum=0.0)
+        if seconds is not None:
+            beats = max(beats, seconds / max(self._seconds_per_beat(), 1e-6))
         return beats
 
     def _metadata_smoothing_segments(
@@ -1155,35 +1584,89 @@ class PatternPerformanceBridge:
     ) -> int | None:
         if not metadata:
             return None
-        candidate = metadata.get("smooth_segments") or metadata.get("segments")
+        candidate = metadata.get("smooth_segments")
         if candidate is None:
-            return None
+            candidate = metadata.get("segments")
+            if candidate is None:
+                return None
         try:
             value = int(round(float(candidate)))
         except (TypeError, ValueError):
             return None
         return max(3, value)
 
-    def _beat_frames(self, duration_beats: float) -> List[int]:
-        total_beats = int(math.ceil(duration_beats))
-        frames_per_beat = int(round(self.tempo.beats_to_seconds(1.0) * self.config.sample_rate))
-        return [min(idx * frames_per_beat, int(duration_beats * frames_per_beat)) for idx in range(total_beats)]
+    def _seconds_per_beat(self) -> float:
+        """Return the tempo's beat length, recomputed only when the BPM changes."""
 
-    def _iter_steps(self, pattern: Pattern) -> Iterable[PatternStep]:
-        steps: List[PatternStep] = list(pattern.steps)
-        missing = max(0, pattern.length_steps - len(steps))
-        steps.extend(PatternStep() for _ in range(missing))
-        return steps
+        tempo_bpm = self.tempo.tempo_bpm
+        cached = self._seconds_per_beat_cache
+        if cached is None or cached[0] != tempo_bpm:
+            cached = (tempo_bpm, self.tempo.beats_to_seconds(1.0))
+            self._seconds_per_beat_cache = cached
+        return cached[1]
 
-    def _transpose_for_note(
+    def _frames_per_beat(self) -> int:
+        """Return whole frames per beat for the current tempo and sample rate."""
+
+        tempo_bpm = self.tempo.tempo_bpm
+        sample_rate = self.config.sample_rate
+        cached = self._frames_per_beat_cache
+        if cached is None or cached[0] != tempo_bpm or cached[1] != sample_rate:
+            frames = int(round(self._seconds_per_beat() * sample_rate))
+            cached = (tempo_bpm, sample_rate, frames)
+            self._frames_per_beat_cache = cached
+        return cached[2]
+
+    def _beat_frames(self, duration_beats: float) -> List[int]:
+        total_beats = int(math.ceil(duration_beats))
+        frames_per_beat = self._frames_per_beat()
+        last_frame = int(duration_beats * frames_per_beat)
+        frames = np.arange(total_beats, dtype=np.int64)
+        frames *= frames_per_beat
+        np.minimum(frames, last_frame, out=frames)
+        return frames.tolist()
+
+    def _active_steps(
+        self,
+        pattern: Pattern,
+        instrument: InstrumentDefinition,
+    ) -> List[tuple[int, PatternStep]]:
+        """Return ``(index, step)`` pairs for steps that trigger *instrument*.
+
+        Tracker patterns are mostly rests, so the scheduler only walks the
+        positions that actually carry a note instead of every grid slot.
+        Grid slots past ``pattern.steps`` are implicit rests and are never
+        materialised as ``PatternStep`` models.
+        """
+
+        accepted_instruments = {None, instrument.id}
+        return [
+            (index, step)
+            for index, step in enumerate(pattern.steps)
+            if step.note is not None and step.instrument_id in accepted_instruments
+        ]
+
+    def _sampler_root_note(
         self,
         module: SineOscillator | ClipSampler | AmplitudeEnvelope | OnePoleLowPass,
-        note: int,
-    ) -> float:
-        if not isinstance(module, ClipSampler):
-            return 0.0
-        root = getattr(module, "_root_midi_note", 60)
-        return float(note - root)
+    ) -> int:
+        return int(getattr(module, "_root_midi_note", 60))
+
+
+def _render_pattern_in_worker(
+    config: EngineConfig,
+    tempo: TempoMap,
+    options: dict[str, object],
+    pattern_json: str,
+    instrument_json: str,
+) -> PatternPlayback:
+    """Process-pool entry point for :meth:`PatternPerformanceBridge.render_patterns`."""
+
+    bridge = PatternPerformanceBridge(config, tempo, **options)  # type: ignore[arg-type]
+    return bridge.render_pattern(
+        Pattern.model_validate_json(pattern_json),
+        InstrumentDefinition.model_validate_json(instrument_json),
+    )
 
 
 class _MixerRenderModule(BaseAudioModule):
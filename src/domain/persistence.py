@@ -7,6 +7,25 @@ from typing import Any, Dict
 
 from .models import Project
 
+try:  # pragma: no cover - exercised when the optional accelerator is installed
+    import orjson
+except ImportError:  # pragma: no cover - standard library fallback
+    orjson = None  # type: ignore[assignment]
+
+
+def dump_json_bytes(payload: Any, *, indent: bool = False) -> bytes:
+    """Encode *payload* as UTF-8 JSON, using ``orjson`` when it is installed.
+
+    ``indent`` selects the two-space layout used for project files on disk;
+    otherwise the output is compact.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(payload, indent=2).encode("utf-8")
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
 
 class ProjectSerializer:
     """Serialize :class:`Project` instances to/from JSON-compatible dicts."""
@@ -23,6 +42,18 @@ class ProjectSerializer:
 
         return Project.model_validate(payload)
 
+    @staticmethod
+    def to_json_bytes(project: Project, *, indent: bool = False) -> bytes:
+        """Serialize a project straight to UTF-8 JSON without a dict pass."""
+
+        return project.model_dump_json(indent=2 if indent else None).encode("utf-8")
+
+    @staticmethod
+    def from_json_bytes(data: bytes | bytearray | str) -> Project:
+        """Parse and validate a project from JSON in a single pass."""
+
+        return Project.model_validate_json(data)
+
 
 class ProjectFileAdapter:
     """Filesystem adapter that persists project documents under a base path."""
@@ -33,15 +64,18 @@ class ProjectFileAdapter:
     def save(self, project: Project, filename: str) -> Path:
         """Write the project to ``base_path / filename`` and return the path."""
 
+        return self.save_bytes(ProjectSerializer.to_json_bytes(project, indent=True), filename)
+
+    def save_bytes(self, payload: bytes, filename: str) -> Path:
+        """Write an already serialized project document and return the path."""
+
         destination = self.base_path / filename
         destination.parent.mkdir(parents=True, exist_ok=True)
-        data = json.dumps(ProjectSerializer.to_dict(project), indent=2)
-        destination.write_text(data, encoding="utf-8")
+        destination.write_bytes(payload)
         return destination
 
     def load(self, filename: str) -> Project:
         """Load the project stored at ``base_path / filename``."""
 
         source = self.base_path / filename
-        payload = json.loads(source.read_text(encoding="utf-8"))
-        return ProjectSerializer.from_dict(payload)
+        return ProjectSerializer.from_json_bytes(source.read_bytes())
@@ -1,23 +1,24 @@
 """High-level helper that exports project bundles with manifests and assets."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-import json
-import shutil
 from pathlib import Path
-from typing import List, Sequence
+from typing import List, Mapping, Sequence
 
-from .models import Project
+from .models import Pattern, Project
 from .persistence import ProjectSerializer
 from .project_manifest import (
-    MixerSnapshotRecord,
+    ChecksumCache,
     ProjectManifestBuilder,
     SamplerAssetRecord,
     SamplerManifestIndex,
+    compute_file_sha256_many,
+    copy_file_fast,
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MixerSnapshotSpec:
     """Describe a mixer snapshot file that should be bundled."""
 
@@ -27,7 +28,7 @@ class MixerSnapshotSpec:
     destination_name: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SamplerAssetSpec:
     """Describe a sampler asset that should be copied into the bundle."""
 
@@ -35,7 +36,7 @@ class SamplerAssetSpec:
     source_path: Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProjectExportResult:
     """Summaries of exported paths useful for logging or tooling."""
 
@@ -49,8 +50,14 @@ class ProjectExportResult:
 class ProjectExportService:
     """Serialize projects, mixer snapshots, and sampler assets in one step."""
 
-    def __init__(self, *, sampler_manifest: SamplerManifestIndex | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        sampler_manifest: SamplerManifestIndex | None = None,
+        checksum_cache: ChecksumCache | None = None,
+    ) -> None:
         self._sampler_manifest = sampler_manifest
+        self._checksum_cache = checksum_cache
 
     def export_project(
         self,
@@ -62,7 +69,9 @@ class ProjectExportService:
         write_project_copy: bool = True,
     ) -> ProjectExportResult:
         bundle_root.mkdir(parents=True, exist_ok=True)
-        builder = ProjectManifestBuilder(project, base_path=bundle_root)
+        builder = ProjectManifestBuilder(
+            project, base_path=bundle_root, checksum_cache=self._checksum_cache
+        )
 
         pattern_paths = self._export_patterns(project, bundle_root, builder)
         snapshot_paths = self._export_snapshots(snapshot_specs or [], bundle_root, builder)
@@ -71,6 +80,8 @@ class ProjectExportService:
         manifest_path = builder.write(bundle_root / "project_manifest.json")
         if write_project_copy:
             self._write_project_document(project, bundle_root / "project.json")
+        if self._checksum_cache is not None:
+            self._checksum_cache.save()
 
         return ProjectExportResult(
             bundle_root=bundle_root,
@@ -84,9 +95,8 @@ class ProjectExportService:
     # Internal helpers
     # ------------------------------------------------------------------
     def _write_project_document(self, project: Project, destination: Path) -> None:
-        payload = ProjectSerializer.to_dict(project)
         destination.parent.mkdir(parents=True, exist_ok=True)
-        destination.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        destination.write_bytes(ProjectSerializer.to_json_bytes(project, indent=True))
 
     def _export_patterns(
         self,
@@ -94,15 +104,21 @@ class ProjectExportService:
         bundle_root: Path,
         builder: ProjectManifestBuilder,
     ) -> List[Path]:
-        exports: List[Path] = []
         patterns_dir = bundle_root / "patterns"
         patterns_dir.mkdir(parents=True, exist_ok=True)
-        for pattern_id in sorted(project.patterns.keys()):
-            pattern = project.patterns[pattern_id]
-            destination = patterns_dir / f"{pattern.id}.json"
-            destination.write_text(pattern.model_dump_json(indent=2), encoding="utf-8")
-            builder.add_pattern_file(pattern.id, destination)
-            exports.append(destination)
+        patterns = [project.patterns[pattern_id] for pattern_id in sorted(project.patterns.keys())]
+        exports: List[Path] = [patterns_dir / f"{pattern.id}.json" for pattern in patterns]
+        # Serialization and file writes release the GIL, so overlap them.
+        if len(patterns) > 1:
+            with ThreadPoolExecutor(max_workers=min(4, len(patterns))) as executor:
+                list(executor.map(_write_pattern, patterns, exports))
+        else:
+            for pattern, destination in zip(patterns, exports, strict=True):
+                _write_pattern(pattern, destination)
+        # Hash every written file together so the builder skips its own reads.
+        digests = compute_file_sha256_many(exports, cache=self._checksum_cache)
+        for pattern_id, destination in zip(sorted(project.patterns.keys()), exports, strict=True):
+            builder.add_pattern_file(pattern_id, destination, sha256=digests[destination])
         return exports
 
     def _export_snapshots(
@@ -116,18 +132,23 @@ class ProjectExportService:
             return exports
         mixer_dir = bundle_root / "mixer"
         mixer_dir.mkdir(parents=True, exist_ok=True)
+        destinations: List[Path] = []
         for spec in specs:
             if not spec.path.exists():
                 raise FileNotFoundError(f"Mixer snapshot '{spec.path}' does not exist")
             destination_name = spec.destination_name or spec.path.name
             destination = mixer_dir / destination_name
-            shutil.copy2(spec.path, destination)
-            record: MixerSnapshotRecord = builder.add_mixer_snapshot(
+            copy_file_fast(spec.path, destination)
+            destinations.append(destination)
+        digests = compute_file_sha256_many(destinations, cache=self._checksum_cache)
+        for spec, destination in zip(specs, destinations, strict=True):
+            builder.add_mixer_snapshot(
                 spec.name,
                 destination,
                 snapshot_type=spec.snapshot_type,
+                sha256=digests[destination],
             )
-            exports.append(bundle_root / Path(record.path))
+            exports.append(destination)
         return exports
 
     def _export_assets(
@@ -145,17 +166,36 @@ class ProjectExportService:
         for spec in specs:
             if not spec.source_path.exists():
                 raise FileNotFoundError(f"Sampler asset '{spec.source_path}' does not exist")
-            record: SamplerAssetRecord = self._sampler_manifest.copy_asset(
+        # With a checksum cache, unchanged sources skip hashing entirely;
+        # otherwise copy_asset hashes each file while copying it.
+        digests: Mapping[Path, str] = {}
+        if self._checksum_cache is not None:
+            digests = compute_file_sha256_many(
+                (spec.source_path for spec in specs), cache=self._checksum_cache
+            )
+        sampler_manifest = self._sampler_manifest
+
+        def copy_one(spec: SamplerAssetSpec) -> SamplerAssetRecord:
+            return sampler_manifest.copy_asset(
                 asset_name=spec.asset_name,
                 source_path=spec.source_path,
+                source_sha256=digests.get(spec.source_path),
                 destination_dir=assets_dir,
                 relative_to=bundle_root,
             )
+
+        with ThreadPoolExecutor(max_workers=min(4, len(specs))) as executor:
+            records = list(executor.map(copy_one, specs))
+        for record in records:
             builder.add_sampler_asset(record)
-            exports.append(bundle_root / record.relative_path)
+            exports.append(assets_dir / record.asset_name)
         return exports
 
 
+def _write_pattern(pattern: Pattern, destination: Path) -> None:
+    destination.write_bytes(pattern.model_dump_json(indent=2).encode("utf-8"))
+
+
 __all__ = [
     "MixerSnapshotSpec",
     "SamplerAssetSpec",
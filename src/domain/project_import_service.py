@@ -1,24 +1,28 @@
 """Helpers that hydrate project bundles exported via :mod:`project_export_service`."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-import json
+import hashlib
+import os
 from pathlib import Path
-import shutil
-from typing import List
+from typing import List, Mapping
 
 from .models import Project
 from .persistence import ProjectSerializer
 from .project_manifest import (
+    ChecksumCache,
     MixerSnapshotRecord,
     PatternFileRecord,
     ProjectManifest,
     SamplerAssetRecord,
     compute_file_sha256,
+    compute_file_sha256_many,
+    copy_file_fast,
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImportedPattern:
     """Record describing a restored pattern JSON file."""
 
@@ -26,7 +30,7 @@ class ImportedPattern:
     path: Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImportedMixerSnapshot:
     """Record describing a restored mixer snapshot."""
 
@@ -34,7 +38,7 @@ class ImportedMixerSnapshot:
     path: Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImportedSamplerAsset:
     """Record describing a restored sampler asset."""
 
@@ -42,7 +46,7 @@ class ImportedSamplerAsset:
     path: Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProjectImportResult:
     """Summary describing the hydrated bundle contents."""
 
@@ -63,6 +67,9 @@ class ProjectImportResult:
 class ProjectImportService:
     """Load and validate exported bundles destined for musician testers."""
 
+    def __init__(self, *, checksum_cache: ChecksumCache | None = None) -> None:
+        self._checksum_cache = checksum_cache
+
     def import_bundle(
         self,
         bundle_root: Path,
@@ -77,33 +84,59 @@ class ProjectImportService:
             raise FileNotFoundError(
                 f"Manifest '{manifest_path}' not found; verify bundle_root is correct."
             )
-        manifest_payload = json.loads(manifest_path.read_text(encoding="utf-8"))
-        manifest = ProjectManifest.model_validate(manifest_payload)
-        manifest_sha = compute_file_sha256(manifest_path)
+        manifest_bytes = manifest_path.read_bytes()
+        manifest = ProjectManifest.model_validate_json(manifest_bytes)
+        manifest_sha = hashlib.sha256(manifest_bytes).hexdigest()
+        # Hash every referenced file that exists in one concurrent batch;
+        # missing files still fail in record order below.
+        candidates = [bundle_root / Path(record.path) for record in manifest.patterns]
+        candidates.extend(bundle_root / Path(record.path) for record in manifest.mixer_snapshots)
+        candidates.extend(
+            bundle_root / Path(record.relative_path) for record in manifest.sampler_assets
+        )
+        digests = compute_file_sha256_many(
+            (path for path in candidates if path.exists()), cache=self._checksum_cache
+        )
 
         project_path = bundle_root / project_filename
         project: Project | None = None
         if project_path.exists():
-            project_payload = json.loads(project_path.read_text(encoding="utf-8"))
-            project = ProjectSerializer.from_dict(project_payload)
+            project = ProjectSerializer.from_json_bytes(project_path.read_bytes())
 
         copied_root = None
         if destination_root is not None:
             copied_root = Path(destination_root)
             copied_root.mkdir(parents=True, exist_ok=True)
+            # Create each destination directory once instead of per record.
+            relative_paths = [record.path for record in manifest.patterns]
+            relative_paths.extend(record.path for record in manifest.mixer_snapshots)
+            relative_paths.extend(record.relative_path for record in manifest.sampler_assets)
+            for directory in {(copied_root / Path(path)).parent for path in relative_paths}:
+                directory.mkdir(parents=True, exist_ok=True)
+
+        # Checksums are already known, so each record is a lookup plus an
+        # optional copy; copies overlap on a thread pool. ``map`` keeps record
+        # order, so the first failure raised matches a serial import.
+        workers = min(8, (os.cpu_count() or 1) * 2) if copied_root is not None else 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pattern_results = executor.map(
+                lambda record: self._import_pattern(bundle_root, record, copied_root, digests),
+                manifest.patterns,
+            )
+            snapshot_results = executor.map(
+                lambda record: self._import_snapshot(bundle_root, record, copied_root, digests),
+                manifest.mixer_snapshots,
+            )
+            asset_results = executor.map(
+                lambda record: self._import_asset(bundle_root, record, copied_root, digests),
+                manifest.sampler_assets,
+            )
+            imported_patterns = list(pattern_results)
+            imported_snapshots = list(snapshot_results)
+            imported_assets = list(asset_results)
 
-        imported_patterns = [
-            self._import_pattern(bundle_root, record, copied_root)
-            for record in manifest.patterns
-        ]
-        imported_snapshots = [
-            self._import_snapshot(bundle_root, record, copied_root)
-            for record in manifest.mixer_snapshots
-        ]
-        imported_assets = [
-            self._import_asset(bundle_root, record, copied_root)
-            for record in manifest.sampler_assets
-        ]
+        if self._checksum_cache is not None:
+            self._checksum_cache.save()
 
         if copied_root is not None:
             self._copy_optional(bundle_root / project_filename, copied_root / project_filename)
@@ -128,9 +161,12 @@ class ProjectImportService:
         bundle_root: Path,
         record: PatternFileRecord,
         copied_root: Path | None,
+        digests: Mapping[Path, str],
     ) -> ImportedPattern:
         source = self._resolve(bundle_root, record.path)
-        self._verify_checksum(source, record.sha256, label=f"Pattern {record.pattern_id}")
+        self._verify_checksum(
+            source, record.sha256, label=f"Pattern {record.pattern_id}", digests=digests
+        )
         destination = self._copy_relative(source, copied_root, record.path)
         return ImportedPattern(record=record, path=destination or source)
 
@@ -139,9 +175,12 @@ class ProjectImportService:
         bundle_root: Path,
         record: MixerSnapshotRecord,
         copied_root: Path | None,
+        digests: Mapping[Path, str],
     ) -> ImportedMixerSnapshot:
         source = self._resolve(bundle_root, record.path)
-        self._verify_checksum(source, record.sha256, label=f"Snapshot {record.name}")
+        self._verify_checksum(
+            source, record.sha256, label=f"Snapshot {record.name}", digests=digests
+        )
         destination = self._copy_relative(source, copied_root, record.path)
         return ImportedMixerSnapshot(record=record, path=destination or source)
 
@@ -150,9 +189,12 @@ class ProjectImportService:
         bundle_root: Path,
         record: SamplerAssetRecord,
         copied_root: Path | None,
+        digests: Mapping[Path, str],
     ) -> ImportedSamplerAsset:
         source = self._resolve(bundle_root, record.relative_path)
-        self._verify_checksum(source, record.sha256, label=f"Asset {record.asset_name}")
+        self._verify_checksum(
+            source, record.sha256, label=f"Asset {record.asset_name}", digests=digests
+        )
         destination = self._copy_relative(source, copied_root, record.relative_path)
         return ImportedSamplerAsset(record=record, path=destination or source)
 
@@ -168,8 +210,7 @@ class ProjectImportService:
         if copied_root is None:
             return None
         destination = copied_root / Path(relative_path)
-        destination.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(source, destination)
+        copy_file_fast(source, destination)
         return destination
 
     @staticmethod
@@ -177,11 +218,19 @@ class ProjectImportService:
         if not source.exists():
             return
         destination.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(source, destination)
+        copy_file_fast(source, destination)
 
     @staticmethod
-    def _verify_checksum(path: Path, expected_sha: str, *, label: str) -> None:
-        actual = compute_file_sha256(path)
+    def _verify_checksum(
+        path: Path,
+        expected_sha: str,
+        *,
+        label: str,
+        digests: Mapping[Path, str] | None = None,
+    ) -> None:
+        actual = digests.get(path) if digests is not None else None
+        if actual is None:
+            actual = compute_file_sha256(path)
         if actual != expected_sha:
             raise ValueError(
                 f"{label} checksum mismatch; expected {expected_sha} but found {actual}"
@@ -1,15 +1,18 @@
 """Step 8 project manifest schema plus asset import/export helpers."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 import hashlib
 import json
+import os
 from pathlib import Path
 import shutil
-from typing import List, Mapping, Sequence
+import threading
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from .models import Pattern, Project
 
@@ -80,9 +83,11 @@ class ProjectManifestBuilder:
         *,
         base_path: Path | None = None,
         manifest_version: str = "1.0.0",
+        checksum_cache: ChecksumCache | None = None,
     ) -> None:
         self._project = project
-        self._base_path = base_path
+        self._checksum_cache = checksum_cache
+        self._resolved_base = base_path.resolve() if base_path is not None else None
         self._manifest_version = manifest_version
         self._patterns: dict[str, PatternFileRecord] = {}
         self._snapshots: List[MixerSnapshotRecord] = []
@@ -90,10 +95,10 @@ class ProjectManifestBuilder:
 
     def _relative_path(self, path: Path) -> str:
         normalized = Path(path)
-        if self._base_path is None:
+        if self._resolved_base is None:
             return normalized.as_posix()
         try:
-            return normalized.resolve().relative_to(self._base_path.resolve()).as_posix()
+            return normalized.resolve().relative_to(self._resolved_base).as_posix()
         except ValueError:
             return normalized.as_posix()
 
@@ -113,7 +118,7 @@ class ProjectManifestBuilder:
         record = PatternFileRecord(
             pattern_id=pattern_id,
             path=self._relative_path(path),
-            sha256=sha256 or compute_file_sha256(path),
+            sha256=sha256 or compute_file_sha256_cached(path, self._checksum_cache),
             length_steps=pattern.length_steps,
             step_count=step_count if step_count is not None else len(pattern.steps),
         )
@@ -133,7 +138,7 @@ class ProjectManifestBuilder:
         record = MixerSnapshotRecord(
             name=name,
             path=self._relative_path(path),
-            sha256=sha256 or compute_file_sha256(path),
+            sha256=sha256 or compute_file_sha256_cached(path, self._checksum_cache),
             snapshot_type=snapshot_type,
         )
         self._snapshots.append(record)
@@ -169,7 +174,7 @@ class ProjectManifestBuilder:
 
         manifest = self.build()
         destination.parent.mkdir(parents=True, exist_ok=True)
-        destination.write_text(manifest.model_dump_json(indent=2), encoding="utf-8")
+        destination.write_bytes(manifest.model_dump_json(indent=2).encode("utf-8"))
         return destination
 
 
@@ -182,6 +187,19 @@ class SamplerManifestAsset(BaseModel):
     lufs: float | None = None
     peak_dbfs: float | None = None
     sha256: str
+    size: int | None = Field(
+        None, description="Byte length used to reject mismatched files before hashing"
+    )
+
+
+def _name_suffix(name: str) -> str:
+    """Return ``Path(name).suffix`` using plain string scans."""
+
+    base = name.rstrip("/").rpartition("/")[2]
+    dot = base.rfind(".")
+    if dot <= 0 or dot == len(base) - 1:
+        return ""
+    return base[dot:]
 
 
 class SamplerManifestIndex(BaseModel):
@@ -192,6 +210,30 @@ class SamplerManifestIndex(BaseModel):
     last_updated: datetime
     assets: List[SamplerManifestAsset]
 
+    _assets_by_name: Dict[str, SamplerManifestAsset] = PrivateAttr(default_factory=dict)
+    _assets_by_sha: Dict[str, SamplerManifestAsset] = PrivateAttr(default_factory=dict)
+    _extensions: Tuple[str, ...] = PrivateAttr(default=())
+    _indexed: Tuple[List[SamplerManifestAsset] | None, int] = PrivateAttr(default=(None, 0))
+
+    def _refresh_index(self) -> None:
+        # ``model_copy`` carries private attributes over and ``assets`` may be
+        # reassigned or grown, so rebuild whenever the list object or its
+        # length differs from the one last indexed. The first entry wins,
+        # matching the order a linear scan of ``assets`` would return.
+        assets = self.assets
+        indexed_assets, indexed_count = self._indexed
+        if indexed_assets is assets and indexed_count == len(assets):
+            return
+        by_name: Dict[str, SamplerManifestAsset] = {}
+        by_sha: Dict[str, SamplerManifestAsset] = {}
+        for asset in assets:
+            by_name.setdefault(asset.name, asset)
+            by_sha.setdefault(asset.sha256, asset)
+        self._assets_by_name = by_name
+        self._assets_by_sha = by_sha
+        self._extensions = tuple(sorted({_name_suffix(asset.name) for asset in assets}))
+        self._indexed = (assets, len(assets))
+
     @classmethod
     def from_payload(cls, payload: Mapping[str, object]) -> "SamplerManifestIndex":
         """Hydrate from a raw dict (loaded JSON)."""
@@ -202,13 +244,13 @@ class SamplerManifestIndex(BaseModel):
     def from_file(cls, path: Path) -> "SamplerManifestIndex":
         """Load a sampler manifest JSON export from disk."""
 
-        payload = json.loads(path.read_text(encoding="utf-8"))
-        return cls.from_payload(payload)
+        return cls.model_validate_json(path.read_bytes())
 
     def dialog_filters(self) -> List[Mapping[str, Sequence[str]]]:
         """Return file-dialog filters referencing manifest extensions."""
 
-        extensions = sorted({Path(asset.name).suffix or "" for asset in self.assets})
+        self._refresh_index()
+        extensions = self._extensions
         patterns = [f"*{ext}" if ext else "*" for ext in extensions]
         return [
             {
@@ -218,16 +260,26 @@ class SamplerManifestIndex(BaseModel):
         ]
 
     def _asset_by_name(self, asset_name: str) -> SamplerManifestAsset:
-        for asset in self.assets:
-            if asset.name == asset_name:
-                return asset
-        raise KeyError(f"Asset {asset_name!r} not found in sampler manifest")
+        self._refresh_index()
+        try:
+            return self._assets_by_name[asset_name]
+        except KeyError:
+            raise KeyError(f"Asset {asset_name!r} not found in sampler manifest") from None
 
     def _asset_by_sha(self, sha256: str) -> SamplerManifestAsset:
-        for asset in self.assets:
-            if asset.sha256 == sha256:
-                return asset
-        raise KeyError(f"Asset with sha {sha256} not found in sampler manifest")
+        self._refresh_index()
+        try:
+            return self._assets_by_sha[sha256]
+        except KeyError:
+            raise KeyError(f"Asset with sha {sha256} not found in sampler manifest") from None
+
+    @staticmethod
+    def _require_checksum(asset: SamplerManifestAsset, checksum: str) -> None:
+        if asset.sha256 != checksum:
+            raise ValueError(
+                "Source file checksum mismatch; expected "
+                f"{asset.sha256} but got {checksum}"
+            )
 
     def copy_asset(
         self,
@@ -237,25 +289,53 @@ class SamplerManifestIndex(BaseModel):
         source_path: Path,
         destination_dir: Path,
         relative_to: Path | None = None,
+        source_sha256: str | None = None,
+        verify: bool = True,
     ) -> SamplerAssetRecord:
-        """Copy an asset referenced by the manifest and record metadata."""
+        """Copy an asset referenced by the manifest and record metadata.
+
+        ``source_sha256`` supplies an already computed checksum for
+        ``source_path``. ``verify=False`` trusts the manifest checksum and
+        skips reading the source for hashing altogether.
+        """
 
         if asset_name is None and sha256 is None:
             raise ValueError("Provide either asset_name or sha256")
-        checksum = compute_file_sha256(source_path)
         asset: SamplerManifestAsset
         if asset_name is not None:
             asset = self._asset_by_name(asset_name)
         else:
-            asset = self._asset_by_sha(sha256 or checksum)
-        if asset.sha256 != checksum:
-            raise ValueError(
-                "Source file checksum mismatch; expected "
-                f"{asset.sha256} but got {checksum}"
-            )
-        destination_dir.mkdir(parents=True, exist_ok=True)
+            asset = self._asset_by_sha(sha256 or "")
+        checksum: str | None
+        if not verify:
+            checksum = asset.sha256
+        else:
+            # A wrong file almost always differs in length, which a stat call
+            # reveals without reading the whole sample.
+            if asset.size is not None:
+                size = source_path.stat().st_size
+                if size != asset.size:
+                    raise ValueError(
+                        "Source file size mismatch; expected "
+                        f"{asset.size} bytes but got {size}"
+                    )
+            checksum = source_sha256
         destination_path = destination_dir / asset.name
-        shutil.copy2(source_path, destination_path)
+        if checksum is None:
+            # Read the sample once, hashing while copying into a staging file
+            # that only replaces the destination when the checksum matches.
+            destination_dir.mkdir(parents=True, exist_ok=True)
+            staging_path = destination_dir / f".{asset.name}.{threading.get_ident()}.partial"
+            try:
+                checksum = copy_and_hash(source_path, staging_path)
+                self._require_checksum(asset, checksum)
+                os.replace(staging_path, destination_path)
+            finally:
+                staging_path.unlink(missing_ok=True)
+        else:
+            self._require_checksum(asset, checksum)
+            destination_dir.mkdir(parents=True, exist_ok=True)
+            copy_file_fast(source_path, destination_path)
         relative_path = destination_path.as_posix()
         if relative_to is not None:
             try:
@@ -276,13 +356,150 @@ class SamplerManifestIndex(BaseModel):
 def compute_file_sha256(path: Path) -> str:
     """Return the SHA-256 digest for ``path``."""
 
-    hasher = hashlib.sha256()
+    # file_digest feeds the hash from a reused buffer without allocating a
+    # bytes object per chunk.
     with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(65536), b""):
-            hasher.update(chunk)
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+class ChecksumCache:
+    """JSON-backed SHA-256 cache keyed by ``(st_mtime_ns, st_size)``.
+
+    Re-exporting or re-importing unchanged files reuses the stored digest
+    instead of reading the file again. Call :meth:`save` to persist updates.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._entries: Dict[str, Tuple[int, int, str]] = {}
+        self._dirty = False
+        if path is not None and path.exists():
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                payload = {}
+            for key, entry in payload.items() if isinstance(payload, dict) else ():
+                if isinstance(entry, list) and len(entry) == 3:
+                    self._entries[key] = (int(entry[0]), int(entry[1]), str(entry[2]))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def digest(self, path: Path) -> str:
+        """Return the SHA-256 for ``path``, hashing only when it changed."""
+
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        cached = self._entries.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        checksum = compute_file_sha256(Path(path))
+        self._entries[key] = (stat.st_mtime_ns, stat.st_size, checksum)
+        self._dirty = True
+        return checksum
+
+    def save(self) -> None:
+        """Write pending entries to :attr:`path` when one is configured."""
+
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        staging = self.path.with_name(f"{self.path.name}.tmp")
+        payload = {key: list(entry) for key, entry in self._entries.items()}
+        staging.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(staging, self.path)
+        self._dirty = False
+
+
+def compute_file_sha256_cached(path: Path, cache: ChecksumCache | None) -> str:
+    """Return the SHA-256 for ``path`` through ``cache`` when one is given."""
+
+    if cache is None:
+        return compute_file_sha256(path)
+    return cache.digest(path)
+
+
+def compute_file_sha256_many(
+    paths: Iterable[Path],
+    *,
+    max_workers: int | None = None,
+    cache: ChecksumCache | None = None,
+) -> Dict[Path, str]:
+    """Return ``{path: sha256}`` for *paths*, hashing files concurrently.
+
+    hashlib releases the GIL while digesting, so a thread pool overlaps disk
+    reads and hashing across bundle files. Duplicate paths are hashed once,
+    and ``cache`` lets unchanged files reuse digests from earlier runs.
+    """
+
+    unique = list(dict.fromkeys(paths))
+    digest = compute_file_sha256 if cache is None else cache.digest
+    if len(unique) <= 1:
+        return {path: digest(path) for path in unique}
+    workers = max_workers or min(32, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=min(workers, len(unique))) as executor:
+        return dict(zip(unique, executor.map(digest, unique), strict=True))
+
+
+def copy_file_fast(source: Path, destination: Path) -> Path:
+    """Copy *source* to *destination* with metadata, like :func:`shutil.copy2`.
+
+    On Linux the contents move through ``os.copy_file_range`` so the kernel
+    can reflink on copy-on-write filesystems instead of streaming bytes.
+    Other platforms, and filesystems that reject the syscall, fall back to
+    :func:`shutil.copyfile`.
+    """
+
+    source = Path(source)
+    destination = Path(destination)
+    if not _copy_file_range(source, destination):
+        shutil.copyfile(source, destination)
+    shutil.copystat(source, destination)
+    return destination
+
+
+def copy_and_hash(source: Path, destination: Path) -> str:
+    """Copy *source* to *destination* and return its SHA-256 in one read pass.
+
+    File metadata is preserved like :func:`shutil.copy2`.
+    """
+
+    hasher = hashlib.sha256()
+    buffer = bytearray(1 << 20)
+    view = memoryview(buffer)
+    with Path(source).open("rb") as reader, Path(destination).open("wb") as writer:
+        while True:
+            read = reader.readinto(buffer)
+            if not read:
+                break
+            hasher.update(view[:read])
+            writer.write(view[:read])
+    shutil.copystat(source, destination)
     return hasher.hexdigest()
 
 
+def _copy_file_range(source: Path, destination: Path) -> bool:
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None:
+        return False
+    if destination.exists() and os.path.samefile(source, destination):
+        raise shutil.SameFileError(f"{source} and {destination} are the same file")
+    with source.open("rb") as reader:
+        remaining = os.fstat(reader.fileno()).st_size
+        with destination.open("wb") as writer:
+            try:
+                while remaining > 0:
+                    copied = copy_range(reader.fileno(), writer.fileno(), remaining)
+                    if copied == 0:
+                        # Some filesystems report 0 instead of an error; let
+                        # the caller redo the copy rather than keep a short file.
+                        return False
+                    remaining -= copied
+            except OSError:
+                return False
+    return True
+
+
 @dataclass(frozen=True)
 class ProjectImportPlan:
     """Lightweight container summarizing import dialog expectations."""
@@ -8,15 +8,20 @@ subsequent steps can expand capabilities without breaking callers.
 """
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 import json
 import os
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
+from functools import lru_cache
 import time
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Protocol, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Protocol, Tuple
 
-from .models import Project
+from pydantic import BaseModel
+
+from .models import Project, ProjectMetadata
 from .persistence import ProjectFileAdapter, ProjectSerializer
 
 
@@ -28,7 +33,47 @@ class ProjectNotFoundError(ProjectRepositoryError):
     """Raised when a requested project cannot be located."""
 
 
-@dataclass(frozen=True)
+_boto3: Any | None = None
+
+
+def _get_boto3() -> Any:
+    """Import ``boto3`` on first use and reuse the module afterwards."""
+
+    global _boto3
+    if _boto3 is None:
+        try:
+            import boto3
+        except ImportError as exc:  # pragma: no cover - depends on optional dependency
+            raise ProjectRepositoryError(
+                "boto3 is required to configure S3ProjectRepository from the environment"
+            ) from exc
+        _boto3 = boto3
+    return _boto3
+
+
+@lru_cache(maxsize=8)
+def _s3_client(
+    access_key_id: str | None,
+    secret_access_key: str | None,
+    session_token: str | None,
+    region_name: str | None,
+    endpoint_url: str | None,
+) -> Any:
+    """Build (once per credential set) a thread-safe boto3 S3 client."""
+
+    session = _get_boto3().session.Session(
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+        aws_session_token=session_token,
+        region_name=region_name,
+    )
+    client_kwargs: Dict[str, Any] = {}
+    if endpoint_url:
+        client_kwargs["endpoint_url"] = endpoint_url
+    return session.client("s3", **client_kwargs)
+
+
+@dataclass(frozen=True, slots=True)
 class ProjectSummary:
     """Lightweight descriptor for enumerating stored projects."""
 
@@ -38,6 +83,22 @@ class ProjectSummary:
     location: str
 
 
+def _make_summary(metadata: ProjectMetadata, location: str) -> ProjectSummary:
+    """Describe a project from its metadata at ``location``."""
+
+    return ProjectSummary(metadata.id, metadata.name, metadata.updated_at, location)
+
+
+class _ProjectHeader(BaseModel):
+    """Metadata-only view of a project document used for listings.
+
+    Sibling fields such as ``patterns`` are ignored, so pydantic-core skips
+    building the pattern and step models entirely.
+    """
+
+    metadata: ProjectMetadata
+
+
 class ProjectRepository(Protocol):
     """Minimal interface shared by local and remote repositories."""
 
@@ -57,80 +118,168 @@ class ProjectRepository(Protocol):
 class LocalProjectRepository(ProjectRepository):
     """Filesystem-backed repository using :class:`ProjectFileAdapter`."""
 
-    def __init__(self, adapter: ProjectFileAdapter, *, extension: str = ".json") -> None:
+    def __init__(
+        self,
+        adapter: ProjectFileAdapter,
+        *,
+        extension: str = ".json",
+        max_workers: int = 8,
+    ) -> None:
         self._adapter = adapter
         self._extension = extension
+        self._max_workers = max(1, max_workers)
+        # Summaries keyed by path and validated against (st_mtime_ns, st_size)
+        # so repeated listings only parse files that changed on disk. The
+        # cache is persisted to ``INDEX_FILENAME`` so new processes start warm.
+        self._summary_cache: Dict[Path, Tuple[int, int, ProjectSummary]] = {}
+        self._index_loaded = False
+
+    INDEX_FILENAME = ".index.json"
 
     def _path_for(self, identifier: str) -> Path:
         return self._adapter.base_path / f"{identifier}{self._extension}"
 
+    def _read_manifest(self) -> None:
+        if self._index_loaded:
+            return
+        self._index_loaded = True
+        index_path = self._adapter.base_path / self.INDEX_FILENAME
+        try:
+            payload = json.loads(index_path.read_bytes())
+            for filename, (mtime_ns, size, identifier, name, updated_at) in payload.items():
+                file_path = self._adapter.base_path / filename
+                summary = ProjectSummary(
+                    identifier=identifier,
+                    name=name,
+                    updated_at=datetime.fromisoformat(updated_at),
+                    location=str(file_path),
+                )
+                self._summary_cache.setdefault(file_path, (int(mtime_ns), int(size), summary))
+        except (OSError, ValueError, TypeError, AttributeError):
+            # A missing or unreadable index only costs a cold listing.
+            return
+
+    def _write_manifest(self) -> None:
+        payload = {
+            file_path.name: [
+                mtime_ns,
+                size,
+                summary.identifier,
+                summary.name,
+                summary.updated_at.isoformat(),
+            ]
+            for file_path, (mtime_ns, size, summary) in sorted(self._summary_cache.items())
+        }
+        index_path = self._adapter.base_path / self.INDEX_FILENAME
+        staging = index_path.with_name(f"{index_path.name}.tmp")
+        try:
+            staging.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(staging, index_path)
+        except OSError:  # pragma: no cover - index is a best-effort accelerator
+            staging.unlink(missing_ok=True)
+
     def save(self, project: Project) -> ProjectSummary:
         destination = self._adapter.save(project, f"{project.metadata.id}{self._extension}")
-        return ProjectSummary(
-            identifier=project.metadata.id,
-            name=project.metadata.name,
-            updated_at=project.metadata.updated_at,
-            location=str(destination),
-        )
+        summary = _make_summary(project.metadata, str(destination))
+        self._read_manifest()
+        stat = destination.stat()
+        self._summary_cache[destination] = (stat.st_mtime_ns, stat.st_size, summary)
+        self._write_manifest()
+        return summary
 
     def load(self, identifier: str) -> Project:
         path = self._path_for(identifier)
-        if not path.exists():
-            raise ProjectNotFoundError(f"Project {identifier!r} not found at {path}")
-        return self._adapter.load(path.name)
+        try:
+            return self._adapter.load(path.name)
+        except FileNotFoundError as exc:
+            raise ProjectNotFoundError(f"Project {identifier!r} not found at {path}") from exc
 
     def delete(self, identifier: str) -> None:
         path = self._path_for(identifier)
-        if not path.exists():
-            raise ProjectNotFoundError(f"Project {identifier!r} not found at {path}")
-        path.unlink()
+        try:
+            path.unlink()
+        except FileNotFoundError as exc:
+            raise ProjectNotFoundError(f"Project {identifier!r} not found at {path}") from exc
+        self._read_manifest()
+        if self._summary_cache.pop(path, None) is not None:
+            self._write_manifest()
 
     def list(self) -> Iterable[ProjectSummary]:
-        for file_path in sorted(self._adapter.base_path.glob(f"*{self._extension}")):
-            payload = self._adapter.load(file_path.name)
-            yield ProjectSummary(
-                identifier=payload.metadata.id,
-                name=payload.metadata.name,
-                updated_at=payload.metadata.updated_at,
-                location=str(file_path),
-            )
+        self._read_manifest()
+        try:
+            with os.scandir(self._adapter.base_path) as iterator:
+                entries = [
+                    entry
+                    for entry in iterator
+                    if entry.name.endswith(self._extension)
+                    and entry.name != self.INDEX_FILENAME
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            entries = []
+        entries.sort(key=lambda entry: entry.name)
+        paths = [Path(entry.path) for entry in entries]
+        removed = self._summary_cache.keys() - set(paths)
+        for file_path in removed:
+            del self._summary_cache[file_path]
+        stats = [entry.stat() for entry in entries]
+        stale: List[Path] = []
+        for file_path, stat in zip(paths, stats, strict=True):
+            cached = self._summary_cache.get(file_path)
+            if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+                stale.append(file_path)
+        # Reads are independent and mostly I/O-bound, so overlap them on
+        # slow or network-mounted disks; map keeps directory order.
+        if len(stale) > 1 and self._max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(self._max_workers, len(stale))) as executor:
+                fresh = dict(zip(stale, executor.map(self._read_summary, stale), strict=True))
+        else:
+            fresh = {file_path: self._read_summary(file_path) for file_path in stale}
+        for file_path, stat in zip(paths, stats, strict=True):
+            if file_path in fresh:
+                self._summary_cache[file_path] = (stat.st_mtime_ns, stat.st_size, fresh[file_path])
+        if fresh or removed:
+            self._write_manifest()
+        for file_path in paths:
+            yield self._summary_cache[file_path][2]
+
+    @staticmethod
+    def _read_summary(file_path: Path) -> ProjectSummary:
+        metadata = _ProjectHeader.model_validate_json(file_path.read_bytes()).metadata
+        return _make_summary(metadata, str(file_path))
 
 
 class InMemoryProjectRepository(ProjectRepository):
     """Dictionary-backed repository suitable for tests or mocked cloud storage."""
 
     def __init__(self) -> None:
-        self._storage: Dict[str, Project] = {}
+        # Projects are kept as JSON bytes: validating them back is several
+        # times cheaper than ``model_copy(deep=True)`` and shares nothing
+        # mutable with callers.
+        self._storage: Dict[str, bytes] = {}
+        self._summaries: Dict[str, ProjectSummary] = {}
 
     def save(self, project: Project) -> ProjectSummary:
-        self._storage[project.metadata.id] = project.model_copy(deep=True)
-        return ProjectSummary(
-            identifier=project.metadata.id,
-            name=project.metadata.name,
-            updated_at=project.metadata.updated_at,
-            location="in-memory",
-        )
+        summary = _make_summary(project.metadata, "in-memory")
+        self._storage[project.metadata.id] = ProjectSerializer.to_json_bytes(project)
+        self._summaries[project.metadata.id] = summary
+        return summary
 
     def load(self, identifier: str) -> Project:
         try:
-            project = self._storage[identifier]
+            payload = self._storage[identifier]
         except KeyError as exc:
             raise ProjectNotFoundError(f"Project {identifier!r} not found in memory") from exc
-        return project.model_copy(deep=True)
+        return ProjectSerializer.from_json_bytes(payload)
 
     def delete(self, identifier: str) -> None:
         if identifier not in self._storage:
             raise ProjectNotFoundError(f"Project {identifier!r} not found in memory")
         del self._storage[identifier]
+        del self._summaries[identifier]
 
     def list(self) -> Iterable[ProjectSummary]:
-        for project in self._storage.values():
-            yield ProjectSummary(
-                identifier=project.metadata.id,
-                name=project.metadata.name,
-                updated_at=project.metadata.updated_at,
-                location="in-memory",
-            )
+        yield from self._summaries.values()
 
 
 class MockCloudProjectRepository(ProjectRepository):
@@ -139,6 +288,9 @@ class MockCloudProjectRepository(ProjectRepository):
     The adapter serializes payloads to a local cache so integration code can
     exercise round-trips without needing credentials. A small amount of
     artificial latency can be configured to mimic remote calls during tests.
+    ``max_entries`` and ``ttl_seconds`` bound the in-memory store for long
+    sessions: the least recently used (or expired) projects are evicted along
+    with their cache files, as if the simulated bucket had dropped them.
     """
 
     def __init__(
@@ -148,13 +300,25 @@ class MockCloudProjectRepository(ProjectRepository):
         bucket: str = "naga-cloud",
         extension: str = ".json",
         network_latency: float = 0.0,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
     ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
         self._adapter = adapter
         self._bucket = bucket
         self._extension = extension
         self._network_latency = network_latency
-        self._objects: Dict[str, Dict[str, object]] = {}
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        # Indented JSON documents, byte-for-byte what the adapter writes,
+        # ordered from least to most recently used.
+        self._objects: OrderedDict[str, bytes] = OrderedDict()
+        # identifier -> monotonic deadline, tracked only when a TTL is set.
+        self._expires: Dict[str, float] = {}
         self._revisions: Dict[str, datetime] = {}
+        # Identifiers whose local cache file already mirrors the stored bytes.
+        self._mirrored: set[str] = set()
 
     def _simulate_latency(self) -> None:
         if self._network_latency > 0.0:
@@ -163,58 +327,113 @@ class MockCloudProjectRepository(ProjectRepository):
     def _path_for(self, identifier: str) -> Path:
         return self._adapter.base_path / f"{identifier}{self._extension}"
 
+    def _touch(self, identifier: str) -> None:
+        self._objects.move_to_end(identifier)
+        if self._ttl_seconds is not None:
+            self._expires[identifier] = time.monotonic() + self._ttl_seconds
+
+    def _evict(self, identifier: str) -> None:
+        del self._objects[identifier]
+        self._expires.pop(identifier, None)
+        self._revisions.pop(identifier, None)
+        self._mirrored.discard(identifier)
+        self._path_for(identifier).unlink(missing_ok=True)
+
+    def _expire(self) -> None:
+        if not self._expires:
+            return
+        now = time.monotonic()
+        for identifier in [key for key, deadline in self._expires.items() if deadline <= now]:
+            self._evict(identifier)
+
     def save(self, project: Project) -> ProjectSummary:
+        self._expire()
         previous_revision = self._revisions.get(project.metadata.id)
         if previous_revision and project.metadata.updated_at < previous_revision:
             raise ProjectRepositoryError(
                 "Stale project metadata detected; update local state before saving"
             )
         self._simulate_latency()
-        payload = ProjectSerializer.to_dict(project)
+        # Serialize once and share the bytes between the store and cache file.
+        payload = ProjectSerializer.to_json_bytes(project, indent=True)
         self._objects[project.metadata.id] = payload
+        self._touch(project.metadata.id)
         self._revisions[project.metadata.id] = project.metadata.updated_at
-        self._adapter.save(project, f"{project.metadata.id}{self._extension}")
-        return ProjectSummary(
-            identifier=project.metadata.id,
-            name=project.metadata.name,
-            updated_at=project.metadata.updated_at,
-            location=f"cloud://{self._bucket}/{project.metadata.id}",
-        )
+        self._adapter.save_bytes(payload, f"{project.metadata.id}{self._extension}")
+        self._mirrored.add(project.metadata.id)
+        if self._max_entries is not None:
+            while len(self._objects) > self._max_entries:
+                self._evict(next(iter(self._objects)))
+        return _make_summary(project.metadata, f"cloud://{self._bucket}/{project.metadata.id}")
 
     def load(self, identifier: str) -> Project:
         self._simulate_latency()
+        self._expire()
         try:
             payload = self._objects[identifier]
         except KeyError as exc:
             raise ProjectNotFoundError(f"Project {identifier!r} not found in cloud store") from exc
-        project = ProjectSerializer.from_dict(payload)  # type: ignore[arg-type]
-        self._adapter.save(project, f"{identifier}{self._extension}")
+        self._touch(identifier)
+        project = ProjectSerializer.from_json_bytes(payload)
+        if identifier not in self._mirrored or not self._path_for(identifier).exists():
+            self._adapter.save_bytes(payload, f"{identifier}{self._extension}")
+            self._mirrored.add(identifier)
         return project
 
     def delete(self, identifier: str) -> None:
         self._simulate_latency()
+        self._expire()
         if identifier not in self._objects:
             raise ProjectNotFoundError(f"Project {identifier!r} not found in cloud store")
-        del self._objects[identifier]
-        self._revisions.pop(identifier, None)
-        cache_path = self._path_for(identifier)
-        if cache_path.exists():
-            cache_path.unlink()
+        self._evict(identifier)
 
     def list(self) -> Iterable[ProjectSummary]:
+        self._expire()
         for identifier, payload in sorted(self._objects.items()):
-            project = ProjectSerializer.from_dict(payload)  # type: ignore[arg-type]
-            yield ProjectSummary(
-                identifier=identifier,
-                name=project.metadata.name,
-                updated_at=project.metadata.updated_at,
-                location=f"cloud://{self._bucket}/{identifier}",
-            )
+            metadata = _ProjectHeader.model_validate_json(payload).metadata
+            yield _make_summary(metadata, f"cloud://{self._bucket}/{identifier}")
+
+
+@lru_cache(maxsize=1024)
+def _parse_revision_text(value: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:  # pragma: no cover - malformed provider metadata
+        return None
+
+
+def _parse_revision(value: Any) -> Optional[datetime]:
+    """Parse an ``updated_at`` metadata value, memoising repeated strings."""
+
+    if not isinstance(value, str):
+        return None
+    return _parse_revision_text(value)
+
+
+class _PreconditionFailedError(Exception):
+    """Raised internally when a conditional S3 write is rejected."""
+
+
+def _is_precondition_failure(exc: BaseException) -> bool:
+    response = getattr(exc, "response", None)
+    if not isinstance(response, Mapping):
+        return False
+    error = response.get("Error")
+    code = error.get("Code") if isinstance(error, Mapping) else None
+    metadata = response.get("ResponseMetadata")
+    status = metadata.get("HTTPStatusCode") if isinstance(metadata, Mapping) else None
+    return code in {"PreconditionFailed", "412"} or status == 412
 
 
 class S3ProjectRepository(ProjectRepository):
     """S3-backed repository that mirrors remote objects into a local cache."""
 
+    # Upper bound on keys accepted by a single DeleteObjects request.
+    DELETE_BATCH_SIZE = 1000
+    # Bodies at least this large are read in BODY_CHUNK_SIZE pieces.
+    STREAM_THRESHOLD = 256 * 1024
+    BODY_CHUNK_SIZE = 64 * 1024
+
     def __init__(
         self,
         adapter: ProjectFileAdapter,
@@ -224,12 +443,27 @@ class S3ProjectRepository(ProjectRepository):
         prefix: str = "projects/",
         extension: str = ".json",
         missing_exceptions: Optional[Tuple[type[BaseException], ...]] = None,
+        max_workers: int = 32,
+        revision_cache_ttl: float = 5.0,
+        conditional_writes: bool = False,
     ) -> None:
         self._adapter = adapter
         self._s3 = s3_client
+        self._revision_cache_ttl = revision_cache_ttl
+        # key -> (revision, monotonic expiry); checked lazily on access.
+        self._revision_cache: Dict[str, Tuple[Optional[datetime], float]] = {}
+        # Providers supporting conditional PutObject let saves skip the HEAD.
+        self._conditional_writes = conditional_writes
+        # key -> (ETag, updated_at) last written or read by this repository.
+        self._etags: Dict[str, Tuple[str, datetime]] = {}
+        self._max_workers = max(1, max_workers)
+        self._executor: ThreadPoolExecutor | None = None
         self._bucket = bucket
         self._prefix = prefix if prefix.endswith("/") or not prefix else f"{prefix.rstrip('/')}/"
         self._extension = extension
+        self._prefix_len = len(self._prefix)
+        self._extension_len = len(extension)
+        self._affix_len = self._prefix_len + self._extension_len
         if missing_exceptions is not None:
             self._missing_exceptions = missing_exceptions
         else:
@@ -238,6 +472,9 @@ class S3ProjectRepository(ProjectRepository):
             if isinstance(no_such_key, type):
                 candidates.append(no_such_key)
             self._missing_exceptions = tuple(candidates)
+        # Listing summaries keyed by object key, paired with the ETag or
+        # LastModified value they were read under.
+        self._summary_cache: Dict[str, Tuple[Any, ProjectSummary]] = {}
 
     @classmethod
     def from_environment(
@@ -268,7 +505,10 @@ class S3ProjectRepository(ProjectRepository):
             Region forwarded to the client for latency-sensitive routing.
 
         A custom ``client_factory`` may be provided to integrate with alternate
-        SDKs or to supply mocked clients during tests.
+        SDKs or to supply mocked clients during tests. ``boto3`` is imported
+        only when no factory is given, and clients are reused for identical
+        credentials; callers that already hold a client should pass it to the
+        constructor directly and skip the import altogether.
         """
 
         environment: Mapping[str, str]
@@ -283,24 +523,13 @@ class S3ProjectRepository(ProjectRepository):
         resolved_extension = environment.get("NAGAKANG_S3_EXTENSION", extension)
 
         if client_factory is None:
-            try:
-                import boto3
-            except ImportError as exc:  # pragma: no cover - depends on optional dependency
-                raise ProjectRepositoryError(
-                    "boto3 is required to configure S3ProjectRepository from the environment"
-                ) from exc
-
-            session = boto3.session.Session(
-                aws_access_key_id=environment.get("AWS_ACCESS_KEY_ID"),
-                aws_secret_access_key=environment.get("AWS_SECRET_ACCESS_KEY"),
-                aws_session_token=environment.get("AWS_SESSION_TOKEN"),
-                region_name=environment.get("AWS_REGION") or environment.get("AWS_DEFAULT_REGION"),
+            s3_client = _s3_client(
+                environment.get("AWS_ACCESS_KEY_ID"),
+                environment.get("AWS_SECRET_ACCESS_KEY"),
+                environment.get("AWS_SESSION_TOKEN"),
+                environment.get("AWS_REGION") or environment.get("AWS_DEFAULT_REGION"),
+                environment.get("NAGAKANG_S3_ENDPOINT_URL") or None,
             )
-            endpoint_url = environment.get("NAGAKANG_S3_ENDPOINT_URL")
-            client_kwargs: Dict[str, Any] = {}
-            if endpoint_url:
-                client_kwargs["endpoint_url"] = endpoint_url
-            s3_client = session.client("s3", **client_kwargs)
         else:
             s3_client = client_factory(environment)
 
@@ -313,19 +542,57 @@ class S3ProjectRepository(ProjectRepository):
             missing_exceptions=missing_exceptions,
         )
 
+    def _pool(self) -> ThreadPoolExecutor:
+        # S3 calls are latency-bound, so independent requests overlap on a
+        # shared pool whose size also caps the number of in-flight requests.
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="s3-repository"
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker pool used for concurrent S3 requests."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def _object_key(self, identifier: str) -> str:
         return f"{self._prefix}{identifier}{self._extension}" if self._prefix else f"{identifier}{self._extension}"
 
     def _path_for(self, identifier: str) -> Path:
         return self._adapter.base_path / f"{identifier}{self._extension}"
 
-    def _read_body(self, body: Any) -> bytes:
+    def _read_body(self, body: Any, content_length: Any = None) -> bytes | bytearray:
         if body is None:
             raise ProjectRepositoryError("S3 response missing Body payload")
         if hasattr(body, "read"):
-            return body.read()
+            try:
+                if not isinstance(content_length, int) or content_length < self.STREAM_THRESHOLD:
+                    return body.read()
+                # Large documents are drained in fixed-size chunks into one
+                # presized buffer instead of a single unbounded read().
+                buffer = bytearray(content_length)
+                view = memoryview(buffer)
+                filled = 0
+                while filled < content_length:
+                    chunk = body.read(min(self.BODY_CHUNK_SIZE, content_length - filled))
+                    if not chunk:
+                        break
+                    view[filled : filled + len(chunk)] = chunk
+                    filled += len(chunk)
+                view.release()
+                if filled != content_length:
+                    raise ProjectRepositoryError("S3 body ended before ContentLength bytes")
+                return buffer
+            finally:
+                # Hand the HTTP connection back to the pool straight away.
+                close = getattr(body, "close", None)
+                if callable(close):
+                    close()
         if isinstance(body, (bytes, bytearray)):
-            return bytes(body)
+            return body
         raise ProjectRepositoryError("Unsupported S3 body payload type")
 
     def _head_object(self, key: str) -> Optional[dict[str, Any]]:
@@ -342,60 +609,124 @@ class S3ProjectRepository(ProjectRepository):
             raise ProjectRepositoryError("Failed to inspect project metadata in S3") from exc
 
     def _remote_revision(self, key: str) -> Optional[datetime]:
+        cached = self._revision_cache.get(key)
+        if cached is not None:
+            if time.monotonic() < cached[1]:
+                return cached[0]
+            del self._revision_cache[key]
+        revision = self._head_revision(key)
+        self._remember_revision(key, revision)
+        return revision
+
+    def _remember_revision(self, key: str, revision: Optional[datetime]) -> None:
+        if self._revision_cache_ttl > 0:
+            self._revision_cache[key] = (revision, time.monotonic() + self._revision_cache_ttl)
+
+    def _head_revision(self, key: str) -> Optional[datetime]:
         response = self._head_object(key)
         if response is None:
             return None
+        return self._revision_from_head(response)
+
+    @staticmethod
+    def _revision_from_head(response: Mapping[str, Any]) -> Optional[datetime]:
         metadata = response.get("Metadata", {})
-        updated_at = metadata.get("updated_at")
-        if isinstance(updated_at, str):
-            try:
-                return datetime.fromisoformat(updated_at)
-            except ValueError:  # pragma: no cover - malformed provider metadata
-                pass
+        revision = _parse_revision(metadata.get("updated_at"))
+        if revision is not None:
+            return revision
         last_modified = response.get("LastModified")
         if isinstance(last_modified, datetime):
             return last_modified
         return None
 
     def _identifier_from_key(self, key: str) -> Optional[str]:
-        if self._prefix and not key.startswith(self._prefix):
-            return None
-        trimmed = key[len(self._prefix) :] if self._prefix else key
-        if not trimmed.endswith(self._extension):
+        # Called once per listed object, so the bounds are precomputed.
+        if (
+            len(key) < self._affix_len
+            or not key.startswith(self._prefix)
+            or not key.endswith(self._extension)
+        ):
             return None
-        return trimmed[: -len(self._extension)]
-
-    def save(self, project: Project) -> ProjectSummary:
-        key = self._object_key(project.metadata.id)
-        remote_revision = self._remote_revision(key)
-        if remote_revision and project.metadata.updated_at <= remote_revision:
-            raise ProjectRepositoryError(
-                "Remote project is newer than local state; refresh before overwriting"
-            )
+        return key[self._prefix_len : len(key) - self._extension_len]
 
-        payload = json.dumps(ProjectSerializer.to_dict(project), separators=(",", ":")).encode("utf-8")
-        metadata = {
-            "updated_at": project.metadata.updated_at.isoformat(),
-            "name": project.metadata.name,
-        }
+    def _put_object(
+        self, key: str, payload: bytes, metadata: Mapping[str, str], **conditions: str
+    ) -> Any:
         try:
-            self._s3.put_object(
+            return self._s3.put_object(
                 Bucket=self._bucket,
                 Key=key,
                 Body=payload,
                 Metadata=metadata,
                 ContentType="application/json",
+                **conditions,
             )
-        except Exception as exc:  # pragma: no cover - depends on provider client
+        except Exception as exc:
+            if conditions and _is_precondition_failure(exc):
+                raise _PreconditionFailedError(key) from exc
             raise ProjectRepositoryError("Failed to upload project to S3") from exc
 
-        self._adapter.save(project, f"{project.metadata.id}{self._extension}")
-        return ProjectSummary(
-            identifier=project.metadata.id,
-            name=project.metadata.name,
-            updated_at=project.metadata.updated_at,
-            location=f"s3://{self._bucket}/{key}",
-        )
+    def _conditional_put(
+        self, key: str, updated_at: datetime, payload: bytes, metadata: Mapping[str, str]
+    ) -> Any:
+        # One conditional PUT replaces HEAD-then-PUT: If-Match pins the ETag
+        # this repository last wrote or read, If-None-Match guards creation.
+        known = self._etags.get(key)
+        if known is not None and updated_at <= known[1]:
+            raise ProjectRepositoryError(
+                "Remote project is newer than local state; refresh before overwriting"
+            )
+        condition = {"IfMatch": known[0]} if known is not None else {"IfNoneMatch": "*"}
+        try:
+            return self._put_object(key, payload, metadata, **condition)
+        except _PreconditionFailedError:
+            pass
+        # Someone else wrote the object: fall back to the revision check
+        # once, then retry pinned to the ETag that check inspected.
+        self._etags.pop(key, None)
+        head = self._head_object(key)
+        remote_revision = self._revision_from_head(head) if head is not None else None
+        if remote_revision and updated_at <= remote_revision:
+            raise ProjectRepositoryError(
+                "Remote project is newer than local state; refresh before overwriting"
+            )
+        etag = head.get("ETag") if head is not None else None
+        retry = {"IfMatch": etag} if etag else {"IfNoneMatch": "*"}
+        try:
+            return self._put_object(key, payload, metadata, **retry)
+        except _PreconditionFailedError as exc:
+            raise ProjectRepositoryError(
+                "Remote project changed during save; refresh before overwriting"
+            ) from exc
+
+    def save(self, project: Project) -> ProjectSummary:
+        key = self._object_key(project.metadata.id)
+        payload = ProjectSerializer.to_json_bytes(project)
+        metadata = {
+            "updated_at": project.metadata.updated_at.isoformat(),
+            "name": project.metadata.name,
+        }
+        if self._conditional_writes:
+            response = self._conditional_put(key, project.metadata.updated_at, payload, metadata)
+        else:
+            remote_revision = self._remote_revision(key)
+            if remote_revision and project.metadata.updated_at <= remote_revision:
+                raise ProjectRepositoryError(
+                    "Remote project is newer than local state; refresh before overwriting"
+                )
+            response = self._put_object(key, payload, metadata)
+
+        self._remember_revision(key, project.metadata.updated_at)
+        etag = response.get("ETag") if isinstance(response, Mapping) else None
+        self._mirror(project, project.metadata.id, etag if isinstance(etag, str) else None)
+        summary = _make_summary(project.metadata, f"s3://{self._bucket}/{key}")
+        if etag:
+            self._etags[key] = (etag, project.metadata.updated_at)
+            self._summary_cache[key] = (etag, summary)
+        else:
+            self._etags.pop(key, None)
+            self._summary_cache.pop(key, None)
+        return summary
 
     def load(self, identifier: str) -> Project:
         key = self._object_key(identifier)
@@ -406,12 +737,48 @@ class S3ProjectRepository(ProjectRepository):
         except Exception as exc:  # pragma: no cover - provider specific error
             raise ProjectRepositoryError("Failed to download project from S3") from exc
 
-        body = self._read_body(response.get("Body"))
-        payload = json.loads(body.decode("utf-8"))
-        project = ProjectSerializer.from_dict(payload)
-        self._adapter.save(project, f"{identifier}{self._extension}")
+        body = self._read_body(response.get("Body"), response.get("ContentLength"))
+        project = ProjectSerializer.from_json_bytes(body)
+        etag = response.get("ETag")
+        if not isinstance(etag, str):
+            etag = None
+        if etag is not None:
+            self._etags[key] = (etag, project.metadata.updated_at)
+        self._mirror(project, identifier, etag)
         return project
 
+    def _etag_path(self, identifier: str) -> Path:
+        return self._adapter.base_path / f"{identifier}{self._extension}.etag"
+
+    def _mirror(self, project: Project, identifier: str, etag: Optional[str]) -> None:
+        """Write the local cache copy unless it already holds object ``etag``."""
+
+        cache_path = self._path_for(identifier)
+        etag_path = self._etag_path(identifier)
+        if etag is not None and cache_path.exists():
+            try:
+                if etag_path.read_text(encoding="utf-8") == etag:
+                    return
+            except OSError:
+                pass
+        self._adapter.save(project, cache_path.name)
+        # The sidecar is written after the document so a crash in between
+        # leaves a mismatch (rewrite next time) rather than a false match.
+        if etag is None:
+            etag_path.unlink(missing_ok=True)
+            return
+        staging = etag_path.with_name(f"{etag_path.name}.tmp")
+        staging.write_text(etag, encoding="utf-8")
+        os.replace(staging, etag_path)
+
+    def load_many(self, identifiers: Iterable[str]) -> List[Project]:
+        """Download several projects concurrently, preserving input order."""
+
+        pending = list(identifiers)
+        if len(pending) <= 1:
+            return [self.load(identifier) for identifier in pending]
+        return list(self._pool().map(self.load, pending))
+
     def delete(self, identifier: str) -> None:
         key = self._object_key(identifier)
         try:
@@ -421,45 +788,161 @@ class S3ProjectRepository(ProjectRepository):
         except Exception as exc:  # pragma: no cover - provider specific error
             raise ProjectRepositoryError("Failed to delete project from S3") from exc
 
-        cache_path = self._path_for(identifier)
-        if cache_path.exists():
-            cache_path.unlink()
+        self._forget(identifier, key)
 
-    def list(self) -> Iterable[ProjectSummary]:
+    def delete_many(self, identifiers: Iterable[str]) -> None:
+        """Delete several projects with batched ``DeleteObjects`` requests.
+
+        Keys are sent :attr:`DELETE_BATCH_SIZE` at a time. Every batch is
+        attempted; identifiers S3 reports as missing are collected into a
+        single :class:`ProjectNotFoundError` raised at the end.
+        """
+
+        pending = list(dict.fromkeys(identifiers))
+        missing: List[str] = []
+        failed: List[str] = []
+        for start in range(0, len(pending), self.DELETE_BATCH_SIZE):
+            chunk = pending[start : start + self.DELETE_BATCH_SIZE]
+            keys = {self._object_key(identifier): identifier for identifier in chunk}
+            try:
+                response = self._s3.delete_objects(
+                    Bucket=self._bucket,
+                    Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+                )
+            except Exception as exc:  # pragma: no cover - provider specific error
+                raise ProjectRepositoryError("Failed to delete projects from S3") from exc
+            errors = response.get("Errors", []) if isinstance(response, Mapping) else []
+            rejected = set()
+            for error in errors:
+                key = error.get("Key")
+                if key not in keys:
+                    continue
+                rejected.add(key)
+                if error.get("Code") in {"NoSuchKey", "NotFound", "404"}:
+                    missing.append(keys[key])
+                else:
+                    failed.append(keys[key])
+            for key, identifier in keys.items():
+                if key not in rejected:
+                    self._forget(identifier, key)
+        if failed:
+            raise ProjectRepositoryError(f"Failed to delete projects from S3: {failed!r}")
+        if missing:
+            raise ProjectNotFoundError(
+                f"Projects {missing!r} not found in S3 bucket {self._bucket}"
+            )
+
+    def _forget(self, identifier: str, key: str) -> None:
+        """Drop cached state and the local mirror for a deleted object."""
+
+        self._summary_cache.pop(key, None)
+        self._revision_cache.pop(key, None)
+        self._etags.pop(key, None)
+        self._etag_path(identifier).unlink(missing_ok=True)
+        self._path_for(identifier).unlink(missing_ok=True)
+
+    def _list_page(self, request: Mapping[str, Any]) -> Dict[str, Any]:
         try:
-            response = self._s3.list_objects_v2(Bucket=self._bucket, Prefix=self._prefix)
+            return self._s3.list_objects_v2(**request)
         except Exception as exc:  # pragma: no cover - provider specific error
             raise ProjectRepositoryError("Failed to enumerate projects in S3") from exc
 
-        contents = response.get("Contents", []) or []
-        for entry in contents:
+    def _iter_listing(self) -> Iterator[Dict[str, Any]]:
+        request: Dict[str, Any] = {"Bucket": self._bucket, "Prefix": self._prefix}
+        response = self._list_page(request)
+        while True:
+            # Fetch the next page in the background while the caller
+            # consumes this one; pagination itself stays sequential.
+            token = response.get("NextContinuationToken")
+            upcoming: Future[Dict[str, Any]] | None = None
+            if response.get("IsTruncated") and token:
+                upcoming = self._pool().submit(
+                    self._list_page, {**request, "ContinuationToken": token}
+                )
+            yield from response.get("Contents", []) or []
+            if upcoming is None:
+                return
+            response = upcoming.result()
+
+    @staticmethod
+    def _listing_validator(entry: Mapping[str, Any]) -> Any:
+        return entry.get("ETag") or entry.get("LastModified")
+
+    def _summary_from_head(
+        self,
+        identifier: str,
+        key: str,
+        head: Mapping[str, Any],
+        entry: Mapping[str, Any],
+        now: datetime,
+    ) -> ProjectSummary:
+        metadata = head.get("Metadata", {})
+        revision = _parse_revision(metadata.get("updated_at"))
+        if revision is None:
+            last_modified = head.get("LastModified") or entry.get("LastModified")
+            if isinstance(last_modified, datetime):
+                revision = last_modified
+        if revision is None:
+            revision = now
+        name = metadata.get("name") or identifier
+        return ProjectSummary(
+            identifier=identifier,
+            name=name,
+            updated_at=revision,
+            location=f"s3://{self._bucket}/{key}",
+        )
+
+    def list(self) -> Iterable[ProjectSummary]:
+        # Objects without any timestamp are approximated as "now"; one clock
+        # read per listing is precise enough for that fallback.
+        now = datetime.now(UTC)
+        page: List[Dict[str, Any]] = []
+        for entry in self._iter_listing():
+            page.append(entry)
+            if len(page) >= self._max_workers:
+                yield from self._summaries_for(page, now)
+                page = []
+        yield from self._summaries_for(page, now)
+
+    def _summaries_for(
+        self, entries: List[Dict[str, Any]], now: datetime
+    ) -> List[ProjectSummary]:
+        candidates: List[Tuple[str, str, Dict[str, Any], Any]] = []
+        for entry in entries:
             key = entry.get("Key")
             if not isinstance(key, str):
                 continue
             identifier = self._identifier_from_key(key)
             if identifier is None:
                 continue
-            head = self._head_object(key)
+            candidates.append((identifier, key, entry, self._listing_validator(entry)))
+
+        # Summaries seen on earlier saves or listings stay valid while the
+        # listing reports the same ETag/LastModified, so only unseen or
+        # changed objects cost a HEAD, and those run concurrently.
+        stale = [
+            key
+            for _, key, _, validator in candidates
+            if validator is None
+            or key not in self._summary_cache
+            or self._summary_cache[key][0] != validator
+        ]
+        heads: Dict[str, Optional[dict[str, Any]]]
+        if len(stale) > 1:
+            heads = dict(zip(stale, self._pool().map(self._head_object, stale), strict=True))
+        else:
+            heads = {key: self._head_object(key) for key in stale}
+
+        summaries: List[ProjectSummary] = []
+        for identifier, key, entry, validator in candidates:
+            if key not in heads:
+                summaries.append(self._summary_cache[key][1])
+                continue
+            head = heads[key]
             if head is None:
                 continue
-            metadata = head.get("Metadata", {})
-            revision: Optional[datetime] = None
-            updated_field = metadata.get("updated_at")
-            if isinstance(updated_field, str):
-                try:
-                    revision = datetime.fromisoformat(updated_field)
-                except ValueError:  # pragma: no cover - malformed metadata
-                    revision = None
-            if revision is None:
-                last_modified = head.get("LastModified") or entry.get("LastModified")
-                if isinstance(last_modified, datetime):
-                    revision = last_modified
-            if revision is None:
-                revision = datetime.utcnow()
-            name = metadata.get("name") or identifier
-            yield ProjectSummary(
-                identifier=identifier,
-                name=name,
-                updated_at=revision,
-                location=f"s3://{self._bucket}/{key}",
-            )
+            summary = self._summary_from_head(identifier, key, head, entry, now)
+            if validator is not None:
+                self._summary_cache[key] = (validator, summary)
+            summaries.append(summary)
+        return summaries
@@ -2,19 +2,20 @@
 from __future__ import annotations
 
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-import json
+import hashlib
 from pathlib import Path
-import shutil
+import threading
 import time
 from typing import Any, Callable, Deque, List, Mapping, Sequence
 
+from domain.persistence import dump_json_bytes
 from domain.project_manifest import (
     ProjectManifest,
     SamplerManifestIndex,
     build_import_plan,
-    compute_file_sha256,
 )
 from domain.project_import_service import ProjectImportResult, ProjectImportService
 
@@ -46,6 +47,17 @@ except Exception:  # pragma: no cover - fallback for non-GUI environments
         def schedule_interval(callback, _interval):  # pragma: no cover - stub
             return None
 
+        @staticmethod
+        def create_trigger(callback, _timeout=0):  # pragma: no cover - stub
+            return _NullTrigger()
+
+    class _NullTrigger:  # pragma: no cover - stub
+        def __call__(self, *_args) -> None:
+            return None
+
+        def cancel(self) -> None:
+            return None
+
     def ObjectProperty(default=None):  # type: ignore
         return default
 
@@ -69,8 +81,18 @@ class _AutosaveConfig:
     time_source: Callable[[], float] = time.monotonic
     manifest_path: Path | None = None
     last_saved: float | None = None
-    checkpoints: Deque[tuple[Path, List[Path]]] = field(default_factory=deque)
+    checkpoints: Deque[Path] = field(default_factory=deque)
     pruned_checkpoints: int = 0
+    # Guards ``checkpoints``/``pruned_checkpoints``, which the autosave
+    # worker updates after each write.
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    pending_write: Future[Path] | None = None
+    # Fingerprint of the last checkpoint's content, used to skip no-op saves.
+    last_payload_hash: bytes | None = None
+
+    def __post_init__(self) -> None:
+        # Bounded so appending past ``max_checkpoints`` evicts the oldest entry.
+        self.checkpoints = deque(self.checkpoints, maxlen=self.max_checkpoints)
 
 
 class TrackerMixerRoot(BoxLayout):
@@ -91,7 +113,9 @@ class TrackerMixerRoot(BoxLayout):
     ) -> None:
         super().__init__(**kwargs)
         self._orchestrator: PreviewOrchestrator | None = None
-        self._clock_event = None
+        self._clock_event: Any = None
+        self._idle_trigger: Any = None
+        self._wake_trigger: Any = None
         self._tracker_controller: TrackerPanelController | None = None
         self._mixer_controller: MixerDockController | None = None
         self._build_default_children()
@@ -106,6 +130,10 @@ class TrackerMixerRoot(BoxLayout):
         self._sampler_manifest: SamplerManifestIndex | None = None
         self._manifest_path: Path | None = None
         self._autosave_config: _AutosaveConfig | None = None
+        # Checkpoint I/O runs here so disk stalls never block the UI thread.
+        self._autosave_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="autosave"
+        )
 
     def _build_default_children(self) -> None:
         """Instantiate tracker-side widgets so demos run without KV layouts."""
@@ -212,16 +240,59 @@ class TrackerMixerRoot(BoxLayout):
             time_source=time_source or time.monotonic,
         )
 
-    def bind_orchestrator(self, orchestrator: PreviewOrchestrator, *, interval: float = 0.5) -> None:
+    def flush_autosave(self, timeout: float | None = None) -> None:
+        """Block until queued autosave checkpoints reach disk.
+
+        Errors raised by the background write are re-raised here.
+        """
+
+        config = self._autosave_config
+        if config is not None and config.pending_write is not None:
+            config.pending_write.result(timeout=timeout)
+
+    def bind_orchestrator(
+        self,
+        orchestrator: PreviewOrchestrator,
+        *,
+        interval: float = 0.5,
+        idle_interval: float = 2.0,
+    ) -> None:
+        """Poll ``orchestrator`` every ``interval`` while previews are active.
+
+        Once a poll finds no pending or rendered previews the cadence backs
+        off to ``idle_interval``; newly queued previews wake the poll loop
+        straight away through :meth:`notify`.
+        """
+
         self._orchestrator = orchestrator
-        if hasattr(Clock, "schedule_interval"):
-            self._clock_event = Clock.schedule_interval(self._poll_orchestrator, interval)
+        # Triggers coalesce: re-arming one that is already pending is a
+        # no-op, so bursts of notifications still cost a single poll.
+        self._clock_event = Clock.create_trigger(self._poll_orchestrator, interval)
+        self._idle_trigger = Clock.create_trigger(
+            self._poll_orchestrator, max(interval, idle_interval)
+        )
+        self._wake_trigger = Clock.create_trigger(self._poll_orchestrator, 0)
+        orchestrator.on_batch_ready = self.notify
+        self._clock_event()
+
+    def notify(self) -> None:
+        """Poll the orchestrator on the next frame (e.g. after an enqueue)."""
+
+        if self._wake_trigger is not None:
+            self._wake_trigger()
 
     def _poll_orchestrator(self, *_args) -> None:
         if self._orchestrator is None:
             return
+        for trigger in (self._clock_event, self._idle_trigger, self._wake_trigger):
+            if trigger is not None:
+                trigger.cancel()
         batch = self._orchestrator.process_pending()
         self._apply_batch(batch)
+        busy = bool(batch.previews) or bool(batch.layout.tracker.pending_requests)
+        next_trigger = self._clock_event if busy else self._idle_trigger
+        if next_trigger is not None:
+            next_trigger()
 
     def _apply_batch(self, batch: PreviewBatchState) -> None:
         self.layout_state = batch.layout
@@ -268,48 +339,57 @@ class TrackerMixerRoot(BoxLayout):
         if config.last_saved is not None and now - config.last_saved < config.interval_seconds:
             return
         tracker_state = batch.layout.tracker
-        checkpoint, attachments = self._write_autosave_checkpoint(config, tracker_state)
+        prepared = self._prepare_autosave_payload(config, tracker_state)
         config.last_saved = now
-        config.checkpoints.append((checkpoint, attachments))
-        while len(config.checkpoints) > config.max_checkpoints:
-            layout_path, extras = config.checkpoints.popleft()
-            layout_path.unlink(missing_ok=True)
-            for extra in extras:
-                extra.unlink(missing_ok=True)
-            config.pruned_checkpoints += 1
+        if prepared is None:
+            # Nothing changed since the last checkpoint; keep it and skip I/O.
+            return
+        target_dir, slug, data = prepared
+        config.pending_write = self._autosave_executor.submit(
+            self._write_autosave_checkpoint, config, target_dir, slug, data
+        )
 
-    def _write_autosave_checkpoint(
+    def _prepare_autosave_payload(
         self,
         config: _AutosaveConfig,
         tracker_state: TrackerPanelState,
-    ) -> tuple[Path, List[Path]]:
-        target_dir = config.autosave_dir / config.project_id
-        target_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now(UTC)
-        slug = timestamp.strftime("%Y%m%d-%H%M%S")
-        checkpoint = target_dir / f"{slug}-layout.json"
-        payload = {
+    ) -> tuple[Path, str, bytes] | None:
+        """Build the checkpoint payload and recovery prompt on the UI thread.
+
+        Returns ``None`` when the tracker state and manifest match the most
+        recent checkpoint, in which case no new checkpoint is needed.
+        """
+
+        content: dict[str, Any] = {
             "project_id": config.project_id,
-            "saved_at": timestamp.isoformat(),
             "pattern_id": tracker_state.pattern_id,
             "pending_request_count": len(tracker_state.pending_requests),
             "import_asset_count": tracker_state.import_asset_count,
             "tutorial_tip_count": len(tracker_state.tutorial_tips),
         }
         if tracker_state.last_preview_summary is not None:
-            payload["last_preview_summary"] = tracker_state.last_preview_summary
-        attachments: List[Path] = []
+            content["last_preview_summary"] = tracker_state.last_preview_summary
         manifest_path = config.manifest_path or self._manifest_path
-        manifest_sha, manifest_assets = self._manifest_metadata(manifest_path)
+        manifest_sha, manifest_assets, manifest_document = self._manifest_metadata(manifest_path)
         if manifest_sha:
-            payload["manifest_sha256"] = manifest_sha
+            content["manifest_sha256"] = manifest_sha
         if manifest_assets:
-            payload["sampler_assets"] = manifest_assets
-        checkpoint.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-        if manifest_path is not None and Path(manifest_path).exists():
-            manifest_copy = target_dir / f"{slug}-manifest.json"
-            shutil.copy2(manifest_path, manifest_copy)
-            attachments.append(manifest_copy)
+            content["sampler_assets"] = manifest_assets
+        # ``saved_at`` always differs and ``manifest_sha256`` already stands
+        # in for the manifest text, so both stay out of the fingerprint.
+        fingerprint = hashlib.blake2b(dump_json_bytes(content), digest_size=16).digest()
+        if fingerprint == config.last_payload_hash:
+            return None
+        config.last_payload_hash = fingerprint
+        target_dir = config.autosave_dir / config.project_id
+        timestamp = datetime.now(UTC)
+        slug = timestamp.strftime("%Y%m%d-%H%M%S")
+        payload = {"project_id": config.project_id, "saved_at": timestamp.isoformat(), **content}
+        if manifest_document is not None:
+            # The manifest text travels inside the checkpoint verbatim, so
+            # ``manifest_sha256`` still verifies it after recovery.
+            payload["manifest_document"] = manifest_document
+        data = dump_json_bytes(payload, indent=True)
         summary = ""
         if manifest_sha or manifest_assets:
             asset_count = len(manifest_assets)
@@ -322,22 +402,66 @@ class TrackerMixerRoot(BoxLayout):
             f"Autosaved {config.project_id} at {slug}{summary}. "
             f"Check .autosave/{config.project_id} for recovery."
         )
-        return checkpoint, attachments
+        return target_dir, slug, data
+
+    @staticmethod
+    def _flush_autosave_payload(target_dir: Path, slug: str, data: bytes) -> Path:
+        """Write one self-contained checkpoint file; runs on the worker."""
+
+        target_dir.mkdir(parents=True, exist_ok=True)
+        checkpoint = target_dir / f"{slug}-layout.json"
+        checkpoint.write_bytes(data)
+        return checkpoint
 
-    def _manifest_metadata(self, manifest_path: Path | None) -> tuple[str | None, List[str]]:
+    def _write_autosave_checkpoint(
+        self,
+        config: _AutosaveConfig,
+        target_dir: Path,
+        slug: str,
+        data: bytes,
+    ) -> Path:
+        try:
+            checkpoint = self._flush_autosave_payload(target_dir, slug, data)
+        except BaseException:
+            # Let the next poll retry instead of treating the state as saved.
+            config.last_payload_hash = None
+            raise
+        # Rotation happens in the same task so a finished future always
+        # implies the checkpoint list is up to date.
+        with config.lock:
+            if checkpoint in config.checkpoints:
+                return checkpoint
+            evicted = None
+            if len(config.checkpoints) == config.checkpoints.maxlen:
+                evicted = config.checkpoints[0]
+            config.checkpoints.append(checkpoint)
+            if evicted is not None:
+                config.pruned_checkpoints += 1
+        if evicted is not None:
+            evicted.unlink(missing_ok=True)
+        return checkpoint
+
+    def _manifest_metadata(
+        self, manifest_path: Path | None
+    ) -> tuple[str | None, List[str], str | None]:
         if manifest_path is None:
-            return None, []
-        resolved = Path(manifest_path)
-        if not resolved.exists():
-            return None, []
-        manifest_sha = compute_file_sha256(resolved)
+            return None, [], None
+        try:
+            data = Path(manifest_path).read_bytes()
+        except FileNotFoundError:
+            return None, [], None
+        # Hash, parse, and embed the same bytes instead of reading twice.
+        manifest_sha = hashlib.sha256(data).hexdigest()
+        try:
+            document: str | None = data.decode("utf-8")
+        except UnicodeDecodeError:  # pragma: no cover - non-UTF-8 manifest
+            document = None
         try:
-            payload = json.loads(resolved.read_text(encoding="utf-8"))
-            manifest = ProjectManifest.model_validate(payload)
+            manifest = ProjectManifest.model_validate_json(data)
             assets = [record.asset_name for record in manifest.sampler_assets]
         except Exception:  # pragma: no cover - malformed manifest fallback
             assets = []
-        return manifest_sha, assets
+        return manifest_sha, assets, document
 
     def _filters_from_import_result(
         self, result: ProjectImportResult
@@ -54,11 +54,20 @@ class PreviewOrchestrator:
         self._tempo_bpm = float(tempo_bpm)
         self._loop_window_steps = float(loop_window_steps)
         self._tutorial_tips = list(tutorial_tips or DEFAULT_TUTORIAL_TIPS)
+        # Invoked whenever new preview work is queued so the UI can poll
+        # immediately instead of waiting for its next timer tick.
+        self.on_batch_ready: Callable[[], None] | None = None
+        worker.service.queue.add_callback(self._notify_batch_ready)
 
     @property
     def beats_per_bucket(self) -> float:
         return self._beats_per_bucket
 
+    def _notify_batch_ready(self, _request: PlaybackRequest) -> None:
+        callback = self.on_batch_ready
+        if callback is not None:
+            callback()
+
     def process_pending(self) -> PreviewBatchState:
         requests = self._worker.process_pending()
         previews = self._worker.last_render_batch()
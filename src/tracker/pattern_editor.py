@@ -4,7 +4,7 @@ from __future__ import annotations
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 import math
-from typing import Iterable, Iterator, List
+from typing import Callable, Iterable, Iterator, List
 
 from domain.models import Pattern, PatternStep
 
@@ -55,6 +55,12 @@ class PlaybackQueue:
 
     def __init__(self) -> None:
         self._pending: List[PlaybackRequest] = []
+        self._callbacks: List[Callable[[PlaybackRequest], None]] = []
+
+    def add_callback(self, callback: Callable[[PlaybackRequest], None]) -> None:
+        """Register a function invoked after every enqueued request."""
+
+        self._callbacks.append(callback)
 
     def enqueue(
         self,
@@ -73,6 +79,8 @@ class PlaybackQueue:
             instrument_id=mutation.updated.instrument_id,
         )
         self._pending.append(request)
+        for callback in self._callbacks:
+            callback(request)
         return request
 
     def pop_next(self) -> PlaybackRequest | None:
@@ -411,5 +419,9 @@ class PatternEditor:
     def iter_steps(self) -> Iterable[PatternStep]:
         """Yield steps up to the declared pattern length."""
 
-        for idx in range(self._pattern.length_steps):
-            yield self._get_step(idx)
+        # Pad once up front; every index below is then in range, so skip the
+        # per-step bounds check and padding loop in ``_get_step``.
+        length = self._pattern.length_steps
+        self._ensure_length(length)
+        for idx in range(length):
+            yield self._pattern.steps[idx]
@@ -56,3 +56,48 @@ def test_offline_engine_renders_with_automation():
     later_rms = rms(later_section)
     assert later_rms > first_rms * 2.5
     assert later_rms < first_rms * 3.5
+
+
+def test_module_parameter_spec_lookup():
+    config = EngineConfig(sample_rate=48_000, block_size=256, channels=2)
+    oscillator = SineOscillator("lead", config)
+
+    spec = oscillator.get_parameter_spec("amplitude")
+
+    assert spec is not None
+    assert spec.name == "amplitude"
+    assert spec in oscillator.describe_parameters()
+    assert oscillator.get_parameter_spec("missing") is None
+
+
+def test_bulk_parameter_changes_match_individual_scheduling():
+    config = EngineConfig(sample_rate=48_000, block_size=256, channels=2)
+    tempo = TempoMap(tempo_bpm=90.0)
+    rows = [
+        ("lead", "amplitude", 1.0, 0.5, "on"),
+        ("lead", "amplitude", 0.25, 0.75, ""),
+        ("lead", "frequency_hz", 1.0, 330.0, "lift"),
+    ]
+
+    single = OfflineAudioEngine(config, tempo=tempo)
+    single.add_module(SineOscillator("lead", config))
+    for module, parameter, beats, value, source in rows:
+        single.schedule_parameter_change(module, parameter, beats=beats, value=value, source=source)
+
+    bulk = OfflineAudioEngine(config, tempo=tempo)
+    bulk.add_module(SineOscillator("lead", config))
+    modules, parameters, beats, values, sources = (list(column) for column in zip(*rows, strict=True))
+    bulk.schedule_parameter_changes(modules, parameters, beats=beats, values=values, sources=sources)
+
+    def drain(engine):
+        return [
+            (event.time_seconds, event.module, event.parameter, event.value, event.source)
+            for event in engine.timeline.pop_events_up_to(10.0)
+        ]
+
+    assert drain(bulk) == drain(single)
+
+    with pytest.raises(KeyError):
+        bulk.schedule_parameter_changes(["ghost"], ["amplitude"], beats=[0.0], values=[1.0], sources=[""])
+    with pytest.raises(ValueError):
+        bulk.schedule_parameter_changes(["lead"], [], beats=[0.0], values=[1.0], sources=[""])
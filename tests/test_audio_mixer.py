@@ -7,7 +7,7 @@ from audio.effects import (
     StereoFeedbackDelayInsert,
     ThreeBandEqInsert,
 )
-from audio.engine import BaseAudioModule, EngineConfig, TempoMap
+from audio.engine import AutomationEvent, BaseAudioModule, EngineConfig, TempoMap
 from audio.mixer import (
     MeterReading,
     MixerChannel,
@@ -285,6 +285,36 @@ def test_mixer_automation_updates_send_subgroup_and_return() -> None:
     assert subgroup.fader_db == pytest.approx(-6.0)
 
 
+def test_mixer_schedules_automation_batches_in_order() -> None:
+    config = EngineConfig(sample_rate=48_000, block_size=8, channels=2)
+    graph = MixerGraph(config)
+    graph.add_return_bus(MixerReturnBus("fx"))
+    block_duration = config.block_size / config.sample_rate
+
+    graph.schedule_parameter_changes(
+        [
+            AutomationEvent(
+                time_seconds=block_duration,
+                module="mixer:return:fx",
+                parameter="level_db",
+                value=-9.0,
+            ),
+            AutomationEvent(
+                time_seconds=0.0,
+                module="mixer:return:fx",
+                parameter="level_db",
+                value=-3.0,
+            ),
+        ]
+    )
+
+    assert [event.value for event in graph.automation_events] == [-9.0, -3.0]
+    graph.process_block(config.block_size)
+    assert graph.returns["fx"].level_db == pytest.approx(-3.0)
+    graph.process_block(config.block_size)
+    assert graph.returns["fx"].level_db == pytest.approx(-9.0)
+
+
 def test_pattern_bridge_schedules_mixer_automation() -> None:
     config = EngineConfig(sample_rate=48_000, block_size=8, channels=2)
     tempo = TempoMap(tempo_bpm=120.0)
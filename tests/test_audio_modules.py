@@ -2,7 +2,7 @@ import numpy as np
 import pytest
 
 from audio.engine import EngineConfig, OfflineAudioEngine
-from audio.metrics import integrated_lufs, rms_dbfs
+from audio.metrics import bucketed_loudness, integrated_lufs, loudness_snapshot, rms_dbfs
 from audio.modules import (
     AmplitudeEnvelope,
     ClipSampler,
@@ -300,3 +300,46 @@ def test_render_metrics_report_musician_friendly_numbers():
     assert db.shape == (2,)
     assert db[0] == pytest.approx(-9.03, abs=0.15)
     assert lufs == pytest.approx(-9.7, abs=1.0)
+
+
+def test_loudness_snapshot_matches_individual_metrics():
+    config = EngineConfig(sample_rate=48_000, block_size=128, channels=2)
+    engine = OfflineAudioEngine(config)
+    oscillator = SineOscillator("osc", config)
+    engine.add_module(oscillator, as_output=True)
+    engine.schedule_parameter_change("osc", "amplitude", beats=0.0, value=0.3)
+    audio = engine.render(0.25)
+
+    db, lufs = loudness_snapshot(audio, sample_rate=config.sample_rate)
+
+    np.testing.assert_allclose(db, rms_dbfs(audio))
+    assert lufs == pytest.approx(integrated_lufs(audio, sample_rate=config.sample_rate))
+
+    empty_db, empty_lufs = loudness_snapshot(audio[:0], sample_rate=config.sample_rate)
+    assert empty_db.shape == (2,)
+    assert empty_lufs == float("-inf")
+
+
+def test_bucketed_loudness_matches_per_slice_snapshots():
+    config = EngineConfig(sample_rate=48_000, block_size=128, channels=2)
+    engine = OfflineAudioEngine(config)
+    oscillator = SineOscillator("osc", config)
+    engine.add_module(oscillator, as_output=True)
+    engine.schedule_parameter_change("osc", "amplitude", beats=0.5, value=0.6)
+    audio = engine.render(0.3)
+    audio[:1_000] = 0.0
+    frames_per_bucket = 1_000
+
+    db, lufs = bucketed_loudness(
+        audio, sample_rate=config.sample_rate, frames_per_bucket=frames_per_bucket
+    )
+
+    starts = range(0, audio.shape[0], frames_per_bucket)
+    assert db.shape == (len(starts), 2)
+    assert lufs[0] == float("-inf")
+    for index, start in enumerate(starts):
+        expected_db, expected_lufs = loudness_snapshot(
+            audio[start : start + frames_per_bucket], sample_rate=config.sample_rate
+        )
+        np.testing.assert_allclose(db[index], expected_db)
+        assert lufs[index] == pytest.approx(expected_lufs)
@@ -1,10 +1,12 @@
+import json
 from pathlib import Path
 from typing import Dict
 
 import pytest
 
+from domain import persistence
 from domain.models import Project
-from domain.persistence import ProjectFileAdapter, ProjectSerializer
+from domain.persistence import ProjectFileAdapter, ProjectSerializer, dump_json_bytes
 
 
 def test_project_serializer_round_trip(example_project: Project):
@@ -13,6 +15,14 @@ def test_project_serializer_round_trip(example_project: Project):
     assert restored == example_project
 
 
+def test_project_serializer_json_bytes_match_dict_form(example_project: Project):
+    data = ProjectSerializer.to_json_bytes(example_project)
+
+    assert json.loads(data) == ProjectSerializer.to_dict(example_project)
+    assert ProjectSerializer.from_json_bytes(data) == example_project
+    assert ProjectSerializer.to_json_bytes(example_project, indent=True).startswith(b"{\n  ")
+
+
 def test_project_file_adapter_round_trip(tmp_path: Path, example_project: Project):
     adapter = ProjectFileAdapter(tmp_path)
     destination = adapter.save(example_project, "project.json")
@@ -20,3 +30,22 @@ def test_project_file_adapter_round_trip(tmp_path: Path, example_project: Projec
 
     loaded = adapter.load("project.json")
     assert loaded == example_project
+
+
+@pytest.mark.parametrize("accelerated", [True, False])
+def test_json_helpers_round_trip_with_and_without_orjson(
+    monkeypatch: pytest.MonkeyPatch, accelerated: bool
+):
+    if not accelerated:
+        monkeypatch.setattr(persistence, "orjson", None)
+    elif persistence.orjson is None:
+        pytest.skip("orjson is not installed")
+    payload = {"name": "Groove", "bpm": 120.5, "steps": [1, None, "kick"]}
+
+    compact = dump_json_bytes(payload)
+    indented = dump_json_bytes(payload, indent=True)
+
+    assert b"\n" not in compact
+    assert indented.startswith(b'{\n  "name"')
+    assert json.loads(compact) == payload
+    assert json.loads(indented.decode("utf-8")) == payload
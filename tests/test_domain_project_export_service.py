@@ -91,3 +91,20 @@ def test_export_service_requires_manifest_for_assets(tmp_path: Path) -> None:
         assert "Sampler manifest" in str(exc)
     else:  # pragma: no cover - defensive guard to make assertion explicit
         raise AssertionError("Expected ValueError when exporting assets without manifest")
+
+
+def test_export_service_writes_many_patterns_in_sorted_order(tmp_path: Path) -> None:
+    project = build_project()
+    for index in range(5):
+        project.add_pattern(
+            Pattern(id=f"verse_{index}", name=f"Verse {index}", length_steps=16, steps=[])
+        )
+
+    result = ProjectExportService().export_project(project, bundle_root=tmp_path / "bundle")
+
+    expected_ids = sorted(project.patterns)
+    assert [path.stem for path in result.pattern_paths] == expected_ids
+    for path in result.pattern_paths:
+        assert path.read_text(encoding="utf-8") == project.patterns[path.stem].model_dump_json(
+            indent=2
+        )
@@ -99,3 +99,21 @@ def test_import_service_validates_checksums(tmp_path: Path) -> None:
         assert "checksum" in str(exc)
     else:  # pragma: no cover - explicit failure signal
         raise AssertionError("Expected checksum validation failure")
+
+
+def test_import_service_restores_many_patterns_in_manifest_order(tmp_path: Path) -> None:
+    project = build_project()
+    for index in range(6):
+        project.add_pattern(Pattern(id=f"fill_{index}", name=f"Fill {index}", length_steps=16))
+    bundle_root = ProjectExportService().export_project(
+        project, bundle_root=tmp_path / "bundle"
+    ).bundle_root
+
+    result = ProjectImportService().import_bundle(
+        bundle_root, destination_root=tmp_path / "restored"
+    )
+
+    assert [item.record.pattern_id for item in result.patterns] == sorted(project.patterns)
+    for item in result.patterns:
+        assert item.path == tmp_path / "restored" / item.record.path
+        assert item.path.read_bytes() == (bundle_root / item.record.path).read_bytes()
@@ -2,15 +2,24 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+import os
 from pathlib import Path
+import shutil
 
 import pytest
 
+from domain import project_manifest
 from domain.models import Pattern, PatternStep, Project, ProjectMetadata
 from domain.project_manifest import (
+    ChecksumCache,
     ProjectManifestBuilder,
+    SamplerManifestAsset,
     SamplerManifestIndex,
     build_import_plan,
+    compute_file_sha256,
+    compute_file_sha256_many,
+    copy_and_hash,
+    copy_file_fast,
 )
 
 
@@ -99,6 +108,116 @@ def test_copy_asset_rejects_checksum_mismatches(tmp_path: Path) -> None:
             source_path=asset_path,
             destination_dir=tmp_path / "exports",
         )
+    assert list((tmp_path / "exports").iterdir()) == []
+
+
+def test_copy_asset_accepts_precomputed_or_trusted_checksums(tmp_path: Path) -> None:
+    asset_path = _write_file(tmp_path / "imports" / "asset.wav", b"asset-bytes")
+    manifest_index = SamplerManifestIndex.from_payload(
+        {
+            "bucket": "demo",
+            "prefix": "velocity/",
+            "last_updated": "2025-11-25T00:00:00+00:00",
+            "assets": [{"name": "asset.wav", "sha256": "cafecafe"}],
+        }
+    )
+
+    with pytest.raises(ValueError):
+        manifest_index.copy_asset(
+            asset_name="asset.wav",
+            source_path=asset_path,
+            destination_dir=tmp_path / "exports",
+            source_sha256="deadbeef",
+        )
+    record = manifest_index.copy_asset(
+        sha256="cafecafe",
+        source_path=asset_path,
+        destination_dir=tmp_path / "exports",
+        source_sha256="cafecafe",
+    )
+    assert record.sha256 == "cafecafe"
+    trusted = manifest_index.copy_asset(
+        asset_name="asset.wav",
+        source_path=asset_path,
+        destination_dir=tmp_path / "trusted",
+        verify=False,
+    )
+    assert trusted.sha256 == "cafecafe"
+    assert (tmp_path / "trusted" / "asset.wav").read_bytes() == b"asset-bytes"
+
+
+def test_copy_asset_rejects_size_mismatch_before_hashing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    asset_path = _write_file(tmp_path / "imports" / "asset.wav", b"short")
+    manifest_index = SamplerManifestIndex.from_payload(
+        {
+            "bucket": "demo",
+            "prefix": "velocity/",
+            "last_updated": "2025-11-25T00:00:00+00:00",
+            "assets": [{"name": "asset.wav", "sha256": "cafecafe", "size": 1024}],
+        }
+    )
+
+    def fail_hash(path: Path) -> str:
+        raise AssertionError("size mismatch should skip hashing")
+
+    monkeypatch.setattr(project_manifest, "compute_file_sha256", fail_hash)
+    with pytest.raises(ValueError, match="size mismatch"):
+        manifest_index.copy_asset(
+            asset_name="asset.wav",
+            source_path=asset_path,
+            destination_dir=tmp_path / "exports",
+        )
+
+
+def test_sampler_manifest_lookups_prefer_first_matching_asset() -> None:
+    manifest_index = SamplerManifestIndex.from_payload(
+        {
+            "bucket": "demo",
+            "prefix": "velocity/",
+            "last_updated": "2025-11-25T00:00:00+00:00",
+            "assets": [
+                {"name": "kick.wav", "sha256": "aa", "lufs": -10.0},
+                {"name": "kick.wav", "sha256": "bb", "lufs": -12.0},
+                {"name": "snare.wav", "sha256": "aa"},
+            ],
+        }
+    )
+
+    assert manifest_index._asset_by_name("kick.wav").lufs == -10.0
+    assert manifest_index._asset_by_sha("aa").name == "kick.wav"
+    assert manifest_index._asset_by_sha("bb").lufs == -12.0
+    with pytest.raises(KeyError):
+        manifest_index._asset_by_name("hat.wav")
+    with pytest.raises(KeyError):
+        manifest_index._asset_by_sha("cc")
+
+
+def test_sampler_manifest_lookups_follow_asset_updates() -> None:
+    manifest_index = SamplerManifestIndex.from_payload(
+        {
+            "bucket": "demo",
+            "prefix": "velocity/",
+            "last_updated": "2025-11-25T00:00:00+00:00",
+            "assets": [{"name": "kick.wav", "sha256": "aa"}],
+        }
+    )
+    assert manifest_index._asset_by_name("kick.wav").sha256 == "aa"
+
+    snare = SamplerManifestAsset(name="snare.flac", sha256="bb")
+    copied = manifest_index.model_copy(update={"assets": [snare]})
+    assert copied._asset_by_sha("bb") is snare
+    with pytest.raises(KeyError):
+        copied._asset_by_name("kick.wav")
+    assert manifest_index._asset_by_name("kick.wav").sha256 == "aa"
+
+    manifest_index.assets = [snare]
+    assert manifest_index._asset_by_name("snare.flac") is snare
+    assert manifest_index.dialog_filters()[0]["patterns"] == ["*.flac"]
+
+    manifest_index.assets.append(SamplerManifestAsset(name="hat.wav", sha256="cc"))
+    assert manifest_index._asset_by_sha("cc").name == "hat.wav"
 
 
 def test_import_plan_surface_dialog_filters(tmp_path: Path) -> None:
@@ -116,3 +235,103 @@ def test_import_plan_surface_dialog_filters(tmp_path: Path) -> None:
     assert plan.asset_count == 2
     assert plan.dialog_filters[0]["label"] == "Sampler Assets"
     assert set(plan.dialog_filters[0]["patterns"]) == {"*.wav", "*.flac"}
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["kick.wav", "loop.tar.gz", ".hidden", "trailing.", "noext", "kits/snare.flac", "kits.d/raw"],
+)
+def test_name_suffix_matches_pathlib(name: str) -> None:
+    assert project_manifest._name_suffix(name) == Path(name).suffix
+
+
+def test_compute_file_sha256_many_matches_single_file_hashes(tmp_path: Path) -> None:
+    paths = [
+        _write_file(tmp_path / f"take_{index}.wav", bytes([index]) * (70_000 + index))
+        for index in range(4)
+    ]
+
+    digests = compute_file_sha256_many([*paths, paths[0]], max_workers=2)
+
+    assert list(digests) == paths
+    assert digests == {path: compute_file_sha256(path) for path in paths}
+    assert compute_file_sha256_many([]) == {}
+
+
+@pytest.mark.parametrize("native", [True, False])
+def test_copy_file_fast_preserves_contents_and_mtime(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, native: bool
+) -> None:
+    if not native:
+        monkeypatch.delattr(project_manifest.os, "copy_file_range", raising=False)
+    source = _write_file(tmp_path / "kick.wav", bytes(range(256)) * 1024)
+    os.utime(source, (1_700_000_000, 1_700_000_000))
+    destination = tmp_path / "copy" / "kick.wav"
+    destination.parent.mkdir()
+
+    assert copy_file_fast(source, destination) == destination
+    assert destination.read_bytes() == source.read_bytes()
+    assert destination.stat().st_mtime == source.stat().st_mtime
+    with pytest.raises(shutil.SameFileError):
+        copy_file_fast(source, source)
+
+
+def test_copy_file_fast_falls_back_when_copy_file_range_stalls(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(project_manifest.os, "copy_file_range", lambda *args: 0, raising=False)
+    source = _write_file(tmp_path / "kick.wav", bytes(range(256)) * 1024)
+    destination = tmp_path / "kick_copy.wav"
+
+    copy_file_fast(source, destination)
+
+    assert destination.read_bytes() == source.read_bytes()
+
+
+def test_checksum_cache_reuses_digests_until_files_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sample = _write_file(tmp_path / "take.wav", b"first-take")
+    cache_path = tmp_path / "cache" / "sha_cache.json"
+    cache = ChecksumCache(cache_path)
+    expected = compute_file_sha256(sample)
+
+    assert compute_file_sha256_many([sample], cache=cache) == {sample: expected}
+    cache.save()
+
+    hashed: list[Path] = []
+    original_hash = project_manifest.compute_file_sha256
+
+    def counting_hash(path: Path) -> str:
+        hashed.append(path)
+        return original_hash(path)
+
+    monkeypatch.setattr(project_manifest, "compute_file_sha256", counting_hash)
+    reloaded = ChecksumCache(cache_path)
+    assert len(reloaded) == 1
+    assert reloaded.digest(sample) == expected
+    assert hashed == []
+
+    sample.write_bytes(b"second-take-longer")
+    assert reloaded.digest(sample) == original_hash(sample)
+    assert hashed == [sample]
+
+
+def test_checksum_cache_ignores_corrupt_cache_files(tmp_path: Path) -> None:
+    cache_path = _write_file(tmp_path / "sha_cache.json", b"not json")
+
+    cache = ChecksumCache(cache_path)
+
+    assert len(cache) == 0
+
+
+def test_copy_and_hash_matches_separate_copy_and_digest(tmp_path: Path) -> None:
+    source = _write_file(tmp_path / "pad.wav", bytes(range(256)) * 8192 + b"tail")
+    destination = tmp_path / "bundle" / "pad.wav"
+    destination.parent.mkdir()
+
+    checksum = copy_and_hash(source, destination)
+
+    assert checksum == compute_file_sha256(source)
+    assert destination.read_bytes() == source.read_bytes()
+    assert destination.stat().st_mtime_ns == source.stat().st_mtime_ns
@@ -1,10 +1,12 @@
+import hashlib
 import io
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, Mapping
 
 import pytest
 
+from domain import repository
 from domain.models import Project
 from domain.persistence import ProjectFileAdapter
 from domain.repository import (
@@ -64,6 +66,14 @@ class StubS3Client:
             raise KeyError(Key)
         del store[Key]
 
+    def delete_objects(self, *, Bucket: str, Delete: Dict[str, Any]) -> Dict[str, Any]:
+        store = self._bucket(Bucket)
+        errors = []
+        for entry in Delete["Objects"]:
+            if store.pop(entry["Key"], None) is None:
+                errors.append({"Key": entry["Key"], "Code": "NoSuchKey"})
+        return {"Errors": errors} if errors else {}
+
     def list_objects_v2(self, *, Bucket: str, Prefix: str = "") -> Dict[str, Any]:
         store = self._bucket(Bucket)
         contents = []
@@ -74,12 +84,97 @@ class StubS3Client:
         return {"Contents": contents}
 
 
+class PagedStubS3Client(StubS3Client):
+    """Stub that reports ETags, paginates listings, and counts HEAD calls."""
+
+    def __init__(self, page_size: int = 2) -> None:
+        super().__init__()
+        self.page_size = page_size
+        self.head_calls = 0
+        self.list_calls = 0
+
+    def put_object(self, *, Bucket: str, Key: str, Body: bytes, **kwargs: Any) -> Dict[str, Any]:
+        super().put_object(Bucket=Bucket, Key=Key, Body=Body, **kwargs)
+        etag = f'"{hashlib.md5(bytes(Body)).hexdigest()}"'
+        self._bucket(Bucket)[Key]["ETag"] = etag
+        return {"ETag": etag}
+
+    def head_object(self, *, Bucket: str, Key: str) -> Dict[str, Any]:
+        self.head_calls += 1
+        return super().head_object(Bucket=Bucket, Key=Key)
+
+    def list_objects_v2(
+        self, *, Bucket: str, Prefix: str = "", ContinuationToken: str | None = None
+    ) -> Dict[str, Any]:
+        self.list_calls += 1
+        keys = sorted(key for key in self._bucket(Bucket) if key.startswith(Prefix))
+        start = int(ContinuationToken or 0)
+        page = keys[start : start + self.page_size]
+        response: Dict[str, Any] = {
+            "Contents": [
+                {
+                    "Key": key,
+                    "ETag": self._bucket(Bucket)[key]["ETag"],
+                    "LastModified": self._bucket(Bucket)[key]["LastModified"],
+                }
+                for key in page
+            ],
+            "IsTruncated": start + self.page_size < len(keys),
+        }
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = str(start + self.page_size)
+        return response
+
+
+class PreconditionFailedError(Exception):
+    response = {"Error": {"Code": "PreconditionFailed"}}
+
+
+class ConditionalStubS3Client(PagedStubS3Client):
+    """Stub honouring IfMatch/IfNoneMatch on put_object and exposing ETags."""
+
+    def put_object(
+        self,
+        *,
+        Bucket: str,
+        Key: str,
+        Body: bytes,
+        IfMatch: str | None = None,
+        IfNoneMatch: str | None = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        current = self._bucket(Bucket).get(Key)
+        if IfNoneMatch == "*" and current is not None:
+            raise PreconditionFailedError(Key)
+        if IfMatch is not None and (current is None or current["ETag"] != IfMatch):
+            raise PreconditionFailedError(Key)
+        return super().put_object(Bucket=Bucket, Key=Key, Body=Body, **kwargs)
+
+    def head_object(self, *, Bucket: str, Key: str) -> Dict[str, Any]:
+        response = super().head_object(Bucket=Bucket, Key=Key)
+        response["ETag"] = self._bucket(Bucket)[Key]["ETag"]
+        return response
+
+    def get_object(self, *, Bucket: str, Key: str) -> Dict[str, Any]:
+        response = super().get_object(Bucket=Bucket, Key=Key)
+        response["ETag"] = self._bucket(Bucket)[Key]["ETag"]
+        return response
+
+
 def _assert_summary(summary: ProjectSummary, project: Project) -> None:
     assert summary.identifier == project.metadata.id
     assert summary.name == project.metadata.name
     assert summary.updated_at == project.metadata.updated_at
 
 
+def test_make_summary_copies_metadata_fields(example_project: Project) -> None:
+    summary = repository._make_summary(example_project.metadata, "in-memory")
+
+    _assert_summary(summary, example_project)
+    assert summary.location == "in-memory"
+    assert not hasattr(summary, "__dict__")
+
+
 def test_local_repository_round_trip(tmp_path: Path, example_project: Project) -> None:
     adapter = ProjectFileAdapter(tmp_path)
     repo = LocalProjectRepository(adapter)
@@ -96,6 +191,83 @@ def test_local_repository_round_trip(tmp_path: Path, example_project: Project) -
     _assert_summary(listed[0], example_project)
 
 
+def test_local_repository_list_reparses_only_changed_files(
+    tmp_path: Path, example_project: Project, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo = LocalProjectRepository(ProjectFileAdapter(tmp_path))
+    repo.save(example_project)
+    assert len(list(repo.list())) == 1
+
+    loads: list[bytes] = []
+    original_validate = repository._ProjectHeader.model_validate_json
+
+    def counting_validate(data: bytes) -> Any:
+        loads.append(data)
+        return original_validate(data)
+
+    monkeypatch.setattr(repository._ProjectHeader, "model_validate_json", counting_validate)
+    assert [summary.name for summary in repo.list()] == [example_project.metadata.name]
+    assert loads == []
+
+    renamed = example_project.model_copy(deep=True)
+    renamed.metadata.name = "Renamed Groove With A Longer Title"
+    ProjectFileAdapter(tmp_path).save(renamed, f"{renamed.metadata.id}.json")
+    assert [summary.name for summary in repo.list()] == [renamed.metadata.name]
+    assert len(loads) == 1
+
+    repo.delete(example_project.metadata.id)
+    assert list(repo.list()) == []
+
+
+def test_local_repository_index_warms_new_instances(
+    tmp_path: Path, example_project: Project, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    writer = LocalProjectRepository(ProjectFileAdapter(tmp_path))
+    writer.save(example_project)
+    assert (tmp_path / LocalProjectRepository.INDEX_FILENAME).exists()
+
+    def fail_validate(data: bytes) -> Any:
+        raise AssertionError("indexed files should not be parsed")
+
+    monkeypatch.setattr(repository._ProjectHeader, "model_validate_json", fail_validate)
+    reader = LocalProjectRepository(ProjectFileAdapter(tmp_path))
+    listed = list(reader.list())
+
+    assert len(listed) == 1
+    _assert_summary(listed[0], example_project)
+    reader.delete(example_project.metadata.id)
+    assert list(LocalProjectRepository(ProjectFileAdapter(tmp_path)).list()) == []
+
+
+def test_local_repository_list_skips_directories_and_missing_roots(
+    tmp_path: Path, example_project: Project
+) -> None:
+    assert list(LocalProjectRepository(ProjectFileAdapter(tmp_path / "absent")).list()) == []
+
+    repo = LocalProjectRepository(ProjectFileAdapter(tmp_path))
+    repo.save(example_project)
+    (tmp_path / "folder.json").mkdir()
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+
+    assert [summary.identifier for summary in repo.list()] == [example_project.metadata.id]
+
+
+def test_local_repository_list_reads_many_files_in_name_order(
+    tmp_path: Path, example_project: Project
+) -> None:
+    repo = LocalProjectRepository(ProjectFileAdapter(tmp_path), max_workers=4)
+    for index in (3, 0, 5, 1, 4, 2):
+        project = example_project.model_copy(deep=True)
+        project.metadata.id = f"project-{index}"
+        project.metadata.name = f"Project {index}"
+        repo.save(project)
+
+    listed = list(repo.list())
+
+    assert [summary.identifier for summary in listed] == [f"project-{i}" for i in range(6)]
+    assert [summary.name for summary in listed] == [f"Project {i}" for i in range(6)]
+
+
 def test_local_repository_missing_project(tmp_path: Path) -> None:
     repo = LocalProjectRepository(ProjectFileAdapter(tmp_path))
 
@@ -121,6 +293,20 @@ def test_in_memory_repository_behaves_like_remote(example_project: Project) -> N
         repo.load(example_project.metadata.id)
 
 
+def test_in_memory_repository_isolates_stored_projects(example_project: Project) -> None:
+    repo = InMemoryProjectRepository()
+    repo.save(example_project)
+    original_name = example_project.metadata.name
+
+    example_project.metadata.name = "Mutated After Save"
+    restored = repo.load(example_project.metadata.id)
+    restored.metadata.bpm = 999.0
+
+    assert restored.metadata.name == original_name
+    assert repo.load(example_project.metadata.id).metadata.bpm != 999.0
+    assert [summary.name for summary in repo.list()] == [original_name]
+
+
 def test_mock_cloud_repository_round_trip(tmp_path: Path, example_project: Project) -> None:
     adapter = ProjectFileAdapter(tmp_path)
     repo = MockCloudProjectRepository(adapter, bucket="test-bucket")
@@ -156,6 +342,93 @@ def test_mock_cloud_repository_detects_stale_writes(tmp_path: Path, example_proj
         repo.save(stale)
 
 
+def test_mock_cloud_repository_shares_one_serialization(
+    tmp_path: Path, example_project: Project, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo = MockCloudProjectRepository(ProjectFileAdapter(tmp_path), bucket="test-bucket")
+    calls: list[str] = []
+    original = repository.ProjectSerializer.to_json_bytes
+
+    def counting_to_json_bytes(project: Project, *, indent: bool = False) -> bytes:
+        calls.append(project.metadata.id)
+        return original(project, indent=indent)
+
+    monkeypatch.setattr(repository.ProjectSerializer, "to_json_bytes", counting_to_json_bytes)
+    repo.save(example_project)
+    repo.load(example_project.metadata.id)
+
+    assert calls == [example_project.metadata.id]
+    cache_file = tmp_path / f"{example_project.metadata.id}.json"
+    assert cache_file.read_bytes() == original(example_project, indent=True)
+    assert [summary.name for summary in repo.list()] == [example_project.metadata.name]
+
+
+def test_mock_cloud_repository_load_skips_fresh_cache_mirror(
+    tmp_path: Path, example_project: Project, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    adapter = ProjectFileAdapter(tmp_path)
+    repo = MockCloudProjectRepository(adapter)
+    repo.save(example_project)
+    writes: list[str] = []
+    original_save_bytes = adapter.save_bytes
+
+    def counting_save_bytes(payload: bytes, filename: str) -> Path:
+        writes.append(filename)
+        return original_save_bytes(payload, filename)
+
+    monkeypatch.setattr(adapter, "save_bytes", counting_save_bytes)
+    identifier = example_project.metadata.id
+    repo.load(identifier)
+    repo.load(identifier)
+    assert writes == []
+
+    (tmp_path / f"{identifier}.json").unlink()
+    assert repo.load(identifier) == example_project
+    assert writes == [f"{identifier}.json"]
+
+
+def test_mock_cloud_repository_evicts_least_recently_used(
+    tmp_path: Path, example_project: Project
+) -> None:
+    repo = MockCloudProjectRepository(ProjectFileAdapter(tmp_path), max_entries=2)
+    for index in range(2):
+        project = example_project.model_copy(deep=True)
+        project.metadata.id = f"take-{index}"
+        repo.save(project)
+    repo.load("take-0")
+    newest = example_project.model_copy(deep=True)
+    newest.metadata.id = "take-2"
+    repo.save(newest)
+
+    assert [summary.identifier for summary in repo.list()] == ["take-0", "take-2"]
+    assert not (tmp_path / "take-1.json").exists()
+    with pytest.raises(ProjectNotFoundError):
+        repo.load("take-1")
+    with pytest.raises(ValueError):
+        MockCloudProjectRepository(ProjectFileAdapter(tmp_path), max_entries=0)
+
+
+def test_mock_cloud_repository_expires_entries_after_ttl(
+    tmp_path: Path, example_project: Project, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(repository.time, "monotonic", lambda: clock[0])
+    repo = MockCloudProjectRepository(ProjectFileAdapter(tmp_path), ttl_seconds=10.0)
+    repo.save(example_project)
+    identifier = example_project.metadata.id
+
+    clock[0] += 9.0
+    assert repo.load(identifier) == example_project
+    clock[0] += 9.0
+    assert [summary.identifier for summary in repo.list()] == [identifier]
+    clock[0] += 1.0
+
+    assert list(repo.list()) == []
+    assert not (tmp_path / f"{identifier}.json").exists()
+    with pytest.raises(ProjectNotFoundError):
+        repo.load(identifier)
+
+
 def test_s3_repository_round_trip(tmp_path: Path, example_project: Project) -> None:
     adapter = ProjectFileAdapter(tmp_path / "cache")
     client = StubS3Client()
@@ -178,6 +451,67 @@ def test_s3_repository_round_trip(tmp_path: Path, example_project: Project) -> N
         repo.load(example_project.metadata.id)
 
 
+def test_s3_repository_list_pages_without_heads_for_known_objects(
+    tmp_path: Path, example_project: Project
+) -> None:
+    client = PagedStubS3Client(page_size=2)
+    repo = S3ProjectRepository(ProjectFileAdapter(tmp_path), client, bucket="bucket")
+    for index in range(5):
+        project = example_project.model_copy(deep=True)
+        project.metadata.id = f"project-{index}"
+        repo.save(project)
+    client.head_calls = 0
+
+    listed = list(repo.list())
+
+    assert [summary.identifier for summary in listed] == [f"project-{i}" for i in range(5)]
+    assert client.list_calls == 3
+    assert client.head_calls == 0
+
+    cold_repo = S3ProjectRepository(ProjectFileAdapter(tmp_path), client, bucket="bucket")
+    assert [summary.name for summary in cold_repo.list()] == [example_project.metadata.name] * 5
+    assert client.head_calls == 5
+    list(cold_repo.list())
+    assert client.head_calls == 5
+
+
+def test_s3_repository_list_prefetches_next_page(tmp_path: Path, example_project: Project) -> None:
+    client = PagedStubS3Client(page_size=2)
+    repo = S3ProjectRepository(ProjectFileAdapter(tmp_path), client, bucket="bucket", max_workers=1)
+    for index in range(4):
+        project = example_project.model_copy(deep=True)
+        project.metadata.id = f"project-{index}"
+        repo.save(project)
+
+    summaries = iter(repo.list())
+    assert next(summaries).identifier == "project-0"
+    # The single worker runs queued tasks in order, so the prefetch is done.
+    repo._pool().submit(lambda: None).result()
+    assert client.list_calls == 2
+    assert [summary.identifier for summary in summaries] == ["project-1", "project-2", "project-3"]
+    repo.close()
+
+
+def test_s3_repository_load_many_preserves_order(tmp_path: Path, example_project: Project) -> None:
+    client = PagedStubS3Client()
+    repo = S3ProjectRepository(ProjectFileAdapter(tmp_path), client, bucket="bucket", max_workers=4)
+    identifiers = []
+    for index in range(6):
+        project = example_project.model_copy(deep=True)
+        project.metadata.id = f"project-{index}"
+        project.metadata.name = f"Project {index}"
+        repo.save(project)
+        identifiers.append(project.metadata.id)
+
+    loaded = repo.load_many(reversed(identifiers))
+    repo.close()
+
+    assert [project.metadata.id for project in loaded] == identifiers[::-1]
+    assert [project.metadata.name for project in loaded] == [f"Project {i}" for i in range(5, -1, -1)]
+    with pytest.raises(ProjectNotFoundError):
+        repo.load_many(["project-0", "missing"])
+
+
 def test_s3_repository_detects_stale_writes(tmp_path: Path, example_project: Project) -> None:
     adapter = ProjectFileAdapter(tmp_path)
     client = StubS3Client()
@@ -196,6 +530,237 @@ def test_s3_repository_detects_stale_writes(tmp_path: Path, example_project: Pro
     repo.save(updated)
 
 
+def test_s3_repository_caches_revisions_between_saves(
+    tmp_path: Path, example_project: Project, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(repository.time, "monotonic", lambda: clock[0])
+    client = PagedStubS3Client()
+    repo = S3ProjectRepository(
+        ProjectFileAdapter(tmp_path), client, bucket="bucket", revision_cache_ttl=5.0
+    )
+
+    project = example_project.model_copy(deep=True)
+    for _ in range(3):
+        project.metadata.updated_at += timedelta(seconds=1)
+        repo.save(project)
+    assert client.head_calls == 1
+
+    stale = project.model_copy(deep=True)
+    with pytest.raises(ProjectRepositoryError):
+        repo.save(stale)
+    assert client.head_calls == 1
+
+    clock[0] += 10.0
+    project.metadata.updated_at += timedelta(seconds=1)
+    repo.save(project)
+    assert client.head_calls == 2
+
+    repo.delete(project.metadata.id)
+    repo.save(project)
+    assert client.head_calls == 3
+
+
+def test_s3_repository_conditional_writes_skip_heads(
+    tmp_path: Path, example_project: Project
+) -> None:
+    client = ConditionalStubS3Client()
+    repo = S3ProjectRepository(
+        ProjectFileAdapter(tmp_path / "a"), client, bucket="bucket", conditional_writes=True
+    )
+    project = example_project.model_copy(deep=True)
+    for _ in range(3):
+        project.metadata.updated_at += timedelta(seconds=1)
+        repo.save(project)
+    assert client.head_calls == 0
+
+    with pytest.raises(ProjectRepositoryError):
+        repo.save(project.model_copy(deep=True))
+
+    other = S3ProjectRepository(
+        ProjectFileAdapter(tmp_path / "b"), client, bucket="bucket", conditional_writes=True
+    )
+    newer = project.model_copy(deep=True)
+    newer.metadata.updated_at += timedelta(seconds=1)
+    other.save(newer)
+    assert client.head_calls == 1
+
+    # Newer than this repository's last write, older than the other client's.
+    project.metadata.updated_at = newer.metadata.updated_at - timedelta(milliseconds=500)
+    with pytest.raises(ProjectRepositoryError):
+        repo.save(project)
+    assert client.head_calls == 2
+    assert repo.load(project.metadata.id) == newer
+    newest = newer.model_copy(deep=True)
+    newest.metadata.updated_at += timedelta(seconds=1)
+    repo.save(newest)
+    assert client.head_calls == 2
+
+
+def test_s3_repository_load_skips_fresh_cache_mirror(
+    tmp_path: Path, example_project: Project, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = ConditionalStubS3Client()
+    adapter = ProjectFileAdapter(tmp_path / "cache")
+    S3ProjectRepository(ProjectFileAdapter(tmp_path / "writer"), client, bucket="bucket").save(
+        example_project
+    )
+    repo = S3ProjectRepository(adapter, client, bucket="bucket")
+    writes: list[str] = []
+    original_save = adapter.save
+
+    def counting_save(project: Project, filename: str) -> Path:
+        writes.append(filename)
+        return original_save(project, filename)
+
+    monkeypatch.setattr(adapter, "save", counting_save)
+    identifier = example_project.metadata.id
+    for _ in range(3):
+        assert repo.load(identifier) == example_project
+    assert writes == [f"{identifier}.json"]
+    sidecar = tmp_path / "cache" / f"{identifier}.json.etag"
+    assert sidecar.read_text(encoding="utf-8") == client.get_object(
+        Bucket="bucket", Key=f"projects/{identifier}.json"
+    )["ETag"]
+
+    (tmp_path / "cache" / f"{identifier}.json").unlink()
+    repo.load(identifier)
+    assert len(writes) == 2
+    repo.delete(identifier)
+    assert not sidecar.exists()
+
+
+def test_s3_repository_delete_many_batches_requests(
+    tmp_path: Path, example_project: Project, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = PagedStubS3Client()
+    repo = S3ProjectRepository(ProjectFileAdapter(tmp_path), client, bucket="bucket")
+    monkeypatch.setattr(S3ProjectRepository, "DELETE_BATCH_SIZE", 2)
+    identifiers = []
+    for index in range(5):
+        project = example_project.model_copy(deep=True)
+        project.metadata.id = f"take-{index}"
+        repo.save(project)
+        identifiers.append(project.metadata.id)
+    batches: list[int] = []
+    original = client.delete_objects
+
+    def counting_delete_objects(*, Bucket: str, Delete: Dict[str, Any]) -> Dict[str, Any]:
+        batches.append(len(Delete["Objects"]))
+        return original(Bucket=Bucket, Delete=Delete)
+
+    monkeypatch.setattr(client, "delete_objects", counting_delete_objects)
+    with pytest.raises(ProjectNotFoundError, match="ghost"):
+        repo.delete_many([*identifiers[:4], "ghost", identifiers[0]])
+
+    assert batches == [2, 2, 1]
+    assert [summary.identifier for summary in repo.list()] == ["take-4"]
+    assert not (tmp_path / "take-0.json").exists()
+    assert (tmp_path / "take-4.json").exists()
+    repo.delete_many([])
+    assert batches == [2, 2, 1]
+
+
+@pytest.mark.parametrize(
+    ("prefix", "extension", "key", "expected"),
+    [
+        ("projects/", ".json", "projects/demo.json", "demo"),
+        ("projects/", ".json", "other/demo.json", None),
+        ("projects/", ".json", "projects/demo.txt", None),
+        ("projects/", ".json", "projects/.json", ""),
+        ("p", "/.json", "p/.json", None),
+        ("", ".json", "nested/demo.json", "nested/demo"),
+        ("projects/", "", "projects/demo", "demo"),
+    ],
+)
+def test_s3_repository_identifier_from_key(
+    tmp_path: Path, prefix: str, extension: str, key: str, expected: str | None
+) -> None:
+    repo = S3ProjectRepository(
+        ProjectFileAdapter(tmp_path), StubS3Client(), bucket="bucket", prefix=prefix, extension=extension
+    )
+
+    assert repo._identifier_from_key(key) == expected
+
+
+def test_parse_revision_memoises_metadata_strings() -> None:
+    repository._parse_revision_text.cache_clear()
+    stamp = "2025-11-25T12:30:00+00:00"
+
+    first = repository._parse_revision(stamp)
+    second = repository._parse_revision(stamp)
+
+    assert first == datetime.fromisoformat(stamp)
+    assert second is first
+    assert repository._parse_revision_text.cache_info().hits == 1
+    assert repository._parse_revision(None) is None
+
+
+def test_s3_repository_list_samples_fallback_clock_once(
+    tmp_path: Path, example_project: Project
+) -> None:
+    class UndatedStubS3Client(StubS3Client):
+        def head_object(self, *, Bucket: str, Key: str) -> Dict[str, Any]:
+            super().head_object(Bucket=Bucket, Key=Key)
+            return {"Metadata": {}}
+
+        def list_objects_v2(self, *, Bucket: str, Prefix: str = "") -> Dict[str, Any]:
+            response = super().list_objects_v2(Bucket=Bucket, Prefix=Prefix)
+            return {"Contents": [{"Key": entry["Key"]} for entry in response["Contents"]]}
+
+    repo = S3ProjectRepository(ProjectFileAdapter(tmp_path), UndatedStubS3Client(), bucket="bucket")
+    for index in range(3):
+        project = example_project.model_copy(deep=True)
+        project.metadata.id = f"take-{index}"
+        repo.save(project)
+
+    before = datetime.now(UTC)
+    summaries = list(repo.list())
+
+    assert len(summaries) == 3
+    assert len({summary.updated_at for summary in summaries}) == 1
+    assert summaries[0].updated_at.tzinfo is not None
+    assert summaries[0].updated_at >= before
+
+
+def test_s3_repository_load_reads_large_bodies_in_chunks(
+    tmp_path: Path, example_project: Project, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class TrackingBody(io.BytesIO):
+        def __init__(self, payload: bytes) -> None:
+            super().__init__(payload)
+            self.reads: list[int] = []
+
+        def read(self, size: int | None = -1) -> bytes:
+            self.reads.append(-1 if size is None else size)
+            return super().read(size)
+
+    bodies: list[TrackingBody] = []
+    truncate = [0]
+
+    class SizedStubS3Client(StubS3Client):
+        def get_object(self, *, Bucket: str, Key: str) -> Dict[str, Any]:
+            payload = self._bucket(Bucket)[Key]["Body"]
+            body = TrackingBody(payload[: len(payload) - truncate[0]])
+            bodies.append(body)
+            return {"Body": body, "ContentLength": len(payload), "Metadata": {}}
+
+    monkeypatch.setattr(S3ProjectRepository, "STREAM_THRESHOLD", 64)
+    monkeypatch.setattr(S3ProjectRepository, "BODY_CHUNK_SIZE", 100)
+    repo = S3ProjectRepository(ProjectFileAdapter(tmp_path), SizedStubS3Client(), bucket="bucket")
+    repo.save(example_project)
+
+    assert repo.load(example_project.metadata.id) == example_project
+    assert len(bodies[0].reads) > 1
+    assert max(bodies[0].reads) <= 100
+    assert bodies[0].closed
+
+    truncate[0] = 10
+    with pytest.raises(ProjectRepositoryError, match="ContentLength"):
+        repo.load(example_project.metadata.id)
+    assert bodies[1].closed
+
+
 def test_s3_repository_missing_entries(tmp_path: Path) -> None:
     adapter = ProjectFileAdapter(tmp_path)
     client = StubS3Client()
@@ -233,6 +798,39 @@ def test_s3_repository_from_environment_uses_factory(tmp_path: Path, example_pro
     assert summary.location.endswith(f"/remote/projects/{example_project.metadata.id}.json")
 
 
+def test_s3_repository_from_environment_reuses_boto3_clients(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sessions: list[Dict[str, Any]] = []
+
+    class FakeSession:
+        def __init__(self, **kwargs: Any) -> None:
+            sessions.append(kwargs)
+
+        def client(self, service: str, **kwargs: Any) -> StubS3Client:
+            assert service == "s3"
+            assert kwargs == {"endpoint_url": "http://minio:9000"}
+            return StubS3Client()
+
+    fake_boto3 = type("FakeBoto3", (), {"session": type("session", (), {"Session": FakeSession})})
+    monkeypatch.setattr(repository, "_boto3", fake_boto3)
+    repository._s3_client.cache_clear()
+    env = {
+        "NAGAKANG_S3_BUCKET": "bucket",
+        "NAGAKANG_S3_ENDPOINT_URL": "http://minio:9000",
+        "AWS_REGION": "eu-west-1",
+    }
+    try:
+        first = S3ProjectRepository.from_environment(ProjectFileAdapter(tmp_path), env=env)
+        second = S3ProjectRepository.from_environment(ProjectFileAdapter(tmp_path), env=env)
+    finally:
+        repository._s3_client.cache_clear()
+
+    assert first._s3 is second._s3
+    assert len(sessions) == 1
+    assert sessions[0]["region_name"] == "eu-west-1"
+
+
 def test_s3_repository_from_environment_requires_bucket(tmp_path: Path) -> None:
     adapter = ProjectFileAdapter(tmp_path)
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 
 import json
+import threading
 
 from audio.engine import EngineConfig, TempoMap
 from audio.mixer import MeterReading, MixerChannel, MixerGraph
@@ -165,6 +166,61 @@ def test_tracker_mixer_root_binds_orchestrator() -> None:
     assert root.transport_controls.is_playing is True
 
 
+def test_tracker_mixer_root_polls_adaptively_and_wakes_on_enqueue(monkeypatch) -> None:
+    import gui.app as app_module
+
+    fired: list[float] = []
+
+    class FakeTrigger:
+        def __init__(self, timeout: float) -> None:
+            self.timeout = timeout
+            self.pending = False
+
+        def __call__(self, *_args) -> None:
+            if not self.pending:
+                self.pending = True
+                fired.append(self.timeout)
+
+        def cancel(self) -> None:
+            self.pending = False
+
+    triggers: list[FakeTrigger] = []
+
+    class FakeClock:
+        @staticmethod
+        def create_trigger(callback, timeout=0):
+            trigger = FakeTrigger(timeout)
+            triggers.append(trigger)
+            return trigger
+
+    monkeypatch.setattr(app_module, "Clock", FakeClock)
+    pattern = Pattern(id="pattern_C", name="Pattern C", length_steps=4, steps=[PatternStep() for _ in range(4)])
+    editor = PatternEditor(pattern)
+    service = MutationPreviewService(editor)
+    mixer = MixerGraph(EngineConfig(sample_rate=8_000, block_size=64, channels=2))
+    orchestrator = PreviewOrchestrator(PlaybackWorker(service), mixer_adapter=MixerBoardAdapter(mixer))
+    root = TrackerMixerRoot()
+
+    root.bind_orchestrator(orchestrator, interval=0.5, idle_interval=3.0)
+    assert sorted(trigger.timeout for trigger in triggers) == [0, 0.5, 3.0]
+    assert root._clock_event.timeout == 0.5
+    assert fired == [0.5]
+
+    root._poll_orchestrator()
+    assert fired == [0.5, 3.0]
+    assert [trigger.timeout for trigger in triggers if trigger.pending] == [3.0]
+
+    for step in range(3):
+        editor.set_step(step, note=60 + step, velocity=100)
+        service.enqueue_mutation(editor.history[-1])
+    assert fired == [0.5, 3.0, 0]
+
+    root._poll_orchestrator()
+    assert len(root.layout_state.tracker.pending_requests) == 3
+    assert fired == [0.5, 3.0, 0, 0.5]
+    assert [trigger.timeout for trigger in triggers if trigger.pending] == [0.5]
+
+
 def test_tracker_mixer_root_import_plan_and_autosave(tmp_path) -> None:
     tracker_state = TrackerPanelState(pattern_id="demo")
     layout = TrackerMixerLayoutState(tracker=tracker_state, mixer=MixerPanelState())
@@ -204,6 +260,7 @@ def test_tracker_mixer_root_import_plan_and_autosave(tmp_path) -> None:
 
     root._apply_batch(batch)
     root._apply_batch(batch)
+    root.flush_autosave()
 
     assert root.layout_state.tracker.import_asset_count == 1
     assert root.layout_state.tracker.import_dialog_filters[0]["label"] == "Sampler Assets"
@@ -213,6 +270,112 @@ def test_tracker_mixer_root_import_plan_and_autosave(tmp_path) -> None:
     assert layout_files, "Expected at least one autosave layout file"
     payload = json.loads(layout_files[0].read_text(encoding="utf-8"))
     assert "manifest_sha256" in payload
+    assert payload["manifest_document"] == manifest_path.read_text(encoding="utf-8")
+    assert sorted(path.name for path in autosave_dir.iterdir()) == sorted(
+        path.name for path in layout_files
+    )
+
+
+def test_tracker_mixer_root_autosave_writes_off_ui_thread(tmp_path, monkeypatch) -> None:
+    tracker_state = TrackerPanelState(pattern_id="demo")
+    batch = PreviewBatchState(
+        layout=TrackerMixerLayoutState(tracker=tracker_state, mixer=MixerPanelState()),
+        previews=[],
+    )
+    release = threading.Event()
+    writer_threads: list[str] = []
+    original_flush = TrackerMixerRoot._flush_autosave_payload
+
+    def blocking_flush(*args):
+        writer_threads.append(threading.current_thread().name)
+        release.wait(timeout=5.0)
+        return original_flush(*args)
+
+    monkeypatch.setattr(TrackerMixerRoot, "_flush_autosave_payload", staticmethod(blocking_flush))
+    root = TrackerMixerRoot()
+    root.enable_autosave(project_id="demo", autosave_dir=tmp_path, time_source=lambda: 0.0)
+
+    root._apply_batch(batch)
+
+    assert tracker_state.autosave_recovery_prompt.startswith("Autosaved demo")
+    assert root._autosave_config.last_saved == 0.0
+    assert not root._autosave_config.checkpoints
+    release.set()
+    root.flush_autosave(timeout=5.0)
+    assert writer_threads and writer_threads[0].startswith("autosave")
+    (checkpoint,) = root._autosave_config.checkpoints
+    assert json.loads(checkpoint.read_text(encoding="utf-8"))["pattern_id"] == "demo"
+
+
+def test_tracker_mixer_root_autosave_rotates_single_file_checkpoints(
+    tmp_path, monkeypatch
+) -> None:
+    from datetime import UTC, datetime
+
+    import gui.app as app_module
+
+    stamps = iter(
+        datetime(2025, 11, 27, 15, 30, second, tzinfo=UTC) for second in (0, 0, 1, 2)
+    )
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return next(stamps)
+
+    monkeypatch.setattr(app_module, "datetime", FrozenDatetime)
+    ticks = iter(range(10))
+    root = TrackerMixerRoot()
+    root.enable_autosave(
+        project_id="demo",
+        autosave_dir=tmp_path,
+        interval_seconds=1.0,
+        max_checkpoints=2,
+        time_source=lambda: float(next(ticks)),
+    )
+    for index in range(4):
+        tracker_state = TrackerPanelState(pattern_id=f"demo_{index}")
+        layout = TrackerMixerLayoutState(tracker=tracker_state, mixer=MixerPanelState())
+        root._apply_batch(PreviewBatchState(layout=layout, previews=[]))
+    root.flush_autosave(timeout=5.0)
+
+    config = root._autosave_config
+    assert [path.name for path in config.checkpoints] == [
+        "20251127-153001-layout.json",
+        "20251127-153002-layout.json",
+    ]
+    assert config.pruned_checkpoints == 1
+    assert config.checkpoints.maxlen == 2
+    assert sorted(path.name for path in (tmp_path / "demo").iterdir()) == [
+        path.name for path in config.checkpoints
+    ]
+
+
+def test_tracker_mixer_root_autosave_skips_unchanged_state(tmp_path) -> None:
+    ticks = iter(range(10))
+    root = TrackerMixerRoot()
+    root.enable_autosave(
+        project_id="demo",
+        autosave_dir=tmp_path,
+        interval_seconds=1.0,
+        time_source=lambda: float(next(ticks)),
+    )
+    written: list[str] = []
+    original_write = root._write_autosave_checkpoint
+
+    def recording_write(config, target_dir, slug, data):
+        written.append(json.loads(data)["pattern_id"])
+        return original_write(config, target_dir, slug, data)
+
+    root._write_autosave_checkpoint = recording_write  # type: ignore[method-assign]
+    for pattern_id in ("verse", "verse", "verse", "chorus"):
+        tracker_state = TrackerPanelState(pattern_id=pattern_id)
+        layout = TrackerMixerLayoutState(tracker=tracker_state, mixer=MixerPanelState())
+        root._apply_batch(PreviewBatchState(layout=layout, previews=[]))
+    root.flush_autosave(timeout=5.0)
+
+    assert written == ["verse", "chorus"]
+    assert root._autosave_config.last_saved == 3.0
 
 
 def test_tracker_mixer_root_import_project_bundle_updates_state(tmp_path) -> None:
@@ -190,6 +190,19 @@ def test_beat_conversions_round_trip_and_cover_windows():
     # 0.5 + 1.25 = 1.75 beats -> 10.5 steps -> ceil -> 11 -> minus 1 = 10
     assert end_step == 10
 
+def test_iter_steps_pads_short_patterns_to_declared_length():
+    pattern = Pattern(id="short", name="Short", length_steps=6, steps=[PatternStep(note=60)])
+    editor = PatternEditor(pattern)
+    pattern.steps[3:] = []
+
+    steps = list(editor.iter_steps())
+
+    assert len(steps) == 6
+    assert steps[0].note == 60
+    assert all(step.note is None for step in steps[1:])
+    assert steps == pattern.steps
+
+
 def _make_pattern(length: int = 8) -> Pattern:
     return Pattern(
         id="pattern",
@@ -197,3 +210,16 @@ def _make_pattern(length: int = 8) -> Pattern:
         length_steps=length,
         steps=[PatternStep() for _ in range(length)],
     )
+
+
+def test_playback_queue_notifies_callbacks_on_enqueue():
+    editor = PatternEditor(Pattern(id="p", name="P", length_steps=4, steps=[PatternStep() for _ in range(4)]))
+    editor.set_step(1, note=62, velocity=90)
+    queue = PlaybackQueue()
+    seen = []
+    queue.add_callback(seen.append)
+
+    request = queue.enqueue(editor.history[-1], start_beat=0.0, duration_beats=0.25)
+
+    assert seen == [request]
+    assert len(queue) == 1
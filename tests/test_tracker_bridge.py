@@ -8,8 +8,9 @@ except ImportError:  # pragma: no cover - optional dependency
     np = None  # type: ignore
 
 from audio.engine import EngineConfig, OfflineAudioEngine, TempoMap
-from audio.tracker_bridge import PatternPerformanceBridge
+from audio.tracker_bridge import PatternPerformanceBridge, _smoothing_ramp
 from domain.models import AutomationPoint, InstrumentDefinition, InstrumentModule, Pattern, PatternStep
+from tracker import PatternEditor
 
 
 pytestmark = pytest.mark.skipif(np is None, reason="NumPy is required for tracker bridge tests")
@@ -693,3 +694,367 @@ def test_automation_smoothing_rows_capture_multi_lane_segment_totals():
         "osc.amplitude|normalized|smooth=4ms:5",
         "osc.amplitude|percent|smooth=4ms:9",
     }
+
+
+def test_active_steps_skip_rests_and_foreign_instruments():
+    config = EngineConfig(sample_rate=24_000, block_size=128, channels=2)
+    bridge = PatternPerformanceBridge(config, TempoMap(tempo_bpm=120.0))
+
+    instrument = InstrumentDefinition(
+        id="lead",
+        name="Lead",
+        modules=[InstrumentModule(id="osc", type="sine")],
+    )
+    pattern = Pattern(
+        id="sparse",
+        name="Sparse",
+        length_steps=32,
+        steps=[
+            PatternStep(note=60),
+            PatternStep(),
+            PatternStep(note=62, instrument_id="bass"),
+            PatternStep(note=64, instrument_id="lead"),
+        ],
+    )
+
+    active = bridge._active_steps(pattern, instrument)
+
+    assert [index for index, _ in active] == [0, 3]
+    assert [step.note for _, step in active] == [60, 64]
+
+
+def test_sampler_transpose_handles_notes_outside_midi_range():
+    sample_rate = 24_000
+    config = EngineConfig(sample_rate=sample_rate, block_size=128, channels=2)
+    library = {"vox": _make_sample(0.5, sample_rate)}
+    instrument = InstrumentDefinition(
+        id="vox",
+        name="Vocal Clip",
+        modules=[InstrumentModule(id="sampler", type="clip_sampler:vox")],
+    )
+    pattern = Pattern(
+        id="edges",
+        name="Edges",
+        length_steps=4,
+        steps=[PatternStep() for _ in range(4)],
+    )
+    editor = PatternEditor(pattern)
+    # ``set_step`` updates via ``model_copy`` so out-of-range notes are not rejected.
+    editor.set_step(0, note=-1, velocity=100, instrument_id="vox")
+    editor.set_step(1, note=130, velocity=100, instrument_id="vox")
+    editor.set_step(2, note=72, velocity=100, instrument_id="vox")
+
+    bridge = PatternPerformanceBridge(config, TempoMap(tempo_bpm=120.0), sample_library=library)
+    playback = bridge.render_pattern(pattern, instrument)
+
+    transposes = [
+        event["value"]
+        for event in playback.automation_log
+        if event["module"] == "sampler" and event["parameter"] == "transpose_semitones"
+    ]
+    assert transposes == [-61.0, 70.0, 12.0]
+
+
+def test_mixer_parameter_specs_are_independent_per_lookup():
+    config = EngineConfig(sample_rate=24_000, block_size=128, channels=2)
+    bridge = PatternPerformanceBridge(config, TempoMap(tempo_bpm=120.0))
+
+    spec = bridge._resolve_mixer_parameter_spec("mixer:channel:vox", "fader_db")
+    assert spec is not None
+    spec.maximum = 0.0
+
+    fresh = bridge._resolve_mixer_parameter_spec("mixer:channel:vox", "fader_db")
+    assert fresh is not spec
+    assert fresh.maximum == pytest.approx(12.0)
+
+
+def test_smoothing_ramp_spans_window_and_lands_on_target():
+    beats, values = _smoothing_ramp(1.5, 0.5, 0.2, 0.6, 5)
+
+    assert beats == pytest.approx([1.5, 1.625, 1.75, 1.875, 2.0])
+    assert values == pytest.approx([0.2, 0.3, 0.4, 0.5, 0.6])
+    assert values[-1] == 0.6
+
+
+def test_parse_lane_metadata_returns_independent_copies():
+    config = EngineConfig(sample_rate=24_000, block_size=128, channels=2)
+    bridge = PatternPerformanceBridge(config, TempoMap(tempo_bpm=120.0))
+    lane = "osc.amplitude|percent|range=0.1:0.9|smooth=5ms:6"
+
+    module, parameter, metadata = bridge._parse_lane_metadata(lane)
+    metadata["mode"] = "raw"
+    _, _, fresh = bridge._parse_lane_metadata(lane)
+
+    assert (module, parameter) == ("osc", "amplitude")
+    assert fresh["mode"] == "percent"
+    assert fresh["range"] == (0.1, 0.9)
+    assert fresh["smooth_seconds"] == pytest.approx(0.005)
+    assert fresh["smooth_segments"] == 6
+    assert bridge._parse_lane_metadata("no_parameter") == (None, None, {})
+
+
+def test_seconds_per_beat_cache_follows_tempo_changes():
+    config = EngineConfig(sample_rate=24_000, block_size=128, channels=2)
+    tempo = TempoMap(tempo_bpm=120.0)
+    bridge = PatternPerformanceBridge(config, tempo)
+
+    assert bridge._seconds_per_beat() == pytest.approx(0.5)
+    assert bridge._frames_per_beat() == 12_000
+    tempo.tempo_bpm = 90.0
+    assert bridge._seconds_per_beat() == pytest.approx(tempo.beats_to_seconds(1.0))
+    assert bridge._frames_per_beat() == 16_000
+    assert bridge._beat_frames(2.0) == [0, 16_000]
+
+
+def test_metadata_smoothing_segments_keeps_explicit_zero():
+    config = EngineConfig(sample_rate=24_000, block_size=128, channels=2)
+    bridge = PatternPerformanceBridge(config, TempoMap(tempo_bpm=120.0))
+
+    assert bridge._metadata_smoothing_segments({"smooth_segments": 0, "segments": 12}) == 3
+    assert bridge._metadata_smoothing_segments({"segments": 7.6}) == 8
+    assert bridge._metadata_smoothing_segments({"segments": "bad"}) is None
+    assert bridge._metadata_smoothing_segments({}) is None
+
+
+def test_event_ids_can_be_skipped_for_log_consumers_that_ignore_them():
+    config = EngineConfig(sample_rate=24_000, block_size=120, channels=2)
+    instrument = InstrumentDefinition(
+        id="tone",
+        name="Tone",
+        modules=[InstrumentModule(id="osc", type="sine")],
+    )
+    pattern = Pattern(
+        id="no_ids",
+        name="No Ids",
+        length_steps=4,
+        steps=[PatternStep(note=60, velocity=100, instrument_id="tone")],
+        automation={
+            "osc.amplitude|normalized|smooth=6ms:4": [
+                AutomationPoint(position_beats=1.0, value=0.5)
+            ],
+        },
+    )
+
+    bridge = PatternPerformanceBridge(config, TempoMap(tempo_bpm=110.0), log_event_ids=False)
+    playback = bridge.render_pattern(pattern, instrument)
+
+    assert playback.automation_log
+    assert all("event_id" not in event for event in playback.automation_log)
+    assert [event["event_index"] for event in playback.automation_log] == list(
+        range(len(playback.automation_log))
+    )
+    rows = bridge.automation_smoothing_rows(playback)
+    assert rows[0]["identifier"] == "osc.amplitude"
+    assert "event_id" not in rows[0]
+
+
+def test_playback_caches_bucketed_loudness_until_buffer_changes():
+    config = EngineConfig(sample_rate=24_000, block_size=120, channels=2)
+    instrument = InstrumentDefinition(
+        id="tone",
+        name="Tone",
+        modules=[InstrumentModule(id="osc", type="sine")],
+    )
+    pattern = Pattern(
+        id="loudness_cache",
+        name="Loudness Cache",
+        length_steps=8,
+        steps=[PatternStep(note=60, velocity=100, instrument_id="tone")],
+    )
+    bridge = PatternPerformanceBridge(config, TempoMap(tempo_bpm=120.0))
+    playback = bridge.render_pattern(pattern, instrument)
+
+    first = playback.bucketed_loudness(sample_rate=config.sample_rate, frames_per_bucket=6_000)
+    again = playback.bucketed_loudness(sample_rate=config.sample_rate, frames_per_bucket=6_000)
+    assert again[0] is first[0] and again[1] is first[1]
+    assert bridge.loudness_trends(playback, beats_per_bucket=0.5) == bridge.loudness_trends(
+        playback, beats_per_bucket=0.5
+    )
+
+    playback.buffer = np.zeros_like(playback.buffer)
+    silent_rms, silent_lufs = playback.bucketed_loudness(
+        sample_rate=config.sample_rate, frames_per_bucket=6_000
+    )
+    assert silent_rms is not first[0]
+    assert np.all(np.isneginf(silent_lufs))
+
+
+def test_render_cache_reuses_identical_renders_until_invalidated():
+    config = EngineConfig(sample_rate=24_000, block_size=120, channels=2)
+    instrument = InstrumentDefinition(
+        id="tone",
+        name="Tone",
+        modules=[InstrumentModule(id="osc", type="sine")],
+    )
+    pattern = Pattern(
+        id="cached",
+        name="Cached",
+        length_steps=4,
+        steps=[PatternStep(note=60, velocity=100, instrument_id="tone")],
+    )
+    bridge = PatternPerformanceBridge(config, TempoMap(tempo_bpm=120.0), render_cache_size=2)
+
+    first = bridge.render_pattern(pattern, instrument)
+    second = bridge.render_pattern(pattern, instrument)
+    assert second.buffer is first.buffer
+    assert not second.buffer.flags.writeable
+    assert second.automation_log == first.automation_log
+    assert second.automation_log is not first.automation_log
+
+    louder = pattern.model_copy(
+        update={"steps": [PatternStep(note=60, velocity=127, instrument_id="tone")]}
+    )
+    assert bridge.render_pattern(louder, instrument).buffer is not first.buffer
+
+    bridge.invalidate("cached")
+    assert bridge.render_pattern(pattern, instrument).buffer is not first.buffer
+
+    uncached = PatternPerformanceBridge(config, TempoMap(tempo_bpm=120.0))
+    assert uncached.render_pattern(pattern, instrument).buffer.flags.writeable
+
+
+def test_render_cache_tracks_sample_library_contents():
+    sample_rate = 24_000
+    config = EngineConfig(sample_rate=sample_rate, block_size=128, channels=2)
+    instrument = InstrumentDefinition(
+        id="vox",
+        name="Vocal Clip",
+        modules=[InstrumentModule(id="sampler", type="clip_sampler:vox")],
+    )
+    pattern = Pattern(
+        id="cached_clip",
+        name="Cached Clip",
+        length_steps=4,
+        steps=[PatternStep(note=60, velocity=100, instrument_id="vox")],
+    )
+    bridge = PatternPerformanceBridge(
+        config,
+        TempoMap(tempo_bpm=120.0),
+        sample_library={"vox": _make_sample(0.5, sample_rate)},
+        render_cache_size=4,
+    )
+
+    first = bridge.render_pattern(pattern, instrument)
+    assert bridge.render_pattern(pattern, instrument).buffer is first.buffer
+
+    bridge.sample_library["vox"] *= 0.5
+    edited = bridge.render_pattern(pattern, instrument)
+    assert edited.buffer is not first.buffer
+    assert np.max(np.abs(edited.buffer)) < np.max(np.abs(first.buffer))
+
+    bridge.sample_library["vox"] = np.zeros_like(bridge.sample_library["vox"])
+    assert not np.any(bridge.render_pattern(pattern, instrument).buffer)
+
+
+def test_playback_automation_table_mirrors_log_columns():
+    config = EngineConfig(sample_rate=24_000, block_size=120, channels=2)
+    instrument = InstrumentDefinition(
+        id="tone",
+        name="Tone",
+        modules=[
+            InstrumentModule(id="osc", type="sine"),
+            InstrumentModule(id="env", type="amplitude_envelope", inputs=["osc"]),
+        ],
+    )
+    pattern = Pattern(
+        id="table",
+        name="Table",
+        length_steps=4,
+        steps=[
+            PatternStep(note=60, velocity=127, instrument_id="tone"),
+            PatternStep(),
+            PatternStep(note=62, velocity=64, instrument_id="tone"),
+        ],
+    )
+    bridge = PatternPerformanceBridge(config, TempoMap(tempo_bpm=120.0))
+    playback = bridge.render_pattern(pattern, instrument)
+
+    table = playback.automation_table()
+    assert table is playback.automation_table()
+    assert len(table) == len(playback.automation_log)
+    gate_on = table[(table["parameter"] == "gate") & (table["value"] > 0.0)]
+    assert gate_on["beats"].tolist() == [0.0, 0.5]
+    assert gate_on["module"].tolist() == ["env", "env"]
+
+
+def test_sample_library_is_normalised_to_float32_once():
+    config = EngineConfig(sample_rate=24_000, block_size=120, channels=2)
+    ready = np.zeros((16, 2), dtype=np.float32)
+    library = {"ready": ready, "wide": np.ones((16, 2), dtype=np.float64), "listed": [[0.5, 0.5]] * 16}
+
+    bridge = PatternPerformanceBridge(config, TempoMap(tempo_bpm=120.0), sample_library=library)
+
+    assert bridge.sample_library["ready"] is ready
+    for name in ("wide", "listed"):
+        sample = bridge.sample_library[name]
+        assert sample.dtype == np.float32
+        assert sample.flags.c_contiguous
+    assert isinstance(library["listed"], list)
+
+
+@pytest.mark.parametrize("debug_sources", [False, True])
+def test_step_event_sources_are_labelled_per_step_only_when_debugging(monkeypatch, debug_sources):
+    captured: list[str] = []
+    original = OfflineAudioEngine.schedule_parameter_changes
+
+    def capture(self, modules, parameters, *, beats, values, sources):
+        captured.extend(sources)
+        return original(self, modules, parameters, beats=beats, values=values, sources=sources)
+
+    monkeypatch.setattr(OfflineAudioEngine, "schedule_parameter_changes", capture)
+    config = EngineConfig(sample_rate=24_000, block_size=120, channels=2)
+    instrument = InstrumentDefinition(
+        id="tone",
+        name="Tone",
+        modules=[
+            InstrumentModule(id="osc", type="sine"),
+            InstrumentModule(id="env", type="amplitude_envelope", inputs=["osc"]),
+        ],
+    )
+    pattern = Pattern(
+        id="sources",
+        name="Sources",
+        length_steps=4,
+        steps=[PatternStep(), PatternStep(note=60, instrument_id="tone")],
+    )
+    bridge = PatternPerformanceBridge(
+        config, TempoMap(tempo_bpm=120.0), debug_sources=debug_sources
+    )
+    bridge.render_pattern(pattern, instrument)
+
+    if debug_sources:
+        assert captured == ["pattern_step_1_on", "pattern_step_1_off"]
+    else:
+        assert captured == ["pattern_step_on", "pattern_step_off"]
+
+
+def test_render_patterns_in_workers_matches_sequential_renders():
+    config = EngineConfig(sample_rate=24_000, block_size=120, channels=2)
+    instrument = InstrumentDefinition(
+        id="tone",
+        name="Tone",
+        modules=[
+            InstrumentModule(id="osc", type="sine"),
+            InstrumentModule(id="env", type="amplitude_envelope", inputs=["osc"]),
+        ],
+    )
+    patterns = [
+        Pattern(
+            id=f"song_{index}",
+            name=f"Song {index}",
+            length_steps=4,
+            steps=[PatternStep(note=60 + index, velocity=80 + index * 10, instrument_id="tone")],
+        )
+        for index in range(3)
+    ]
+    bridge = PatternPerformanceBridge(config, TempoMap(tempo_bpm=120.0))
+
+    parallel = bridge.render_patterns(patterns, instrument, max_workers=2)
+    sequential = bridge.render_patterns(patterns, instrument, max_workers=1)
+
+    assert len(parallel) == len(sequential) == 3
+    for left, right in zip(parallel, sequential, strict=True):
+        np.testing.assert_allclose(left.buffer, right.buffer)
+        assert [event["value"] for event in left.automation_log] == [
+            event["value"] for event in right.automation_log
+        ]
@@ -97,6 +97,7 @@ def run_harness(args: argparse.Namespace) -> dict[str, object]:
         layout = TrackerMixerLayoutState(tracker=tracker_state, mixer=MixerPanelState())
         batch = PreviewBatchState(layout=layout, previews=[])
         root._apply_batch(batch)
+    root.flush_autosave()
     duration = time.perf_counter() - start
     config = root._autosave_config
     checkpoints = config.checkpoints if config is not None else []